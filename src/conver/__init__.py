@@ -3,6 +3,8 @@ Convenient public API for the conver package.
 """
 
 from .conver import conver
+from .conver import conver_batch
+from .conver import conver_iter
 from .conver import ConverError
 from .conver import InputFileNotFound
 from .conver import UnsupportedFormat
@@ -10,10 +12,23 @@ from .conver import WordStartError
 from .conver import SaveError
 from .conver import IPCError
 from .conver import PlatformNotSupported
+from .conver import ConversionTimeout
+from .conver import Timeout
+from .aconver import aconver
+from .aconver import aconver_batch
+from .aconver import aconver_as_completed
+from .executor import ConverExecutor
+from .cache import ConversionCache
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .streams import conver_bytes
+from .streams import conver_stream
 from .__version__ import __version__
 
 __all__ = [
     "conver",
+    "conver_batch",
+    "conver_iter",
     "ConverError",
     "InputFileNotFound",
     "UnsupportedFormat",
@@ -21,5 +36,16 @@ __all__ = [
     "SaveError",
     "IPCError",
     "PlatformNotSupported",
+    "ConversionTimeout",
+    "Timeout",
+    "aconver",
+    "aconver_batch",
+    "aconver_as_completed",
+    "ConverExecutor",
+    "ConversionCache",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "conver_bytes",
+    "conver_stream",
     "__version__",
 ]
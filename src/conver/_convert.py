@@ -16,9 +16,42 @@ MODULE OVERVIEW:
     is interpreted by the high-level `conver()` API, which converts these results
     into Python exceptions on failure.
 
+PERSISTENT WORKERS:
+    Both scripts run in worker mode (`convert.jxa --worker` on macOS, `convert.ps1 -worker`
+    on Windows): a single `osascript` or `powershell` process is started on first use and
+    kept alive across calls, receiving one JSON job per line on stdin and answering with
+    one JSON result per line on stdout. This removes interpreter startup, AppleEvent setup
+    and Word COM object creation from every conversion. The worker is restarted
+    transparently if it dies, and closed when the interpreter exits.
+
 USAGE:
     To use the `convert` function, specify the `input_path`, `output_path`, and optionally
     `keep_open` to indicate whether the application should remain open post-conversion.
+    To convert many documents in one request and one Word session, pass a list of
+    `(input_path, output_path)` pairs to `convert_batch`, which returns one
+    `ConvertResult` per pair.
+    `WorkerPool` manages N dedicated workers, each with its own warm Word session (on
+    Windows, its own Word instance), and hands out whichever one is free.
+    `aconvert` is the asyncio counterpart of `convert`: it runs the script in one-shot mode
+    through `asyncio.create_subprocess_exec` and kills the script process if the awaiting
+    task is cancelled.
+
+TIMEOUTS:
+    `convert` and `convert_batch` accept a `timeout`: seconds per job, or a `Timeout`
+    with separate limits for starting Word and for converting once Word is ready,
+    optionally scaled by input size. In worker mode the scripts report
+    {"event": "word", "pid": <pid>, "owned": true | false} once Word is ready, which
+    ends the start phase. When a limit is exceeded, the watchdog kills the script
+    process and the Word instance it started, and the job fails with error_code 41;
+    the next job starts a fresh worker.
+
+EMULATOR:
+    With the environment variable CONVER_BACKEND set to "emulator", every function here
+    runs `scripts/emulator.py` with the current Python interpreter instead of the platform
+    script, on any OS. The emulator speaks the same protocol (worker mode, batches, word
+    events, timings) and sleeps for configurable phase latencies, failing, hanging or
+    crashing on demand and writing stand-in outputs; its settings are read from
+    CONVER_EMULATOR (see the script's docstring). The variable is read on every call.
 
 RECOMMENDED PATHS:
     Use paths like "~/Downloads/" on macOS or "C:/Users/YourName/Downloads/" on Windows
@@ -45,9 +78,25 @@ STATUS SCHEMA (ConvertResult):
         "input": "<path to input file>",      // Path to the input file (may be null in error cases)
         "output": "<path to output file>",    // Path to the output file (may be null in error cases)
         "message": "OK" | "<error message>",  // "OK" on success or specific error message
-        "error_code": 0 | <error code>        // 0 for success; specific code for different errors
+        "error_code": 0 | <error code>,       // 0 for success; specific code for different errors
+        "timings": {"<phase>": <seconds>}     // Time spent per phase (may be empty)
     }
 
+TIMINGS:
+    The scripts time each phase of a job they reach: "script" (script load to first
+    job), "word" (launching or attaching to Word), "open", "save", "close" and "quit".
+    Python adds "spawn" (starting the script process, when the job started it),
+    "parse" (decoding the reply) and "total" (the whole round trip). For a batch
+    request, the Python-side timings are reported on its first job only, so that
+    summing timings over jobs does not count them twice.
+
+BATCH RECOVERY:
+    In worker mode, the scripts report each batch job's result as soon as it ends, as
+    {"event": "result", "index": <i>, "result": {...}}, before the final array. If the
+    worker dies in the middle of a batch, the results received so far are kept, only
+    the job that was running fails with error_code 98, and the remaining jobs are sent
+    again to a restarted worker.
+
 ERROR CODES:
     The `convert` function and associated scripts define a set of error codes for troubleshooting:
     0   - Success
@@ -57,15 +106,40 @@ ERROR CODES:
     11  - Input file not found
     21  - Microsoft Word or Excel did not start within the expected time
     31  - Error saving or converting file
+    41  - Conversion timed out (the script and its Word instance were killed)
     98  - Invalid JSON output from script
     99  - Unsupported platform
 """
 
+import asyncio
+import atexit
+import hashlib
+import itertools
+import locale
+import os
+import queue
+import signal
 import subprocess
-from json import loads, dumps, JSONDecodeError
 import sys
-from importlib.resources import files, as_file
-from typing import TypedDict, Optional, List
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from importlib.resources import as_file, files
+from json import JSONDecodeError, dumps, loads
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from . import hooks, metrics
 
 
 class ConvertResult(TypedDict):
@@ -74,10 +148,68 @@ class ConvertResult(TypedDict):
     output: Optional[str]
     message: str
     error_code: int
+    timings: Dict[str, float]
+
+
+class Timeout:
+    """
+    Time limits for a single conversion job, in seconds; None means no limit.
+
+    Parameters:
+        total (float, optional): Limit for the whole job.
+        start (float, optional): Limit for starting (or attaching to) Word.
+        convert (float, optional): Limit for opening and saving the document once Word
+            is ready.
+        per_mb (float): Seconds added to `total` and `convert` per MiB of input, so that
+            large documents get proportionally more time.
+    """
+
+    def __init__(
+        self,
+        total: Optional[float] = None,
+        start: Optional[float] = None,
+        convert: Optional[float] = None,
+        per_mb: float = 0.0,
+    ):
+        for name, value in (("total", total), ("start", start), ("convert", convert)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be greater than 0")
+        if per_mb < 0:
+            raise ValueError("per_mb must not be negative")
+
+        self.total = total
+        self.start = start
+        self.convert = convert
+        self.per_mb = per_mb
+
+    def __repr__(self) -> str:
+        return (
+            f"Timeout(total={self.total!r}, start={self.start!r}, "
+            f"convert={self.convert!r}, per_mb={self.per_mb!r})"
+        )
+
+    def limits(self, input_path: str) -> Dict[str, Optional[float]]:
+        """Return the `total`, `start` and `convert` limits for one input file."""
+        extra = 0.0
+        if self.per_mb:
+            try:
+                extra = self.per_mb * os.path.getsize(input_path) / (1024 * 1024)
+            except OSError:
+                pass
+        return {
+            "total": None if self.total is None else self.total + extra,
+            "start": self.start,
+            "convert": None if self.convert is None else self.convert + extra,
+        }
 
 
 def convert(
-    input_path: str, output_path: str, keep_open: bool = False
+    input_path: str,
+    output_path: str,
+    keep_open: bool = False,
+    worker: Optional["_ScriptWorker"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    job_id: Optional[int] = None,
 ) -> ConvertResult:
     """
     Convert a document from one format to another using platform-specific scripts.
@@ -92,6 +224,11 @@ def convert(
         input_path (str): The path to the source file.
         output_path (str): The path where the converted file will be saved.
         keep_open (bool): Whether to keep the application (Word/Excel) open after processing.
+        worker (_ScriptWorker, optional): A dedicated worker from `create_worker`; defaults
+            to the shared platform worker.
+        timeout (float | Timeout, optional): Seconds allowed for the job, or a `Timeout`
+            with per-phase limits. On expiry the job fails with error_code 41.
+        job_id (int, optional): Id of the job in the events passed to `conver.hooks`.
 
     Returns:
         ConvertResult: A dictionary with keys for `status`, `input`, `output`, `message`, and
@@ -101,93 +238,778 @@ def convert(
         Returns structured error responses as defined by the ConvertResult type. Unexpected errors
         that are not captured by the script will return error_code 98 for JSON parsing failures.
     """
-    if sys.platform == "darwin":
-        return _run_macos_script(input_path, output_path, keep_open)
-    elif sys.platform == "win32":
-        return _run_windows_script(input_path, output_path, keep_open)
+    worker = worker or _default_worker()
+    if worker is None:
+        result = _unsupported_platform(input_path, output_path)
     else:
-        # Unsupported platform
-        return {
-            "status": "error",
-            "input": input_path,
-            "output": output_path,
-            "message": "Unsupported platform.",
-            "error_code": 99,
-        }
+        result = _execute_job(
+            worker, input_path, output_path, keep_open, timeout, job_id
+        )
+    metrics.record_result(result)
+    if hooks.enabled:
+        hooks.emit_result(result, job_id, worker and worker.name)
+    return result
 
 
-def _run_macos_script(
-    input_path: str, output_path: str, keep_open: bool
-) -> ConvertResult:
-    """Run macOS JXA script for conversion."""
-    with as_file(files("conver.scripts").joinpath("convert.jxa")) as script_path:
-        command = [
-            "osascript",
-            "-l",
-            "JavaScript",
-            str(script_path),
-            dumps({"input": input_path, "output": output_path, "keepOpen": keep_open}),
+def convert_batch(
+    jobs: List[Tuple[str, str]],
+    keep_open: bool = False,
+    worker: Optional["_ScriptWorker"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    job_ids: Optional[List[int]] = None,
+) -> List[ConvertResult]:
+    """
+    Convert several documents in a single script request and Word session.
+
+    The jobs are sent to the platform worker as one JSON array; the script converts
+    them in order and replies with one result per job. A failed job does not stop
+    the remaining ones.
+
+    Parameters:
+        jobs (List[Tuple[str, str]]): `(input_path, output_path)` pairs to convert.
+        keep_open (bool): Whether to keep Word open after the whole batch is processed.
+        worker (_ScriptWorker, optional): A dedicated worker from `create_worker`; defaults
+            to the shared platform worker.
+        timeout (float | Timeout, optional): Limits applied to each job. Jobs are then
+            sent one request at a time on the same Word session, so that a hung job
+            fails alone and the next one gets a fresh worker.
+        job_ids (List[int], optional): Ids of the jobs in the events passed to
+            `conver.hooks`, in the same order as `jobs`.
+
+    Returns:
+        List[ConvertResult]: One result per job, in the same order as `jobs`. If the
+        worker dies during the batch, only the job it was converting gets
+        error_code 98; the jobs it did not reach are resent to a fresh worker.
+    """
+    if not jobs:
+        return []
+
+    ids = list(job_ids) if job_ids is not None else [None] * len(jobs)
+    worker = worker or _default_worker()
+    if worker is None:
+        results = [_unsupported_platform(inp, out) for inp, out in jobs]
+    elif timeout is not None:
+        last = len(jobs) - 1
+        results = [
+            _execute_job(
+                worker, inp, out, keep_open if i == last else True, timeout, ids[i]
+            )
+            for i, (inp, out) in enumerate(jobs)
         ]
-        return _execute_command(command, input_path, output_path)
+    else:
+        results = _request_batch(worker, jobs, keep_open, ids)
 
+    for result, job_id in zip(results, ids):
+        metrics.record_result(result)
+        if hooks.enabled:
+            hooks.emit_result(result, job_id, worker and worker.name)
+    return results
 
-def _run_windows_script(
-    input_path: str, output_path: str, keep_open: bool
-) -> ConvertResult:
-    """Run Windows PowerShell script for conversion."""
-    with as_file(files("conver.scripts").joinpath("convert.ps1")) as script_path:
-        command = [
-            "powershell",
-            "-ExecutionPolicy",
-            "Bypass",
-            "-File",
-            str(script_path),
-            "-jsonArgs",
-            dumps({"input": input_path, "output": output_path, "keepOpen": keep_open}),
+
+def _request_batch(
+    worker: "_ScriptWorker",
+    jobs: List[Tuple[str, str]],
+    keep_open: bool,
+    job_ids: Optional[List[Optional[int]]] = None,
+) -> List[ConvertResult]:
+    """
+    Send `jobs` to `worker` as one batch request; see `convert_batch`.
+
+    If the worker dies or its reply cannot be matched to the jobs, the results
+    it reported before that are kept, the job it was converting fails with
+    error_code 98, and the jobs it did not reach are sent again to a fresh worker.
+    """
+    ids = list(job_ids) if job_ids is not None else [None] * len(jobs)
+    results: List[Optional[ConvertResult]] = [None] * len(jobs)
+    pending = list(range(len(jobs)))
+
+    while pending:
+        payload = [
+            {"input": jobs[i][0], "output": jobs[i][1], "keepOpen": False}
+            for i in pending
         ]
-        return _execute_command(command, input_path, output_path)
+        payload[-1]["keepOpen"] = keep_open
+
+        timings: Dict[str, float] = {}
+        partial: Dict[int, Any] = {}
+        started = time.perf_counter()
+        data = worker.request(
+            payload,
+            timings=timings,
+            job_ids=[ids[i] for i in pending],
+            partial=partial,
+        )
+        timings["total"] = time.perf_counter() - started
+        if isinstance(data, list) and len(data) == len(pending):
+            partial = dict(enumerate(data))
+
+        for index, i in enumerate(pending):
+            if isinstance(partial.get(index), dict):
+                inp, out = jobs[i]
+                results[i] = _normalize_result(partial[index], inp, out, 98)
+        first = pending[0]
+        pending = [i for i in pending if results[i] is None]
+        if pending:
+            # Jobs run in order: the first one without a result is the one
+            # the worker died on (or whose reply was unreadable)
+            results[pending[0]] = _invalid_output(*jobs[pending[0]])
+            pending = pending[1:]
+        results[first]["timings"].update(timings)
+
+    return results
+
+
+async def aconvert(
+    input_path: str,
+    output_path: str,
+    keep_open: bool = False,
+    job_id: Optional[int] = None,
+) -> ConvertResult:
+    """
+    Asynchronously convert a document using a one-shot platform script process.
+
+    The script is started with `asyncio.create_subprocess_exec` and receives the job as
+    its JSON argument, so any number of conversions can be awaited concurrently without
+    blocking the event loop. If the awaiting task is cancelled, the script process is
+    killed and reaped before the cancellation propagates.
+
+    Parameters:
+        input_path (str): The path to the source file.
+        output_path (str): The path where the converted file will be saved.
+        keep_open (bool): Whether to keep the application (Word/Excel) open after processing.
+        job_id (int, optional): Id of the job in the events passed to `conver.hooks`.
+
+    Returns:
+        ConvertResult: The same structured result as `convert`.
+    """
+    payload = dumps({"input": input_path, "output": output_path, "keepOpen": keep_open})
+
+    backend = _backend()
+    if backend == "emulator":
+        script, build_command, args = "emulator.py", _emulator_command, [payload]
+    elif backend == "darwin":
+        script, build_command, args = "convert.jxa", _macos_command, [payload]
+    elif backend == "win32":
+        script, build_command = "convert.ps1", _windows_command
+        args = ["-jsonArgs", payload]
+    else:
+        result = _unsupported_platform(input_path, output_path)
+        metrics.record_result(result)
+        if hooks.enabled:
+            hooks.emit_result(result, job_id, None)
+        return result
+
+    started = time.perf_counter()
+    with as_file(files("conver.scripts").joinpath(script)) as script_path:
+        proc = await asyncio.create_subprocess_exec(
+            *build_command(str(script_path), *args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        spawned = time.perf_counter()
+        # One-shot scripts have no worker; their events are tracked by process
+        worker_name = f"script-{proc.pid}"
+        if hooks.enabled:
+            hooks.emit(
+                hooks.SPAWNED,
+                job_id,
+                worker_name,
+                seconds=spawned - started,
+                pid=proc.pid,
+            )
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            raise
+
+    encoding = locale.getpreferredencoding(False)
+    result = _parse_script_output(
+        stdout.decode(encoding, errors="replace"),
+        stderr.decode(encoding, errors="replace"),
+        proc.returncode,
+        input_path,
+        output_path,
+    )
+    result["timings"]["spawn"] = spawned - started
+    result["timings"]["total"] = time.perf_counter() - started
+    metrics.record_result(result)
+    if hooks.enabled:
+        hooks.emit_result(result, job_id, worker_name)
+    return result
+
+
+def backend_fingerprint() -> str:
+    """
+    Identify the conversion backend: platform, script contents and conver version.
+
+    Used to key cached results, so that changing the script or upgrading conver
+    invalidates outputs produced by the previous backend. Emulated results are
+    also keyed by the emulator settings, so they never stand in for real ones.
+    """
+    backend = _backend()
+    settings = os.environ.get("CONVER_EMULATOR", "") if backend == "emulator" else ""
+    return _fingerprint(backend, settings)
+
+
+@lru_cache(maxsize=None)
+def _fingerprint(backend: str, settings: str) -> str:
+    from .__version__ import __version__
+
+    if backend == "emulator":
+        script = "emulator.py"
+    elif backend == "darwin":
+        script = "convert.jxa"
+    elif backend == "win32":
+        script = "convert.ps1"
+    else:
+        return f"{backend}:none:{__version__}"
+
+    digest = hashlib.sha256(files("conver.scripts").joinpath(script).read_bytes())
+    digest.update(settings.encode())
+    return f"{backend}:{digest.hexdigest()[:16]}:{__version__}"
+
+
+def _backend() -> str:
+    """Return "emulator" when CONVER_BACKEND=emulator, otherwise `sys.platform`."""
+    if os.environ.get("CONVER_BACKEND", "").strip().lower() == "emulator":
+        return "emulator"
+    return sys.platform
+
+
+def _emulator_command(script_path: str, *args: str) -> List[str]:
+    """Build the command line running the emulator script."""
+    return [sys.executable, script_path, *args]
+
+
+def _macos_command(script_path: str, *args: str) -> List[str]:
+    """Build the osascript command line for the JXA script."""
+    return ["osascript", "-l", "JavaScript", script_path, *args]
+
 
+# Numbers the workers in the events passed to `conver.hooks`
+_worker_ids = itertools.count(1)
 
-def _execute_command(
-    command: List[str], input_path: str, output_path: str
+
+class _ScriptWorker:
+    """
+    A long-lived script process serving line-delimited JSON jobs.
+
+    The process is started lazily on the first request and restarted if it has
+    exited. Requests are serialized; each one writes a single JSON line to the
+    worker's stdin and waits for a single JSON reply line on its stdout, skipping
+    the event lines the script reports along the way. A reader thread feeds the
+    reply lines to `request()`, so that a hung script can be timed out.
+    `name` identifies the worker in the events passed to `conver.hooks`.
+    """
+
+    def __init__(
+        self,
+        script: str,
+        build_command: Callable[[str], List[str]],
+        name: Optional[str] = None,
+    ):
+        self.name = name or f"worker-{next(_worker_ids)}"
+        self._script = script
+        self._build_command = build_command
+        self._lock = threading.Lock()
+        self._stack: Optional[ExitStack] = None
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        # Word instance started by this worker, killed along with a hung script
+        self._word_pid: Optional[int] = None
+        # Whether the running script already has Word ready, for hook events
+        self._word_seen = False
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> None:
+        stack = ExitStack()
+        try:
+            script_path = stack.enter_context(
+                as_file(files("conver.scripts").joinpath(self._script))
+            )
+            self._proc = subprocess.Popen(
+                self._build_command(str(script_path)),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except BaseException:
+            stack.close()
+            raise
+        self._stack = stack
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=_read_lines,
+            args=(self._proc.stdout, self._lines),
+            name="conver-worker-reader",
+            daemon=True,
+        ).start()
+
+    def _stop(self, kill: bool = False) -> None:
+        proc, self._proc = self._proc, None
+        self._word_seen = False
+        if proc is not None and kill:
+            proc.kill()
+            proc.wait()
+        elif proc is not None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                proc.kill()
+                proc.wait()
+        if kill and self._word_pid is not None:
+            try:
+                os.kill(self._word_pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except OSError:
+                pass
+            self._word_pid = None
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+    def _exchange(
+        self,
+        payload: Any,
+        limits: Optional[Dict[str, Optional[float]]],
+        timings: Optional[Dict[str, float]] = None,
+        job_ids: Optional[List[Optional[int]]] = None,
+        partial: Optional[Dict[int, Any]] = None,
+    ) -> Any:
+        """
+        Write `payload` and return the decoded reply; the lock must be held.
+
+        The time spent decoding the reply is added to `timings` as "parse".
+        Word events are attributed to `job_ids` in order, one per job, and the
+        results a batch reports as its jobs end are stored in `partial` by index.
+        """
+        try:
+            # ensure_ascii keeps the request stream pure ASCII for the script
+            self._proc.stdin.write(dumps(payload, ensure_ascii=True) + "\n")
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            return None
+
+        phase = "start"
+        started = phase_started = time.monotonic()
+        word_events = 0
+        while True:
+            try:
+                line = self._lines.get(
+                    timeout=_time_left(limits, phase, started, phase_started)
+                )
+            except queue.Empty:
+                self._stop(kill=True)
+                raise TimeoutError(
+                    f"Conversion timed out after {time.monotonic() - started:.1f}s "
+                    f"({phase} phase); the script and its Word instance were killed."
+                ) from None
+            if line is None:
+                return None
+
+            parse_started = time.perf_counter()
+            try:
+                # PowerShell may prefix its first line with a UTF-8 BOM
+                data = loads(line.lstrip("\ufeff"))
+            except JSONDecodeError:
+                return None
+            if timings is not None:
+                timings["parse"] = (
+                    timings.get("parse", 0.0) + time.perf_counter() - parse_started
+                )
+
+            if isinstance(data, dict) and "event" in data:
+                if data["event"] == "word":
+                    pid = data.get("pid") if data.get("owned") else None
+                    if data.get("owned") and (
+                        not self._word_seen or pid != self._word_pid
+                    ):
+                        metrics.record_word_start()
+                    self._word_pid = pid
+                    if hooks.enabled:
+                        self._emit_word(data, job_ids, word_events)
+                    word_events += 1
+                    self._word_seen = True
+                    if phase == "start":
+                        phase, phase_started = "convert", time.monotonic()
+                elif data["event"] == "result" and partial is not None:
+                    partial[data.get("index")] = data.get("result")
+                continue
+            return data
+
+    def _emit_word(
+        self, data: Dict[str, Any], job_ids: Optional[List[Optional[int]]], index: int
+    ) -> None:
+        job_id = job_ids[index] if job_ids and index < len(job_ids) else None
+        hooks.emit(
+            hooks.WORD_REUSED if self._word_seen else hooks.WORD_STARTED,
+            job_id,
+            self.name,
+            pid=data.get("pid"),
+        )
+
+    def request(
+        self,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]],
+        limits: Optional[Dict[str, Optional[float]]] = None,
+        timings: Optional[Dict[str, float]] = None,
+        job_ids: Optional[List[Optional[int]]] = None,
+        partial: Optional[Dict[int, Any]] = None,
+    ) -> Any:
+        """
+        Send one job (or a batch of jobs) to the worker and return its decoded reply.
+
+        Returns None if the worker died or replied with something that is not
+        a JSON object or array; the worker is then discarded and restarted on
+        next use. `limits` (see `Timeout.limits`) bounds the wait for the reply:
+        when one is exceeded, the worker and the Word instance it started are
+        killed and `TimeoutError` is raised. If given, `timings` receives the
+        seconds spent starting the process ("spawn", when this request started
+        it) and decoding replies ("parse"); `job_ids` are the ids of the jobs
+        in the events passed to `conver.hooks`. `partial` receives the results
+        of a batch's jobs by index as they end, and keeps them if the worker
+        dies before replying.
+        """
+        with self._lock:
+            if not self.alive:
+                self._stop()
+                started = time.perf_counter()
+                self._start()
+                spawn = time.perf_counter() - started
+                if timings is not None:
+                    timings["spawn"] = spawn
+                if hooks.enabled:
+                    hooks.emit(
+                        hooks.SPAWNED,
+                        job_ids[0] if job_ids else None,
+                        self.name,
+                        seconds=spawn,
+                        pid=self._proc.pid,
+                    )
+
+            data = self._exchange(payload, limits, timings, job_ids, partial)
+            if not isinstance(data, (dict, list)):
+                self._stop()
+                return None
+
+            jobs = payload if isinstance(payload, list) else [payload]
+            if not (jobs and jobs[-1].get("keepOpen")):
+                # The script quit Word (or kept a failed job's instance, which is
+                # then not tracked); never kill a recycled pid later
+                self._word_pid = None
+                self._word_seen = False
+            return data
+
+    def close(self, quit_word: bool = False) -> None:
+        """
+        Stop the worker process.
+
+        With `quit_word`, a running worker is first asked to quit the Word instance
+        it drives; otherwise Word is left as the last job set it.
+        """
+        with self._lock:
+            if quit_word and self.alive:
+                started = time.perf_counter()
+                try:
+                    self._exchange({"command": "quit"}, {"total": _QUIT_TIMEOUT})
+                except TimeoutError:
+                    pass
+                if hooks.enabled and self._word_seen:
+                    hooks.emit(
+                        hooks.WORD_QUIT,
+                        worker=self.name,
+                        seconds=time.perf_counter() - started,
+                    )
+                self._word_pid = None
+            self._stop()
+
+
+def _read_lines(stream, lines: "queue.Queue[Optional[str]]") -> None:
+    """Forward a worker's stdout lines to `lines`, then None at EOF."""
+    try:
+        for line in stream:
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    finally:
+        lines.put(None)
+
+
+def _time_left(
+    limits: Optional[Dict[str, Optional[float]]],
+    phase: str,
+    started: float,
+    phase_started: float,
+) -> Optional[float]:
+    """Seconds until the nearest of the job and current phase deadlines, or None."""
+    if limits is None:
+        return None
+    now = time.monotonic()
+    deadlines = ((limits.get("total"), started), (limits.get(phase), phase_started))
+    left = [limit - (now - since) for limit, since in deadlines if limit is not None]
+    return max(0.0, min(left)) if left else None
+
+
+def _windows_command(script_path: str, *args: str) -> List[str]:
+    """Build the PowerShell command line for the conversion script."""
+    return [
+        "powershell",
+        "-NoProfile",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-File",
+        script_path,
+        *args,
+    ]
+
+
+# Seconds a worker may take to quit Word before it is killed
+_QUIT_TIMEOUT = 30.0
+
+_macos_worker = _ScriptWorker(
+    "convert.jxa",
+    lambda script_path: _macos_command(script_path, "--worker"),
+    name="shared",
+)
+_windows_worker = _ScriptWorker(
+    "convert.ps1",
+    lambda script_path: _windows_command(script_path, "-worker"),
+    name="shared",
+)
+_emulator_worker = _ScriptWorker(
+    "emulator.py",
+    lambda script_path: _emulator_command(script_path, "--worker"),
+    name="shared",
+)
+atexit.register(_macos_worker.close)
+atexit.register(_windows_worker.close)
+atexit.register(_emulator_worker.close)
+
+
+def _default_worker() -> Optional[_ScriptWorker]:
+    """Return the shared worker for this platform, or None if unsupported."""
+    backend = _backend()
+    if backend == "emulator":
+        return _emulator_worker
+    elif backend == "darwin":
+        return _macos_worker
+    elif backend == "win32":
+        return _windows_worker
+    return None
+
+
+def create_worker(owner: str) -> Optional[_ScriptWorker]:
+    """
+    Create a dedicated worker, separate from the shared platform worker.
+
+    On Windows, `owner` tags the Word instance the worker creates so that it never
+    attaches to another worker's instance. macOS has a single Word instance, so the
+    tag is unused there. Returns None on unsupported platforms. The caller owns the
+    worker and must `close()` it.
+    """
+    backend = _backend()
+    if backend == "emulator":
+        return _ScriptWorker(
+            "emulator.py",
+            lambda script_path: _emulator_command(
+                script_path, "--worker", "--owner", owner
+            ),
+        )
+    elif backend == "darwin":
+        return _ScriptWorker(
+            "convert.jxa", lambda script_path: _macos_command(script_path, "--worker")
+        )
+    elif backend == "win32":
+        return _ScriptWorker(
+            "convert.ps1",
+            lambda script_path: _windows_command(
+                script_path, "-worker", "-owner", owner
+            ),
+        )
+    return None
+
+
+class WorkerPool:
+    """
+    A pool of dedicated script workers, each driving its own warm Word session.
+
+    Workers are created lazily and handed out by `acquire()` to whichever caller
+    asks next; a caller blocks while all workers are busy. On Windows every worker
+    owns a separate Word instance, so conversions run in parallel. macOS has a
+    single Word instance per user session, so the pool is capped at one worker.
+    Emulated workers (see EMULATOR above) are not capped.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("size must be greater than 0")
+        if _backend() == "darwin":
+            size = 1
+
+        self.size = size
+        self._prefix = f"conver-{os.getpid()}-{id(self):x}"
+        self._slots = threading.Semaphore(size)
+        self._idle: "queue.LifoQueue[Optional[_ScriptWorker]]" = queue.LifoQueue()
+        self._workers: List[_ScriptWorker] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Optional[_ScriptWorker]]:
+        """
+        Borrow a free worker for the duration of the `with` block.
+
+        Yields None on unsupported platforms, which `convert` treats as such.
+        """
+        with self._slots:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = self._create()
+            try:
+                yield worker
+            finally:
+                self._idle.put(worker)
+
+    def _create(self) -> Optional[_ScriptWorker]:
+        with self._lock:
+            worker = create_worker(f"{self._prefix}-{len(self._workers) + 1}")
+            if worker is not None:
+                self._workers.append(worker)
+            return worker
+
+    def close(self, quit_word: bool = False) -> None:
+        """Stop every worker, optionally quitting the Word instances they drive."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close(quit_word=quit_word)
+
+
+def _execute_job(
+    worker: _ScriptWorker,
+    input_path: str,
+    output_path: str,
+    keep_open: bool,
+    timeout: Union[float, Timeout, None] = None,
+    job_id: Optional[int] = None,
 ) -> ConvertResult:
     """
-    Executes the command for either macOS or Windows and parses the JSON output.
+    Send one conversion job to a persistent script worker and normalize its reply.
 
-    Attempts to run the provided script command and expects JSON output for successful completion.
-    In cases where the script exits with an error, the `error_code` from the script’s JSON response
-    is returned directly to help identify specific issues. If JSON parsing fails, a general error
-    code of 98 is returned.
+    The script's `error_code` is returned directly to help identify specific issues.
+    If the worker dies or its reply cannot be parsed as JSON, a general error code
+    of 98 is returned.
 
     Parameters:
-        command (List[str]): The command to be executed.
+        worker (_ScriptWorker): The platform worker that performs the conversion.
         input_path (str): The path to the input file, passed for error context.
         output_path (str): The path to the output file, passed for error context.
+        keep_open (bool): Whether the script should leave Word running afterwards.
+        timeout (float | Timeout, optional): Limits for the job; see `convert`.
+        job_id (int, optional): Id of the job in the events passed to `conver.hooks`.
 
     Returns:
         ConvertResult: A structured dictionary with status, message, error code, input, and output.
     """
-    result = subprocess.run(command, capture_output=True, text=True)
-
-    # osascript places all output in stderr, including success
-    raw = result.stdout.strip() or result.stderr.strip()
+    if timeout is not None and not isinstance(timeout, Timeout):
+        timeout = Timeout(total=timeout)
 
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
     try:
-        data = loads(raw)
-    except JSONDecodeError:
-        return {
+        data = worker.request(
+            {"input": input_path, "output": output_path, "keepOpen": keep_open},
+            limits=None if timeout is None else timeout.limits(input_path),
+            timings=timings,
+            job_ids=[job_id],
+        )
+    except TimeoutError as e:
+        result: ConvertResult = {
             "status": "error",
             "input": input_path,
             "output": output_path,
-            "message": "Invalid JSON output from script.",
-            "error_code": 98,
+            "message": str(e),
+            "error_code": 41,
+            "timings": {},
         }
+    else:
+        if isinstance(data, dict):
+            result = _normalize_result(data, input_path, output_path, 98)
+        else:
+            result = _invalid_output(input_path, output_path)
+
+    timings["total"] = time.perf_counter() - started
+    result["timings"].update(timings)
+    return result
 
-    # canonical normalized result
+
+def _parse_script_output(
+    stdout: str, stderr: str, returncode: int, input_path: str, output_path: str
+) -> ConvertResult:
+    """Parse the JSON printed by a one-shot script run into a `ConvertResult`."""
+    # osascript places all output in stderr, including success
+    raw = stdout.strip() or stderr.strip()
+
+    started = time.perf_counter()
+    try:
+        data = loads(raw)
+    except JSONDecodeError:
+        return _invalid_output(input_path, output_path)
+
+    if not isinstance(data, dict):
+        return _invalid_output(input_path, output_path)
+    result = _normalize_result(data, input_path, output_path, returncode)
+    result["timings"]["parse"] = time.perf_counter() - started
+    return result
+
+
+def _unsupported_platform(input_path: str, output_path: str) -> ConvertResult:
+    """Error result for platforms without a conversion script."""
+    return {
+        "status": "error",
+        "input": input_path,
+        "output": output_path,
+        "message": "Unsupported platform.",
+        "error_code": 99,
+        "timings": {},
+    }
+
+
+def _invalid_output(input_path: str, output_path: str) -> ConvertResult:
+    """Error result for a script that produced no parseable JSON."""
+    return {
+        "status": "error",
+        "input": input_path,
+        "output": output_path,
+        "message": "Invalid JSON output from script.",
+        "error_code": 98,
+        "timings": {},
+    }
+
+
+def _normalize_result(
+    data: Dict[str, Any], input_path: str, output_path: str, default_code: int
+) -> ConvertResult:
+    """Build the canonical `ConvertResult` from a script's JSON reply."""
+    timings = data.get("timings")
     return {
         "status": data.get("status", "error"),
         "input": data.get("input", input_path),
         "output": data.get("output", output_path),
         "message": data.get("message", ""),
-        "error_code": data.get("error_code", result.returncode),
+        "error_code": data.get("error_code", default_code),
+        "timings": {
+            phase: float(seconds)
+            for phase, seconds in (timings if isinstance(timings, dict) else {}).items()
+            if isinstance(seconds, (int, float))
+        },
     }
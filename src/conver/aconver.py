@@ -0,0 +1,169 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Asynchronous document conversion API.
+
+This module exposes `aconver()` — the asyncio counterpart of `conver()` — and
+helpers for converting batches concurrently. Conversions run in one-shot script
+processes started with `asyncio.create_subprocess_exec`, so the event loop is
+never blocked. Cancelling a task kills its script process.
+
+Paths are normalized and errors are mapped to `ConverError` subclasses exactly
+as in `conver()`.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+from . import hooks
+from ._convert import _backend, aconvert
+from .conver import (
+    ConverError,
+    InputFileNotFound,
+    _emit_outcome,
+    _error_from_result,
+    _normalize_paths,
+    _queue_job,
+)
+
+
+async def aconver(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    keep_open: bool = False,
+    limiter: Optional[asyncio.Semaphore] = None,
+) -> Path:
+    """
+    Asynchronously convert a document to another format.
+
+    Parameters
+    ----------
+    input_path : str or pathlib.Path
+        Path to the source document.
+    output_path : str or pathlib.Path
+        Target output path with desired extension.
+    keep_open : bool, default=False
+        Whether to keep Microsoft Word open after conversion.
+    limiter : asyncio.Semaphore, optional
+        Held while the script process runs, to bound concurrent conversions.
+
+    Returns
+    -------
+    Path
+        The resolved absolute output path.
+
+    Raises
+    ------
+    ConverError
+        The same `ConverError` subclasses as `conver()`.
+    asyncio.CancelledError
+        The task was cancelled; the script process has been killed.
+    """
+
+    outcome = await _aconver_outcome(input_path, output_path, keep_open, limiter)
+    if isinstance(outcome, ConverError):
+        raise outcome
+    return outcome
+
+
+async def aconver_as_completed(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool = False,
+    limit: int = 1,
+) -> AsyncIterator[Tuple[int, Union[Path, ConverError]]]:
+    """
+    Convert a batch concurrently, yielding results as they complete.
+
+    At most `limit` script processes run at once. Word is kept open between
+    jobs; the last job runs alone once all others are done and honors
+    `keep_open`. Closing the iterator early cancels and kills pending jobs.
+
+    Parameters
+    ----------
+    jobs : iterable of (input_path, output_path)
+        Source documents and their target paths.
+    keep_open : bool, default=False
+        Whether to keep Microsoft Word open after the whole batch.
+    limit : int, default=1
+        Maximum number of concurrent conversions. macOS has a single Word
+        instance, which concurrent scripts would race on, so it is capped at
+        one there.
+
+    Yields
+    ------
+    (int, Path or ConverError)
+        The index of the job in `jobs` and its outcome: the resolved output
+        path on success, or the exception instance describing the failure.
+    """
+
+    jobs = list(jobs)
+    if not jobs:
+        return
+
+    if _backend() == "darwin":
+        limit = 1
+    limiter = asyncio.Semaphore(limit)
+
+    async def run(index: int, keep: bool) -> Tuple[int, Union[Path, ConverError]]:
+        input_path, output_path = jobs[index]
+        outcome = await _aconver_outcome(input_path, output_path, keep, limiter)
+        return index, outcome
+
+    tasks = [asyncio.ensure_future(run(idx, True)) for idx in range(len(jobs) - 1)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+        yield await run(len(jobs) - 1, keep_open)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def aconver_batch(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool = False,
+    limit: int = 1,
+) -> List[Union[Path, ConverError]]:
+    """
+    Convert a batch concurrently and return the outcomes in job order.
+
+    See `aconver_as_completed()` for the parameters. Like `conver_batch()`,
+    returns one `Path` or `ConverError` per job; failures do not stop the batch.
+    """
+
+    jobs = list(jobs)
+    outcomes: List[Union[Path, ConverError, None]] = [None] * len(jobs)
+    async for index, outcome in aconver_as_completed(jobs, keep_open, limit):
+        outcomes[index] = outcome
+    return outcomes
+
+
+async def _aconver_outcome(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    keep_open: bool,
+    limiter: Optional[asyncio.Semaphore],
+) -> Union[Path, ConverError]:
+    """Run one conversion and return the output path or the mapped error."""
+
+    in_path, out_path = _normalize_paths(input_path, output_path)
+    job_id = _queue_job(in_path, out_path) if hooks.enabled else None
+
+    if not in_path.exists():
+        error = InputFileNotFound(f"Input file does not exist: {in_path}", 11)
+        if hooks.enabled:
+            _emit_outcome(job_id, in_path, out_path, error)
+        return error
+
+    if limiter is None:
+        result = await aconvert(str(in_path), str(out_path), keep_open, job_id)
+    else:
+        async with limiter:
+            result = await aconvert(str(in_path), str(out_path), keep_open, job_id)
+
+    error = _error_from_result(result)
+    return out_path if error is None else error
@@ -0,0 +1,128 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Circuit breaker around the Word backend.
+
+When Word is broken on a host (a licence popup, a corrupted Normal.dotm),
+every job still starts a script and waits for Word to fail. A
+`CircuitBreaker` passed as `breaker=` counts consecutive `WordStartError`
+failures; after `threshold` of them it opens, and jobs fail immediately with
+`WordStartError` without reaching Word. Once `probe_interval` seconds have
+passed, the next job is let through as a probe: if Word starts, the breaker
+closes again, otherwise it stays open for another interval.
+
+One breaker can be shared by any number of threads and calls.
+"""
+
+import threading
+import time
+from typing import Optional, Tuple, Type
+
+from .conver import ConverError, WordStartError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Fail fast while Word keeps failing to start.
+
+    Parameters
+    ----------
+    threshold : int, default=5
+        Consecutive start failures that open the breaker.
+    probe_interval : float, default=30.0
+        Seconds the breaker stays open before a job is let through as a probe.
+    trip_on : tuple of ConverError subclasses, default=(WordStartError,)
+        Errors counted as start failures. Any other outcome shows that Word
+        is usable and resets the count.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        probe_interval: float = 30.0,
+        trip_on: Tuple[Type[ConverError], ...] = (WordStartError,),
+    ):
+        if threshold <= 0:
+            raise ValueError("threshold must be greater than 0")
+
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.trip_on = trip_on
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """`CLOSED`, `OPEN` or `HALF_OPEN` (a probe is in flight)."""
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive start failures recorded so far."""
+        return self._failures
+
+    @property
+    def probing(self) -> bool:
+        """Whether the job let through last is a probe."""
+        return self._state == HALF_OPEN
+
+    def allow(self) -> bool:
+        """
+        Whether a job may be sent to Word now.
+
+        While open, returns True once per `probe_interval`, moving the breaker
+        to `HALF_OPEN` until that probe's outcome is recorded.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.probe_interval
+            ):
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record(self, error: Optional[ConverError]) -> None:
+        """Record the outcome of a job that `allow()` let through."""
+        with self._lock:
+            if error is None or not isinstance(error, self.trip_on):
+                self._state = CLOSED
+                self._failures = 0
+                return
+            self._fail()
+
+    def record_failure(self) -> None:
+        """
+        Record a job that `allow()` let through but that ended without an
+        outcome, e.g. because the script could not be started; it counts as a
+        start failure, so a probe that raises opens the breaker again.
+        """
+        with self._lock:
+            self._fail()
+
+    def _fail(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.threshold:
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+
+    def error(self) -> WordStartError:
+        """The error reported for a job rejected while the breaker is open."""
+        with self._lock:
+            wait = self.probe_interval - (time.monotonic() - self._opened_at)
+            failures = self._failures
+        return WordStartError(
+            f"[21] Circuit open after {failures} consecutive Word start failures; "
+            f"next probe in {max(0.0, wait):.1f}s.",
+            21,
+        )
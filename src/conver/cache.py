@@ -0,0 +1,248 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Content-addressed on-disk cache for conversion results.
+
+A `ConversionCache` stores converted documents under a key derived from the
+input bytes, the target format, the conversion options and the backend
+fingerprint (platform, script version and conver version). `conver()`
+consults it before starting Word; on a hit the cached output is materialized
+at the target path by copy, hardlink or reflink.
+
+The cache has a size budget; when a store exceeds it, the least recently used
+entries are evicted. Entries are plain files, so several processes may share
+one cache directory.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple, TypedDict, Union
+
+from . import metrics
+from ._convert import backend_fingerprint
+
+_CHUNK_SIZE = 1024 * 1024
+_LINK_MODES = ("copy", "hardlink", "reflink")
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class ConversionCache:
+    """
+    An LRU-evicted, content-addressed store of converted documents.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Cache location; created on first use.
+    max_bytes : int, default=1 GiB
+        Size budget. Least recently used entries are evicted above it.
+    link : {"copy", "hardlink", "reflink"}, default="copy"
+        How a hit is materialized. "hardlink" shares the inode with the cache
+        entry, so the output must not be modified in place. "reflink" uses a
+        copy-on-write clone where the filesystem supports it and falls back to
+        a copy otherwise.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 1024**3,
+        link: str = "copy",
+    ):
+        if link not in _LINK_MODES:
+            raise ValueError(f"link must be one of {', '.join(_LINK_MODES)}")
+
+        self.directory = Path(directory).expanduser().absolute()
+        self.max_bytes = max_bytes
+        self.link = link
+
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def key(self, input_path: Path, output_path: Path, **options) -> str:
+        """
+        Compute the cache key for converting `input_path` to `output_path`.
+
+        The key covers the input bytes, the target format (output extension),
+        any extra conversion `options` and the backend fingerprint.
+        """
+        digest = hashlib.sha256()
+        digest.update(backend_fingerprint().encode())
+        digest.update(b"\0" + output_path.suffix.lower().encode())
+        for name in sorted(options):
+            digest.update(f"\0{name}={options[name]!r}".encode())
+        digest.update(b"\0")
+
+        with open(input_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def fetch(self, key: str, output_path: Path) -> bool:
+        """Materialize the entry for `key` at `output_path`; False on a miss."""
+        entry = self._entry_path(key)
+        try:
+            # Touching the entry records the access for LRU eviction
+            os.utime(entry)
+        except FileNotFoundError:
+            self._count("misses")
+            metrics.record_cache(False)
+            return False
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _materialize(entry, output_path, self.link)
+        except FileNotFoundError:
+            # Evicted by another process between the touch and the copy
+            self._count("misses")
+            metrics.record_cache(False)
+            return False
+
+        self._count("hits")
+        metrics.record_cache(True)
+        return True
+
+    def store(self, key: str, output_path: Path) -> None:
+        """Add a freshly converted `output_path` to the cache under `key`."""
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(output_path, tmp)
+        size = tmp.stat().st_size
+        os.replace(tmp, entry)
+
+        with self._lock:
+            self._counters["stores"] += 1
+            if self._size is not None:
+                self._size += size
+
+        self._evict()
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters for this process and the current cache size."""
+        entries = self._scan()
+        with self._lock:
+            self._size = sum(size for _, size, _ in entries)
+            return {
+                **self._counters,
+                "entries": len(entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path, _, _ in self._scan():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _scan(self) -> List[Tuple[Path, int, float]]:
+        """List `(path, size, last_access)` for every entry."""
+        entries = []
+        if not self.directory.is_dir():
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if item.name.startswith(".") or not item.is_file():
+                    continue
+                try:
+                    st = item.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((Path(item.path), st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+
+        if total > self.max_bytes:
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+                if total <= self.max_bytes:
+                    break
+
+        with self._lock:
+            self._size = total
+            self._counters["evictions"] += evicted
+
+
+def _materialize(entry: Path, output_path: Path, link: str) -> None:
+    """Place the cache entry at `output_path` using the requested link mode."""
+    tmp = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if link == "hardlink":
+            try:
+                os.link(entry, tmp)
+            except OSError:
+                shutil.copyfile(entry, tmp)
+        elif link == "reflink":
+            if not _reflink(entry, tmp):
+                shutil.copyfile(entry, tmp)
+        else:
+            shutil.copyfile(entry, tmp)
+        os.replace(tmp, output_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone `src` to `dst` copy-on-write; returns False if unsupported."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        FICLONE = 0x40049409
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            dst.unlink(missing_ok=True)
+            return False
+
+    if sys.platform == "darwin":
+        import ctypes
+
+        try:
+            clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        except (OSError, AttributeError):
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+    return False
@@ -1,20 +1,45 @@
+import os
 import sys
+import threading
+from collections import Counter
+from contextlib import ExitStack
+from hashlib import blake2b
+from itertools import chain, islice
 from pathlib import Path
 from typing import Union
 
 from click import (
-    command,
+    Group,
+    group,
     argument,
     option,
     version_option,
     echo,
+    IntRange,
+    FloatRange,
+    Choice,
     Path as ClickPath,
     UsageError,
+    get_current_context,
 )
+from click.core import ParameterSource
 
-from .conver import conver, ConverError
+from .breaker import CircuitBreaker
+from .cache import ConversionCache
+from . import daemon, metrics
+from .conver import conver_batch, conver_iter, ConverError, Timeout
+from .journal import JOURNAL_NAME, Journal, RUNNING, DONE, FAILED
+from .manifest import MANIFEST_NAME, Manifest
+from .retry import RetryPolicy
+from .server import serve
+from .streams import FORMATS, conver_stream
+from .trace import TraceRecorder
+from .walk import DEFAULT_INCLUDE, walk_documents
+from .watch import watch
 from .__version__ import __version__
 
+CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
+
 
 def fail(label: str, err: Exception, code: int = 1):
     echo(f"{label} {err}", err=True)
@@ -26,17 +51,426 @@ def _infer_common_parent(paths: list[Path]) -> Union[Path, None]:
     return parents.pop() if len(parents) == 1 else None
 
 
-@command(context_settings={"help_option_names": ["-h", "--help"]})
+class _ConverGroup(Group):
+    """
+    Command group that falls back to the `convert` command.
+
+    `conver INPUT...` keeps working as before: unless the first argument names a
+    subcommand, or is a lone help flag, the arguments are passed to `convert`.
+    """
+
+    def parse_args(self, ctx, args):
+        if not args or (
+            args[0] not in self.commands and args not in (["-h"], ["--help"])
+        ):
+            args = ["convert", *args]
+        return super().parse_args(ctx, args)
+
+
+@group(cls=_ConverGroup, context_settings=CONTEXT_SETTINGS)
+@version_option(__version__, "-v", "--version")
+def cli():
+    """Convert Microsoft Word documents.
+
+    Without a subcommand, arguments are passed to `convert`:
+    `conver a.docx --pdf` is `conver convert a.docx --pdf`.
+    """
+
+
+def _cache_options(func):
+    """Add the --cache-dir, --cache-size and --no-cache options."""
+    func = option("--no-cache", is_flag=True, help="Do not use the conversion cache.")(
+        func
+    )
+    func = option(
+        "--cache-size",
+        type=IntRange(min=1),
+        default=1024,
+        show_default=True,
+        metavar="MB",
+        help="Cache size budget; least recently used entries are evicted.",
+    )(func)
+    func = option(
+        "--cache-dir",
+        type=ClickPath(file_okay=False, path_type=Path),
+        envvar="CONVER_CACHE_DIR",
+        help="Reuse earlier conversions of identical inputs from this directory.",
+    )(func)
+    return func
+
+
+def _make_cache(cache_dir, cache_size, no_cache) -> Union[ConversionCache, None]:
+    if cache_dir is None or no_cache:
+        return None
+    return ConversionCache(cache_dir, max_bytes=cache_size * 1024 * 1024)
+
+
+def _timeout_options(func):
+    """Add the --timeout, --start-timeout and --timeout-per-mb options."""
+    func = option(
+        "--timeout-per-mb",
+        type=FloatRange(min=0),
+        default=0.0,
+        metavar="SECONDS",
+        help="Extra seconds per MiB of input added to --timeout.",
+    )(func)
+    func = option(
+        "--start-timeout",
+        type=FloatRange(min=0, min_open=True),
+        metavar="SECONDS",
+        help="Limit for Word to start; a hung Word is killed.",
+    )(func)
+    func = option(
+        "--timeout",
+        type=FloatRange(min=0, min_open=True),
+        metavar="SECONDS",
+        help="Limit per document; the job fails and Word is killed if exceeded.",
+    )(func)
+    return func
+
+
+def _make_timeout(timeout, start_timeout, timeout_per_mb) -> Union[Timeout, None]:
+    if timeout is None and start_timeout is None:
+        return None
+    return Timeout(total=timeout, start=start_timeout, per_mb=timeout_per_mb)
+
+
+def _retry_options(func):
+    """Add the --retries and --retry-delay options."""
+    func = option(
+        "--retry-delay",
+        type=FloatRange(min=0),
+        default=1.0,
+        show_default=True,
+        metavar="SECONDS",
+        help="Delay before the first retry; doubles after each attempt.",
+    )(func)
+    func = option(
+        "--retries",
+        type=IntRange(min=0),
+        default=0,
+        show_default=True,
+        help="Retry documents failing with transient Word errors, restarting Word.",
+    )(func)
+    return func
+
+
+class _ReportingRetryPolicy(RetryPolicy):
+    """Retry policy announcing retries on stderr and counting them per input."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retried = Counter()
+
+    def on_retry(self, input_path, error, attempt, delay):
+        self.retried[input_path] += 1
+        echo(
+            f"Retrying {input_path} in {delay:.1f}s "
+            f"(attempt {attempt + 1}/{self.max_attempts}): {error}",
+            err=True,
+        )
+
+
+def _make_retry(retries, retry_delay) -> Union[_ReportingRetryPolicy, None]:
+    if not retries:
+        return None
+    return _ReportingRetryPolicy(max_attempts=retries + 1, initial_delay=retry_delay)
+
+
+def _breaker_options(func):
+    """Add the --circuit-breaker and --probe-interval options."""
+    func = option(
+        "--probe-interval",
+        type=FloatRange(min=0),
+        default=30.0,
+        show_default=True,
+        metavar="SECONDS",
+        help="How long an open circuit breaker waits before probing Word again.",
+    )(func)
+    func = option(
+        "--circuit-breaker",
+        "breaker_threshold",
+        type=IntRange(min=1),
+        metavar="N",
+        help="Fail documents fast after N consecutive Word start failures.",
+    )(func)
+    return func
+
+
+def _make_breaker(threshold, probe_interval) -> Union[CircuitBreaker, None]:
+    if threshold is None:
+        return None
+    return CircuitBreaker(threshold, probe_interval=probe_interval)
+
+
+def _metrics_options(func):
+    """Add the --metrics-port and --metrics-textfile options."""
+    func = option(
+        "--metrics-textfile",
+        type=ClickPath(dir_okay=False, path_type=Path),
+        metavar="FILE",
+        help="Write conversion metrics to FILE every 15s and on exit "
+        "(node_exporter textfile collector).",
+    )(func)
+    func = option(
+        "--metrics-port",
+        type=IntRange(0, 65535),
+        metavar="PORT",
+        help="Serve conversion metrics at http://127.0.0.1:PORT/metrics.",
+    )(func)
+    return func
+
+
+def _start_metrics(port, textfile) -> None:
+    """Enable metrics and run the requested exporters until the command ends."""
+    if port is None and textfile is None:
+        return
+
+    metrics.enable()
+    ctx = get_current_context()
+    if port is not None:
+        server = metrics.start_http_server(port)
+        ctx.call_on_close(server.shutdown)
+    if textfile is not None:
+        stop = threading.Event()
+        writer = metrics.start_textfile_writer(textfile, stop=stop)
+        ctx.call_on_close(lambda: (stop.set(), writer.join()))
+
+
+def _start_trace(path) -> None:
+    """Record a Chrome trace of the conversions, saved when the command ends."""
+    if path is None:
+        return
+
+    recorder = TraceRecorder().start()
+    get_current_context().call_on_close(lambda: (recorder.stop(), recorder.save(path)))
+
+
+# Options a daemon would ignore: the jobs it converts use its own settings
+_PER_RUN_OPTIONS = (
+    "keep_open",
+    "jobs",
+    "cache_dir",
+    "cache_size",
+    "no_cache",
+    "timeout",
+    "start_timeout",
+    "timeout_per_mb",
+    "retries",
+    "retry_delay",
+    "breaker_threshold",
+    "probe_interval",
+    "metrics_port",
+    "metrics_textfile",
+)
+
+
+def _per_run_options():
+    """Names of the `_PER_RUN_OPTIONS` given on the command line."""
+    ctx = get_current_context()
+    return [
+        name
+        for name in _PER_RUN_OPTIONS
+        if ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE
+    ]
+
+
+def _convert_stream(
+    pairs,
+    keep_open,
+    jobs,
+    cache,
+    timeout,
+    retry,
+    breaker,
+    use_daemon,
+    chunk_size=32,
+):
+    """
+    Yield `(pair, outcome)` for each pair, converting on the running daemon if
+    there is one and in-process otherwise, `chunk_size` pairs per request.
+    """
+    if not (use_daemon and daemon.is_running()):
+        yield from conver_iter(
+            pairs,
+            keep_open=keep_open,
+            max_workers=jobs,
+            cache=cache,
+            timeout=timeout,
+            retry=retry,
+            breaker=breaker,
+            chunk_size=chunk_size,
+        )
+        return
+
+    pairs = iter(pairs)
+    for chunk in iter(lambda: list(islice(pairs, chunk_size)), []):
+        outcomes = daemon.delegate(chunk)
+        if outcomes is None:
+            # The daemon went away mid-batch: finish this chunk in-process
+            outcomes = conver_batch(
+                chunk,
+                keep_open=keep_open,
+                max_workers=jobs,
+                cache=cache,
+                timeout=timeout,
+                retry=retry,
+                breaker=breaker,
+            )
+        yield from zip(chunk, outcomes)
+
+
+def _batch_pairs(inputs, output, target, include, exclude):
+    """
+    Yield (input, output) pairs for a batch, walking directory inputs.
+
+    Files go to `output` (or next to themselves) by stem. Documents found under
+    a directory keep their relative path below `output` (below `output/NAME`
+    when several directories are given), or are written next to themselves.
+    """
+    roots = [inp for inp in inputs if inp.is_dir()]
+    suffix = f".{target}"
+    created = set()
+
+    for inp in inputs:
+        if not inp.is_dir():
+            if output is None:
+                yield inp, inp.with_suffix(suffix)
+            else:
+                yield inp, output / (inp.stem + suffix)
+            continue
+
+        if output is None:
+            base = inp
+        elif len(roots) > 1:
+            base = output / inp.resolve().name
+        else:
+            base = output
+
+        documents = walk_documents(
+            inp, include or DEFAULT_INCLUDE, exclude, skip=[output] if output else []
+        )
+        for path in documents:
+            if path.suffix.lower() == suffix:
+                continue  # already in the target format
+            out = (base / path.relative_to(inp)).with_suffix(suffix)
+            if out.parent not in created:
+                out.parent.mkdir(parents=True, exist_ok=True)
+                created.add(out.parent)
+            yield path, out
+
+
+def _listed_pairs(list_path, null, output, target):
+    """
+    Yield (input, output) pairs for the records of a --from-file list.
+
+    Each record names an input, optionally followed by a tab and either a
+    target format or an output path (a directory when it has no suffix).
+    Records are read as they arrive, so a list still being written by another
+    process is converted while it grows.
+    """
+    created = set()
+    with ExitStack() as stack:
+        if list_path == Path("-"):
+            stream = sys.stdin.buffer
+        else:
+            stream = stack.enter_context(open(list_path, "rb"))
+
+        for record in _read_records(stream, b"\0" if null else b"\n"):
+            name, _, dest = os.fsdecode(record).partition("\t")
+            inp = Path(name)
+            suffix = f".{target}"
+            if dest.lower() in FORMATS:
+                suffix, dest = f".{dest.lower()}", ""
+
+            if dest:
+                out = Path(dest)
+                if not out.suffix:
+                    out = out / (inp.stem + suffix)
+            elif output is not None:
+                out = output / (inp.stem + suffix)
+            else:
+                out = inp.with_suffix(suffix)
+
+            if out.parent not in created:
+                out.parent.mkdir(parents=True, exist_ok=True)
+                created.add(out.parent)
+            yield inp, out
+
+
+def _is_streamed(list_path):
+    """Whether a --from-file list may still be produced while it is read."""
+    if list_path is None:
+        return False
+    return list_path == Path("-") or not list_path.is_file()
+
+
+def _read_records(stream, separator, size=64 * 1024):
+    """Yield the non-empty `separator`-terminated records of a binary stream."""
+    pending = b""
+    while True:
+        chunk = stream.read1(size)
+        *records, pending = (pending + chunk).split(separator)
+        if not chunk:
+            records.append(pending)
+        for record in records:
+            if separator == b"\n":
+                record = record.rstrip(b"\r")
+            if record:
+                yield record
+        if not chunk:
+            return
+
+
+def _unique_outputs(pairs, conflicts):
+    """
+    Drop pairs whose output an earlier pair writes, reporting them in `conflicts`.
+
+    Any earlier pair may claim an output (e.g. two listed files with the same
+    stem and a shared --output), so every claim is kept for the whole run; they
+    are kept as 64-bit digests of the output paths, a few dozen bytes each,
+    rather than as paths.
+    """
+    claimed = set()
+    for inp, out in pairs:
+        key = os.fsencode(os.path.normcase(str(out.absolute())))
+        digest = int.from_bytes(blake2b(key, digest_size=8).digest(), "big")
+        if digest in claimed:
+            echo(
+                f"Error: {inp} skipped: {out} is written from another input.", err=True
+            )
+            conflicts.append(inp)
+            continue
+        claimed.add(digest)
+        yield inp, out
+
+
+def _journaled(pairs, journal):
+    """Record each pair as running when it is taken for conversion."""
+    for inp, out in pairs:
+        journal.record(inp, out, RUNNING)
+        yield inp, out
+
+
+@cli.command("convert", context_settings=CONTEXT_SETTINGS)
 @argument(
-    "inputs", type=ClickPath(exists=True, path_type=Path), nargs=-1, metavar="INPUT..."
+    "inputs",
+    type=ClickPath(exists=True, path_type=Path, allow_dash=True),
+    nargs=-1,
+    metavar="INPUT...",
 )
 @option(
     "-o",
     "--output",
     "output",
-    type=ClickPath(path_type=Path),
+    type=ClickPath(path_type=Path, allow_dash=True),
     required=False,
-    help="Output file or directory (for multiple inputs).",
+    help="Output file or directory (for multiple inputs); - writes to stdout.",
+)
+@option(
+    "--from-format",
+    type=Choice(FORMATS, case_sensitive=False),
+    help="Format of a document read from stdin (INPUT -).",
 )
 @option("-p", "--pdf", "target", flag_value="pdf", help="Convert to PDF.")
 @option("-x", "--docx", "target", flag_value="docx", help="Convert to DOCX.")
@@ -46,41 +480,285 @@ def _infer_common_parent(paths: list[Path]) -> Union[Path, None]:
 @option("-m", "--html", "target", flag_value="html", help="Convert to HTML.")
 @option("-u", "--odt", "target", flag_value="odt", help="Convert to ODT.")
 @option("-k", "--keep-open", is_flag=True, help="Keep Microsoft Word open.")
+@option(
+    "-j",
+    "--jobs",
+    type=IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parallel Word sessions for multiple inputs (Windows).",
+)
+@_cache_options
+@_timeout_options
+@_retry_options
+@_breaker_options
+@_metrics_options
+@option(
+    "--trace",
+    "trace_path",
+    type=ClickPath(dir_okay=False, path_type=Path),
+    metavar="FILE",
+    help="Write a Chrome/Perfetto trace of the conversions to FILE "
+    "(open it in ui.perfetto.dev); implies --no-daemon.",
+)
+@option(
+    "--incremental",
+    is_flag=True,
+    help="Skip inputs whose output is up to date and remove outputs of deleted "
+    f"inputs (tracked in {MANIFEST_NAME} in the output directory).",
+)
+@option(
+    "-w",
+    "--watch",
+    "watch_dir",
+    type=ClickPath(exists=True, file_okay=False, path_type=Path),
+    metavar="DIR",
+    help="Watch DIR and convert documents as they change (Ctrl-C to stop).",
+)
+@option(
+    "-R",
+    "--recursive",
+    is_flag=True,
+    help="Convert the documents under INPUT directories, mirroring their layout "
+    "under --output.",
+)
+@option(
+    "--include",
+    multiple=True,
+    metavar="GLOB",
+    help="With --recursive, convert only files matching GLOB (repeatable; "
+    "default: all supported documents).",
+)
+@option(
+    "--exclude",
+    multiple=True,
+    metavar="GLOB",
+    help="With --recursive, skip files and directories matching GLOB (repeatable).",
+)
+@option(
+    "--from-file",
+    "list_path",
+    type=ClickPath(dir_okay=False, path_type=Path, allow_dash=True),
+    metavar="PATH",
+    help="Read input paths from PATH (- for stdin), one per line, optionally "
+    "followed by a tab and an output path or format.",
+)
+@option(
+    "-0",
+    "--null",
+    is_flag=True,
+    help="--from-file entries are separated by NUL characters (find -print0).",
+)
+@option(
+    "--journal",
+    "journal_path",
+    type=ClickPath(dir_okay=False, path_type=Path),
+    help="Record job states in this SQLite file so the batch can be resumed.",
+)
+@option(
+    "--resume",
+    is_flag=True,
+    help="Skip jobs the journal records as done and retry unfinished ones "
+    f"(default journal: {JOURNAL_NAME} in the output directory).",
+)
+@option(
+    "--no-daemon",
+    is_flag=True,
+    envvar="CONVER_NO_DAEMON",
+    help="Convert in-process even if a `conver daemon` is running.",
+)
 @version_option(__version__, "-v", "--version")
-def cli(inputs, output, target, keep_open):
-    """Main CLI entry point."""
-    if not inputs:
+def convert_command(
+    inputs,
+    output,
+    from_format,
+    target,
+    keep_open,
+    jobs,
+    cache_dir,
+    cache_size,
+    no_cache,
+    timeout,
+    start_timeout,
+    timeout_per_mb,
+    retries,
+    retry_delay,
+    breaker_threshold,
+    probe_interval,
+    metrics_port,
+    metrics_textfile,
+    trace_path,
+    incremental,
+    watch_dir,
+    recursive,
+    include,
+    exclude,
+    list_path,
+    null,
+    journal_path,
+    resume,
+    no_daemon,
+):
+    """Convert INPUT documents (the default command)."""
+    cache = _make_cache(cache_dir, cache_size, no_cache)
+    timeout = _make_timeout(timeout, start_timeout, timeout_per_mb)
+    retry = _make_retry(retries, retry_delay)
+    breaker = _make_breaker(breaker_threshold, probe_interval)
+    _start_metrics(metrics_port, metrics_textfile)
+    _start_trace(trace_path)
+    # Jobs sent to a daemon would not be traced, and the daemon converts with
+    # its own settings
+    no_daemon = no_daemon or trace_path is not None or bool(_per_run_options())
+
+    # --- WATCH MODE ---
+    if watch_dir is not None:
+        if inputs:
+            raise UsageError("Cannot combine INPUT files with --watch.")
+        _watch(
+            watch_dir, output, target or "pdf", keep_open, jobs, cache, timeout, breaker
+        )
+        return
+
+    if not inputs and list_path is None:
         raise UsageError("No input files specified.")
 
+    if null and list_path is None:
+        raise UsageError("--null requires --from-file.")
+
+    if (include or exclude) and not recursive:
+        raise UsageError("--include and --exclude require --recursive.")
+
+    directories = [inp for inp in inputs if inp != Path("-") and inp.is_dir()]
+    if directories and not recursive:
+        raise UsageError(f"{directories[0]} is a directory; use --recursive.")
+
+    batch = len(inputs) > 1 or bool(directories) or list_path is not None
+    if not batch and (journal_path is not None or resume):
+        raise UsageError("--journal and --resume apply to multiple inputs.")
+
+    # --- PIPES (INPUT - or --output -) ---
+    if Path("-") in inputs or output == Path("-"):
+        if batch:
+            raise UsageError(
+                "Stdin input and stdout output take a single INPUT, "
+                "without --from-file."
+            )
+        if incremental:
+            raise UsageError("--incremental needs named input and output files.")
+        if output not in (None, Path("-")) and output.suffix and target is not None:
+            raise UsageError("Cannot use format flag when output is a file path.")
+        _convert_piped(
+            inputs[0],
+            output,
+            from_format,
+            target or "pdf",
+            keep_open=keep_open,
+            cache=cache,
+            timeout=timeout,
+            retry=retry,
+            breaker=breaker,
+        )
+        return
+
     # --- MULTIPLE INPUTS ---
-    if len(inputs) > 1:
-        if output is None:
+    if batch:
+        if output is None and inputs and not directories and list_path is None:
             output = _infer_common_parent(inputs)
+            if output is None:
+                raise UsageError("In batch mode, --output DIRECTORY is required.")
 
-        if output is None:
-            raise UsageError("In batch mode, --output DIRECTORY is required.")
+        if output is not None:
+            output = output.resolve()
 
-        output = output.resolve()
+            if output.exists() and not output.is_dir():
+                raise UsageError("--output must be a directory for multiple inputs.")
 
-        if output.exists() and not output.is_dir():
-            raise UsageError("--output must be a directory for multiple inputs.")
+            output.mkdir(parents=True, exist_ok=True)
 
-        output.mkdir(parents=True, exist_ok=True)
+        # Without --output, outputs land next to their inputs and the manifest
+        # and journal live in the first directory (or the working directory)
+        state_dir = output or (directories[0] if directories else Path.cwd())
+        state_dir = state_dir.resolve()
 
         if target is None:
             target = "pdf"
 
-        for idx, inp in enumerate(inputs):
-            # Keep Word open for all but the last file
-            effective_keep_open = (idx < len(inputs) - 1) or keep_open
+        # Jobs stream through batch requests on one Word session (or a pool of
+        # --jobs sessions); Word stays open between files and the end of the
+        # batch honors --keep-open
+        conflicts = []
+        pairs = _batch_pairs(inputs, output, target, include, exclude)
+        if list_path is not None:
+            pairs = chain(pairs, _listed_pairs(list_path, null, output, target))
+        pairs = _unique_outputs(pairs, conflicts)
+        exit_code = 0
+
+        manifest = None
+        if incremental:
+            manifest = Manifest(state_dir / MANIFEST_NAME)
+            for removed in manifest.prune():
+                echo(f"Removed: {removed}")
+            pairs = (
+                (inp, out)
+                for inp, out in pairs
+                if not manifest.is_up_to_date(inp, out, _format_options(out))
+            )
+
+        journal = None
+        if journal_path is not None or resume:
+            journal = Journal(journal_path or state_dir / JOURNAL_NAME)
+            if resume:
+                pairs = (
+                    (inp, out) for inp, out in pairs if not journal.is_done(inp, out)
+                )
+            pairs = _journaled(pairs, journal)
+
+        try:
+            outcomes = _convert_stream(
+                pairs,
+                keep_open,
+                jobs,
+                cache,
+                timeout,
+                retry,
+                breaker,
+                not no_daemon,
+                # A list still being written (stdin, a pipe) is converted as
+                # it is read rather than once a whole chunk has arrived
+                1 if _is_streamed(list_path) else 32,
+            )
+            for (inp, out), outcome in outcomes:
+                retried = retry.retried.pop(inp.absolute(), 0) if retry else 0
+                if isinstance(outcome, ConverError):
+                    _report_error(outcome)
+                    exit_code = outcome.error_code or 1
+                    if journal is not None:
+                        journal.record(
+                            inp,
+                            out,
+                            FAILED,
+                            outcome.error_code,
+                            str(outcome),
+                            retries=retried,
+                        )
+                else:
+                    echo(outcome)
+                    if journal is not None:
+                        journal.record(inp, out, DONE, retries=retried)
+                    if manifest is not None:
+                        manifest.record(inp, outcome, _format_options(out))
+        finally:
+            if journal is not None:
+                journal.close()
+            # Keep what was converted even if the run is interrupted
+            if manifest is not None:
+                manifest.save()
 
-            out_file = output / (inp.stem + f".{target}")
+        if conflicts and not exit_code:
+            exit_code = 1
 
-            try:
-                result = conver(inp, out_file, keep_open=effective_keep_open)
-                echo(result)
-            except ConverError as err:
-                fail("Error:", err, err.error_code or 1)
+        if exit_code:
+            sys.exit(exit_code)
 
     # --- SINGLE INPUT ---
     else:
@@ -108,8 +786,246 @@ def cli(inputs, output, target, keep_open):
 
             out_file = inp.with_suffix("." + target)
 
+        options = _format_options(out_file)
+        manifest = None
+        if incremental:
+            manifest = Manifest(out_file.absolute().parent / MANIFEST_NAME)
+            for removed in manifest.prune():
+                echo(f"Removed: {removed}")
+            if manifest.is_up_to_date(inp, out_file, options):
+                manifest.save()
+                return
+
+        [(_, result)] = _convert_stream(
+            [(inp, out_file)],
+            keep_open,
+            1,
+            cache,
+            timeout,
+            retry,
+            breaker,
+            not no_daemon,
+        )
+        if isinstance(result, ConverError):
+            if manifest is not None:
+                manifest.save()
+            _report_error(result)
+            sys.exit(result.error_code or 1)
+
+        echo(result)
+
+        if manifest is not None:
+            manifest.record(inp, result, options)
+            manifest.save()
+
+
+def _format_options(output_path):
+    """Options recorded in the manifest for a job writing `output_path`."""
+    return {"format": output_path.suffix.lstrip(".").lower()}
+
+
+def _convert_piped(inp, output, from_format, target, **options):
+    """Convert between stdin/stdout and named files, staging the data internally."""
+    to_stdout = output is None or output == Path("-")
+    if inp == Path("-"):
+        if from_format is None:
+            raise UsageError("Reading from stdin requires --from-format.")
+        if not to_stdout and not output.suffix:
+            raise UsageError("With INPUT -, --output must be a file path or -.")
+    elif not to_stdout and not output.suffix:
+        raise UsageError("--output must be a file path or -.")
+
+    with ExitStack() as stack:
+        if inp == Path("-"):
+            src, src_format = sys.stdin.buffer, from_format
+        else:
+            src, src_format = stack.enter_context(open(inp, "rb")), inp.suffix
+
+        if to_stdout:
+            dst, dst_format = sys.stdout.buffer, target
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            dst = stack.enter_context(open(output, "wb"))
+            dst_format = output.suffix
+
         try:
-            result = conver(inp, out_file, keep_open=keep_open)
-            echo(result)
+            conver_stream(src, dst, src_format, dst_format, **options)
         except ConverError as err:
-            fail("Error:", err, err.error_code or 1)
+            stack.close()
+            if not to_stdout:
+                output.unlink(missing_ok=True)
+            _report_error(err)
+            sys.exit(err.error_code or 1)
+        dst.flush()
+
+    if not to_stdout:
+        echo(output.resolve())
+
+
+def _report_error(error: ConverError):
+    attempts = f" (after {error.attempts} attempts)" if error.attempts > 1 else ""
+    echo(f"Error: {error}{attempts}", err=True)
+
+
+def _watch(watch_dir, output, target, keep_open, jobs, cache, timeout, breaker):
+    """Convert documents under `watch_dir` as they change, until interrupted."""
+    if output is not None and output.suffix:
+        raise UsageError("--output must be a directory in watch mode.")
+
+    echo(f"Watching {watch_dir.resolve()} (Ctrl-C to stop)", err=True)
+    events = watch(
+        watch_dir,
+        target=target,
+        output=output,
+        keep_open=keep_open,
+        max_workers=jobs,
+        cache=cache,
+        timeout=timeout,
+        breaker=breaker,
+    )
+    try:
+        for _, outcome in events:
+            if isinstance(outcome, ConverError):
+                echo(f"Error: {outcome}", err=True)
+            else:
+                echo(outcome)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        events.close()
+
+
+@cli.command("serve", context_settings=CONTEXT_SETTINGS)
+@option("--host", default="127.0.0.1", show_default=True, help="Address to bind.")
+@option(
+    "--port", type=IntRange(0, 65535), default=8080, show_default=True, help="Port."
+)
+@option(
+    "-j",
+    "--jobs",
+    type=IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parallel Word sessions (Windows).",
+)
+@option(
+    "--queue-size",
+    type=IntRange(min=0),
+    default=16,
+    show_default=True,
+    help="Jobs accepted beyond the running ones before answering 429.",
+)
+@option(
+    "--max-upload",
+    type=IntRange(min=1),
+    default=100,
+    show_default=True,
+    metavar="MB",
+    help="Largest accepted upload.",
+)
+@_cache_options
+@_timeout_options
+@_breaker_options
+@_metrics_options
+def serve_command(
+    host,
+    port,
+    jobs,
+    queue_size,
+    max_upload,
+    cache_dir,
+    cache_size,
+    no_cache,
+    timeout,
+    start_timeout,
+    timeout_per_mb,
+    breaker_threshold,
+    probe_interval,
+    metrics_port,
+    metrics_textfile,
+):
+    """Run an HTTP conversion server.
+
+    POST a document to /convert?to=FORMAT&filename=NAME to receive the
+    converted document. With a --metrics-* option, GET /metrics also serves
+    the conversion metrics.
+    """
+    _start_metrics(metrics_port, metrics_textfile)
+    echo(f"Serving on http://{host}:{port} (Ctrl-C to stop)", err=True)
+    serve(
+        host,
+        port,
+        workers=jobs,
+        queue_size=queue_size,
+        max_upload=max_upload * 1024 * 1024,
+        cache=_make_cache(cache_dir, cache_size, no_cache),
+        timeout=_make_timeout(timeout, start_timeout, timeout_per_mb),
+        breaker=_make_breaker(breaker_threshold, probe_interval),
+    )
+
+
+@cli.command("daemon", context_settings=CONTEXT_SETTINGS)
+@option(
+    "-j",
+    "--jobs",
+    type=IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parallel Word sessions (Windows).",
+)
+@option("-k", "--keep-open", is_flag=True, help="Keep Word open when stopping.")
+@_cache_options
+@_timeout_options
+@_retry_options
+@_breaker_options
+@_metrics_options
+@option("--stop", is_flag=True, help="Stop the running daemon.")
+@option("--status", is_flag=True, help="Report whether a daemon is running.")
+def daemon_command(
+    jobs,
+    keep_open,
+    cache_dir,
+    cache_size,
+    no_cache,
+    timeout,
+    start_timeout,
+    timeout_per_mb,
+    retries,
+    retry_delay,
+    breaker_threshold,
+    probe_interval,
+    metrics_port,
+    metrics_textfile,
+    stop,
+    status,
+):
+    """Keep warm Word sessions behind a local socket.
+
+    While it runs, `conver INPUT...` sends its jobs to the daemon instead of
+    starting Word itself. Runs in the foreground until Ctrl-C or --stop.
+    """
+    if status:
+        running = daemon.is_running()
+        echo(f"running at {daemon.daemon_address()}" if running else "not running")
+        sys.exit(0 if running else 1)
+
+    if stop:
+        if not daemon.stop_daemon():
+            fail("Error:", "no daemon is running.")
+        return
+
+    _start_metrics(metrics_port, metrics_textfile)
+    echo(f"Listening on {daemon.daemon_address()} (Ctrl-C to stop)", err=True)
+    try:
+        daemon.run_daemon(
+            max_workers=jobs,
+            keep_open=keep_open,
+            cache=_make_cache(cache_dir, cache_size, no_cache),
+            timeout=_make_timeout(timeout, start_timeout, timeout_per_mb),
+            retry=_make_retry(retries, retry_delay),
+            breaker=_make_breaker(breaker_threshold, probe_interval),
+        )
+    except RuntimeError as err:
+        fail("Error:", err)
+    except KeyboardInterrupt:
+        pass
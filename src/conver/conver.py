@@ -12,18 +12,49 @@ on failure.
 
 Successful conversion returns the resolved output path as a `Path` object.
 Errors are represented as subclasses of `ConverError`.
+
+`conver_batch()` converts many documents in one script request and one Word
+session, reporting a `Path` or a `ConverError` instance per job.
+`conver_iter()` does the same for a lazily consumed stream of jobs, yielding
+each job with its outcome as soon as it is known.
+
+Both accept an optional `ConversionCache`, consulted before Word is started,
+an optional `timeout` (seconds or a `Timeout`) after which a hung job is
+killed and reported as `ConversionTimeout`, an optional `RetryPolicy` for
+transient failures and an optional `CircuitBreaker` that fails jobs fast
+while Word cannot start.
 """
 
-from typing import Union, Tuple
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Union
 
-from ._convert import convert
+from . import hooks
+from ._convert import (
+    ConvertResult,
+    Timeout,
+    _default_worker,
+    _ScriptWorker,
+    convert,
+    convert_batch,
+)
+
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .cache import ConversionCache
+    from .retry import RetryPolicy
 
 
 class ConverError(Exception):
     def __init__(self, message, error_code=None):
         super().__init__(message)
         self.error_code = error_code
+        # Conversion attempts made before giving up (see RetryPolicy)
+        self.attempts = 1
+        # Seconds spent per phase by the last attempt (see ConvertResult)
+        self.timings = {}
 
 
 class InputFileNotFound(ConverError):
@@ -50,6 +81,10 @@ class PlatformNotSupported(ConverError):
     pass
 
 
+class ConversionTimeout(ConverError):
+    pass
+
+
 _ERROR_MAP = {
     1: IPCError,
     2: UnsupportedFormat,
@@ -57,6 +92,7 @@ _ERROR_MAP = {
     11: InputFileNotFound,
     21: WordStartError,
     31: SaveError,
+    41: ConversionTimeout,
     98: IPCError,
     99: PlatformNotSupported,
 }
@@ -99,6 +135,10 @@ def conver(
     input_path: Union[str, Path],
     output_path: Union[str, Path],
     keep_open: bool = False,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    retry: Optional["RetryPolicy"] = None,
+    breaker: Optional["CircuitBreaker"] = None,
 ) -> Path:
     """
     Convert a document to another format via the platform-level converter.
@@ -111,6 +151,18 @@ def conver(
         Target output path with desired extension.
     keep_open : bool, default=False
         Whether to keep Microsoft Word open after conversion.
+    cache : ConversionCache, optional
+        Cache consulted before starting Word; a hit materializes the cached
+        output without converting, a successful conversion is stored.
+    timeout : float or Timeout, optional
+        Seconds allowed for the conversion, or a `Timeout` with per-phase limits
+        optionally scaled by input size.
+    retry : RetryPolicy, optional
+        Convert again after errors the policy deems transient; the raised
+        error's `attempts` tells how many attempts were made.
+    breaker : CircuitBreaker, optional
+        Shared breaker that raises `WordStartError` without starting Word
+        while it is open.
 
     Returns
     -------
@@ -129,26 +181,458 @@ def conver(
         The document could not be saved in the target format.
     IPCError
         Communication with the script failed or produced invalid JSON.
+    ConversionTimeout
+        The conversion exceeded `timeout`; the script and the Word instance it
+        started were killed.
     PlatformNotSupported
         The current OS is not supported.
+
+    Every `ConverError` carries the seconds its last attempt spent in each
+    phase (Word start, open, save, ...) in its `timings` attribute.
+    """
+
+    return _conver(
+        input_path,
+        output_path,
+        keep_open,
+        cache=cache,
+        timeout=timeout,
+        retry=retry,
+        breaker=breaker,
+    )
+
+
+def _conver(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    keep_open: bool,
+    worker: Optional[_ScriptWorker] = None,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    retry: Optional["RetryPolicy"] = None,
+    breaker: Optional["CircuitBreaker"] = None,
+    job_id: Optional[int] = None,
+) -> Path:
+    """
+    Implementation of `conver()` on an optional dedicated script worker.
+
+    `job_id` is given by callers that already reported the job as queued.
     """
 
     in_path, out_path = _normalize_paths(input_path, output_path)
+    if hooks.enabled and job_id is None:
+        job_id = _queue_job(in_path, out_path)
 
     if not in_path.exists():
-        raise InputFileNotFound(f"Input file does not exist: {in_path}", 11)
+        error = InputFileNotFound(f"Input file does not exist: {in_path}", 11)
+        if hooks.enabled:
+            _emit_outcome(job_id, in_path, out_path, error)
+        raise error
+
+    if cache is not None:
+        key = cache.key(in_path, out_path)
+        if cache.fetch(key, out_path):
+            if hooks.enabled:
+                _emit_outcome(job_id, in_path, out_path, None)
+            return out_path
+
+    attempt = 1
+    while True:
+        if breaker is not None and not breaker.allow():
+            error = breaker.error()
+            if hooks.enabled:
+                _emit_outcome(job_id, in_path, out_path, error)
+        else:
+            try:
+                result = convert(
+                    input_path=str(in_path),
+                    output_path=str(out_path),
+                    keep_open=keep_open,
+                    worker=worker,
+                    timeout=timeout,
+                    job_id=job_id,
+                )
+            except BaseException:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            error = _error_from_result(result)
+            if breaker is not None:
+                breaker.record(error)
+
+        if error is None:
+            break
+        if retry is None or not retry.should_retry(error, attempt):
+            error.attempts = attempt
+            raise error
+        _wait_to_retry(retry, [(in_path, error)], attempt, worker)
+        attempt += 1
+
+    if cache is not None:
+        cache.store(key, out_path)
+
+    return out_path
 
-    result = convert(
+
+def conver_batch(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool = False,
+    max_workers: int = 1,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    retry: Optional["RetryPolicy"] = None,
+    breaker: Optional["CircuitBreaker"] = None,
+) -> List[Union[Path, ConverError]]:
+    """
+    Convert several documents in one script request and one Word session.
+
+    Paths are normalized exactly as in `conver()`. Jobs whose input file is
+    missing are reported without being sent to the script; a failed job does
+    not stop the remaining ones. With `max_workers` above one, jobs are instead
+    dispatched one by one to a pool of that many Word sessions (see
+    `ConverExecutor`).
+
+    Parameters
+    ----------
+    jobs : iterable of (input_path, output_path)
+        Source documents and their target paths.
+    keep_open : bool, default=False
+        Whether to keep Microsoft Word open after the whole batch.
+    max_workers : int, default=1
+        Number of Word sessions converting in parallel (Windows only; macOS
+        always converts one document at a time).
+    cache : ConversionCache, optional
+        Cache consulted per job before the batch is sent to Word.
+    timeout : float or Timeout, optional
+        Limits applied to each job, as in `conver()`; jobs are then sent to
+        Word one request at a time.
+    retry : RetryPolicy, optional
+        Jobs failing with a retryable error are converted again in a
+        follow-up batch after the policy's delay.
+    breaker : CircuitBreaker, optional
+        While open, jobs fail with `WordStartError` without being sent; a
+        probe job is sent alone before the rest of the batch.
+
+    Returns
+    -------
+    list of Path or ConverError
+        One entry per job, in order: the resolved output path on success, or
+        the exception instance describing why that job failed.
+    """
+
+    if max_workers > 1:
+        return _conver_parallel(
+            jobs, keep_open, max_workers, cache, timeout, retry, breaker
+        )
+
+    outcomes: List[Union[Path, ConverError, None]] = []
+    pending: List[Tuple[int, Path, Path, Optional[str], Optional[int]]] = []
+
+    for input_path, output_path in jobs:
+        in_path, out_path = _normalize_paths(input_path, output_path)
+        job_id = _queue_job(in_path, out_path) if hooks.enabled else None
+        if not in_path.exists():
+            error = InputFileNotFound(f"Input file does not exist: {in_path}", 11)
+            if hooks.enabled:
+                _emit_outcome(job_id, in_path, out_path, error)
+            outcomes.append(error)
+            continue
+
+        key = None
+        if cache is not None:
+            key = cache.key(in_path, out_path)
+            if cache.fetch(key, out_path):
+                if hooks.enabled:
+                    _emit_outcome(job_id, in_path, out_path, None)
+                outcomes.append(out_path)
+                continue
+
+        pending.append((len(outcomes), in_path, out_path, key, job_id))
+        outcomes.append(None)
+
+    attempt = 1
+    while pending:
+        errors = _batch_errors(
+            [(str(job[1]), str(job[2])) for job in pending],
+            keep_open,
+            timeout,
+            breaker,
+            [job[4] for job in pending],
+        )
+
+        retries = []
+        for job, error in zip(pending, errors):
+            idx, in_path, out_path, key, _ = job
+            if error is None:
+                if key is not None:
+                    cache.store(key, out_path)
+                outcomes[idx] = out_path
+            elif retry is not None and retry.should_retry(error, attempt):
+                retries.append((job, error))
+            else:
+                error.attempts = attempt
+                outcomes[idx] = error
+
+        pending = [job for job, _ in retries]
+        if pending:
+            _wait_to_retry(
+                retry, [(job[1], error) for job, error in retries], attempt, None
+            )
+            attempt += 1
+
+    return outcomes
+
+
+def conver_iter(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool = False,
+    max_workers: int = 1,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    retry: Optional["RetryPolicy"] = None,
+    breaker: Optional["CircuitBreaker"] = None,
+    chunk_size: int = 32,
+) -> Iterator[
+    Tuple[Tuple[Union[str, Path], Union[str, Path]], Union[Path, ConverError]]
+]:
+    """
+    Convert a stream of documents, yielding each job with its outcome.
+
+    Unlike `conver_batch()`, jobs are taken from `jobs` only shortly before they
+    are converted, so the iterable may be a generator that is still producing
+    paths, and memory use does not grow with the number of jobs. With a single
+    worker, jobs are sent to Word in batch requests of `chunk_size`; with more,
+    at most twice `max_workers` jobs are in flight on a `ConverExecutor` and
+    outcomes are yielded in completion order.
+
+    Parameters
+    ----------
+    jobs : iterable of (input_path, output_path)
+        Source documents and their target paths.
+    keep_open : bool, default=False
+        Whether to keep Microsoft Word open once the stream is exhausted.
+    max_workers : int, default=1
+        Number of Word sessions converting in parallel (Windows only).
+    cache : ConversionCache, optional
+        Cache consulted per job before it is sent to Word.
+    timeout : float or Timeout, optional
+        Limits applied to each job, as in `conver()`.
+    retry : RetryPolicy, optional
+        Policy for converting failed jobs again, as in `conver_batch()`.
+    breaker : CircuitBreaker, optional
+        Breaker failing jobs fast while Word cannot start.
+    chunk_size : int, default=32
+        Jobs per batch request with a single worker.
+
+    Yields
+    ------
+    tuple of ((input_path, output_path), Path or ConverError)
+        The job as given and its outcome, as in `conver_batch()`.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    if max_workers > 1:
+        yield from _conver_iter_parallel(
+            jobs, keep_open, max_workers, cache, timeout, retry, breaker
+        )
+        return
+
+    jobs = iter(jobs)
+    converted = False
+    try:
+        for chunk in iter(lambda: list(islice(jobs, chunk_size)), []):
+            # Word stays open between chunks; the end of the stream decides
+            outcomes = conver_batch(
+                chunk,
+                keep_open=True,
+                cache=cache,
+                timeout=timeout,
+                retry=retry,
+                breaker=breaker,
+            )
+            yield from zip(chunk, outcomes)
+            converted = True
+    finally:
+        worker = _default_worker()
+        if converted and not keep_open and worker is not None:
+            worker.close(quit_word=True)
+
+
+def _conver_iter_parallel(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool,
+    max_workers: int,
+    cache: Optional["ConversionCache"],
+    timeout: Union[float, Timeout, None],
+    retry: Optional["RetryPolicy"],
+    breaker: Optional["CircuitBreaker"],
+) -> Iterator[
+    Tuple[Tuple[Union[str, Path], Union[str, Path]], Union[Path, ConverError]]
+]:
+    """Run `conver_iter()` jobs on a pool of Word sessions."""
+
+    from .executor import ConverExecutor
+
+    with ConverExecutor(
+        max_workers,
+        keep_open=keep_open,
+        cache=cache,
+        timeout=timeout,
+        retry=retry,
+        breaker=breaker,
+    ) as executor:
+        in_flight = {}
+        for job in jobs:
+            if len(in_flight) >= 2 * max_workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), _future_outcome(future)
+            in_flight[executor.submit(executor.convert, *job)] = job
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), _future_outcome(future)
+
+
+def _conver_parallel(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    keep_open: bool,
+    max_workers: int,
+    cache: Optional["ConversionCache"],
+    timeout: Union[float, Timeout, None],
+    retry: Optional["RetryPolicy"],
+    breaker: Optional["CircuitBreaker"],
+) -> List[Union[Path, ConverError]]:
+    """Run `conver_batch()` jobs on a pool of Word sessions."""
+
+    from .executor import ConverExecutor
+
+    with ConverExecutor(
+        max_workers,
+        keep_open=keep_open,
+        cache=cache,
+        timeout=timeout,
+        retry=retry,
+        breaker=breaker,
+    ) as executor:
+        futures = [executor.submit(executor.convert, inp, out) for inp, out in jobs]
+
+    return [_future_outcome(future) for future in futures]
+
+
+def _batch_errors(
+    jobs: List[Tuple[str, str]],
+    keep_open: bool,
+    timeout: Union[float, Timeout, None],
+    breaker: Optional["CircuitBreaker"],
+    job_ids: Optional[List[Optional[int]]] = None,
+) -> List[Optional[ConverError]]:
+    """Run `convert_batch()`, letting `breaker` reject jobs or send a probe alone."""
+    job_ids = job_ids or [None] * len(jobs)
+    if breaker is None:
+        results = convert_batch(
+            jobs, keep_open=keep_open, timeout=timeout, job_ids=job_ids
+        )
+        return [_error_from_result(result) for result in results]
+
+    errors: List[Optional[ConverError]] = []
+    while len(errors) < len(jobs):
+        if not breaker.allow():
+            for (inp, out), job_id in zip(jobs[len(errors) :], job_ids[len(errors) :]):
+                error = breaker.error()
+                if hooks.enabled:
+                    _emit_outcome(job_id, inp, out, error)
+                errors.append(error)
+            break
+
+        # Lead with a single job, and continue one at a time after a start
+        # failure, so that the breaker opens before the batch reaches Word
+        rest = jobs[len(errors) :]
+        if not errors or breaker.probing or breaker.failures:
+            rest = rest[:1]
+        last = len(errors) + len(rest) == len(jobs)
+        try:
+            results = convert_batch(
+                rest,
+                keep_open=keep_open if last else True,
+                timeout=timeout,
+                job_ids=job_ids[len(errors) : len(errors) + len(rest)],
+            )
+        except BaseException:
+            breaker.record_failure()
+            raise
+        for result in results:
+            error = _error_from_result(result)
+            breaker.record(error)
+            errors.append(error)
+    return errors
+
+
+def _wait_to_retry(
+    retry: "RetryPolicy",
+    failures: List[Tuple[Path, ConverError]],
+    attempt: int,
+    worker: Optional[_ScriptWorker],
+) -> None:
+    """Report `failures` to the policy, restart Word if asked, then back off."""
+    delay = retry.delay(attempt)
+    for in_path, error in failures:
+        retry.on_retry(in_path, error, attempt, delay)
+
+    if retry.restart_word:
+        worker = worker or _default_worker()
+        if worker is not None:
+            worker.close(quit_word=True)
+
+    time.sleep(delay)
+
+
+def _queue_job(in_path: Path, out_path: Path) -> int:
+    """Give a new job its id and report it as queued to `conver.hooks`."""
+    job_id = hooks.new_job_id()
+    hooks.emit(hooks.QUEUED, job_id, input_path=str(in_path), output_path=str(out_path))
+    return job_id
+
+
+def _emit_outcome(
+    job_id: Optional[int],
+    in_path: Union[str, Path],
+    out_path: Union[str, Path],
+    error: Optional[ConverError],
+) -> None:
+    """Report a job settled without reaching Word (missing input, cache hit, ...)."""
+    hooks.emit(
+        hooks.FINISHED if error is None else hooks.FAILED,
+        job_id,
         input_path=str(in_path),
         output_path=str(out_path),
-        keep_open=keep_open,
+        error_code=0 if error is None else error.error_code,
+        message="OK" if error is None else str(error),
     )
 
+
+def _future_outcome(future: Future) -> Union[Path, ConverError]:
+    """Return a finished conversion's path or `ConverError`; re-raise anything else."""
+    error = future.exception()
+    if error is None:
+        return future.result()
+    if isinstance(error, ConverError):
+        return error
+    raise error
+
+
+def _error_from_result(result: ConvertResult) -> Optional[ConverError]:
+    """Map a failed `ConvertResult` to its `ConverError` subclass instance."""
     code = result.get("error_code", None)
     msg = result.get("message", "Unknown error")
 
     if code and code != 0:
         exc_class = _ERROR_MAP.get(code, ConverError)
-        raise exc_class(f"[{code}] {msg}", code)
+        error = exc_class(f"[{code}] {msg}", code)
+        error.timings = dict(result.get("timings") or {})
+        return error
 
-    return out_path
+    return None
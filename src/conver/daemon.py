@@ -0,0 +1,258 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Local conversion daemon and its client.
+
+`run_daemon()` keeps warm Word sessions alive behind a UNIX domain socket
+(a named pipe on Windows), so that short-lived `conver` invocations skip
+script materialization and Word startup. `delegate()` sends jobs to a running
+daemon and returns None when none is reachable, letting the caller fall back
+to in-process conversion.
+
+The socket lives in a per-user runtime directory with mode 0700, and every
+connection is authenticated with a random key stored next to it (mode 0600),
+so only the owning user can submit jobs; clients ignore a directory that is
+not owned by them with mode 0700. Jobs converted by the daemon use the daemon's
+own cache, timeout, retry and circuit breaker settings.
+
+PROTOCOL:
+    Requests and replies are dictionaries sent over `multiprocessing.connection`:
+    {"op": "ping"}                                    -> {"ok": True}
+    {"op": "stop"}                                    -> {"ok": True}
+    {"op": "convert", "jobs": [[input, output], ...]} -> {"ok": True, "results": [...]}
+    Each result is ["ok", <output path>] or
+    ["error", <error_code>, <message>, <attempts>, <timings>].
+"""
+
+import os
+import secrets
+import stat
+import sys
+import tempfile
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .breaker import CircuitBreaker
+from .cache import ConversionCache
+from .conver import _ERROR_MAP, ConverError, Timeout, _normalize_paths
+from .executor import ConverExecutor
+from .retry import RetryPolicy
+
+
+def runtime_dir() -> Path:
+    """Per-user directory holding the daemon socket and key."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()))
+        return base / "conver"
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "conver"
+    return Path(tempfile.gettempdir()) / f"conver-{os.getuid()}"
+
+
+def daemon_address() -> str:
+    """Socket path (POSIX) or pipe name (Windows) of this user's daemon."""
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\conver-{user}"
+    return str(runtime_dir() / "daemon.sock")
+
+
+def _key_path() -> Path:
+    return runtime_dir() / "daemon.key"
+
+
+def _is_private(directory: Path) -> bool:
+    """Whether `directory` is a directory owned by this user and closed to others."""
+    if sys.platform == "win32":
+        return True  # %LOCALAPPDATA% is per-user
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+    )
+
+
+def _connect() -> Optional[Connection]:
+    """Open an authenticated connection to the daemon, or None if unavailable."""
+    # Another user could have created a shared temp directory in advance
+    if not _is_private(runtime_dir()):
+        return None
+    try:
+        authkey = _key_path().read_bytes()
+    except OSError:
+        return None
+
+    address = daemon_address()
+    if sys.platform != "win32" and not os.path.exists(address):
+        return None
+
+    try:
+        return Client(address, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def _request(message: dict) -> Optional[dict]:
+    conn = _connect()
+    if conn is None:
+        return None
+    try:
+        with conn:
+            conn.send(message)
+            return conn.recv()
+    except (OSError, EOFError):
+        return None
+
+
+def is_running() -> bool:
+    """Whether a daemon answers on this user's address."""
+    reply = _request({"op": "ping"})
+    return bool(reply and reply.get("ok"))
+
+
+def stop_daemon() -> bool:
+    """Ask the running daemon to exit; False if none was running."""
+    reply = _request({"op": "stop"})
+    return bool(reply and reply.get("ok"))
+
+
+def delegate(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+) -> Optional[List[Union[Path, ConverError]]]:
+    """
+    Convert jobs on the running daemon.
+
+    Paths are normalized here, against the caller's working directory. Returns
+    one `Path` or `ConverError` per job like `conver_batch()`, or None when no
+    daemon is reachable and the caller should convert in-process.
+    """
+    pairs = [_normalize_paths(inp, out) for inp, out in jobs]
+    reply = _request(
+        {"op": "convert", "jobs": [[str(inp), str(out)] for inp, out in pairs]}
+    )
+    if not reply or not reply.get("ok"):
+        return None
+
+    outcomes: List[Union[Path, ConverError]] = []
+    for item in reply["results"]:
+        if item[0] == "ok":
+            outcomes.append(Path(item[1]))
+        else:
+            _, code, message, attempts, timings = item
+            error = _ERROR_MAP.get(code, ConverError)(message, code)
+            error.attempts = attempts
+            error.timings = timings
+            outcomes.append(error)
+    return outcomes
+
+
+def run_daemon(
+    max_workers: int = 1,
+    keep_open: bool = False,
+    cache: Optional[ConversionCache] = None,
+    timeout: Union[float, Timeout, None] = None,
+    retry: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> None:
+    """
+    Serve conversions on this user's socket until stopped.
+
+    Word sessions stay warm between requests; they are quit when the daemon
+    exits unless `keep_open` is set.
+    """
+    directory = runtime_dir()
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if sys.platform != "win32" and os.lstat(directory).st_uid == os.getuid():
+        os.chmod(directory, 0o700)
+    if not _is_private(directory):
+        raise RuntimeError(f"{directory} is not a private directory of this user")
+
+    if is_running():
+        raise RuntimeError(f"A conver daemon is already running at {daemon_address()}")
+
+    address = daemon_address()
+    if sys.platform != "win32" and os.path.exists(address):
+        os.unlink(address)  # stale socket from a daemon that did not exit cleanly
+
+    authkey = secrets.token_bytes(32)
+    key_path = _key_path()
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(authkey)
+
+    executor = ConverExecutor(
+        max_workers,
+        keep_open=keep_open,
+        cache=cache,
+        timeout=timeout,
+        retry=retry,
+        breaker=breaker,
+    )
+    stopping = threading.Event()
+
+    def handle(conn: Connection) -> None:
+        with conn:
+            try:
+                message = conn.recv()
+            except (OSError, EOFError):
+                return
+
+            op = message.get("op")
+            if op == "ping":
+                reply = {"ok": True}
+            elif op == "stop":
+                reply = {"ok": True}
+            elif op == "convert":
+                reply = {"ok": True, "results": _run_jobs(executor, message["jobs"])}
+            else:
+                reply = {"ok": False, "error": f"Unknown op: {op!r}"}
+
+            try:
+                conn.send(reply)
+            except OSError:
+                pass
+
+        if op == "stop":
+            stopping.set()
+            # Wake up the accept() call so the serving loop notices
+            try:
+                Client(address, authkey=authkey).close()
+            except (OSError, EOFError, AuthenticationError):
+                pass
+
+    listener = Listener(address, authkey=authkey)
+    try:
+        while not stopping.is_set():
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            if stopping.is_set():
+                conn.close()
+                break
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+    finally:
+        listener.close()
+        key_path.unlink(missing_ok=True)
+        executor.shutdown()
+
+
+def _run_jobs(executor: ConverExecutor, jobs: List[list]) -> List[list]:
+    futures = [executor.submit(executor.convert, inp, out) for inp, out in jobs]
+
+    results = []
+    for future in futures:
+        try:
+            results.append(["ok", str(future.result())])
+        except ConverError as err:
+            results.append(
+                ["error", err.error_code, str(err), err.attempts, err.timings]
+            )
+    return results
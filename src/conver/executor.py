@@ -0,0 +1,170 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+`concurrent.futures` executor for document conversions.
+
+`ConverExecutor` is a standard `Executor` (`submit`, `map`, `shutdown`) whose
+`convert` method converts one document. Submitted conversions are dispatched to
+whichever worker of its `WorkerPool` is free; every worker keeps its own Word
+session warm between jobs, and the executor quits Word when it shuts down.
+Futures resolve to the output `Path` or raise the mapped `ConverError`:
+
+    future = executor.submit(executor.convert, "a.docx", "a.pdf")
+    paths = executor.map(executor.convert, inputs, outputs)
+    await loop.run_in_executor(executor, executor.convert, "b.docx", "b.pdf")
+"""
+
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from . import hooks, metrics
+from ._convert import Timeout, WorkerPool
+from .conver import _conver, _normalize_paths, _queue_job
+
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .cache import ConversionCache
+    from .retry import RetryPolicy
+
+
+class ConverExecutor(Executor):
+    """
+    Convert documents at bounded parallelism through `concurrent.futures`.
+
+    Parameters
+    ----------
+    max_workers : int, default=1
+        Number of parallel Word sessions. On macOS, where Word runs as a single
+        instance, jobs are always converted one at a time.
+    keep_open : bool, default=False
+        Whether to leave Word running after the executor shuts down.
+    cache : ConversionCache, optional
+        Cache consulted for every job before it is sent to Word.
+    timeout : float or Timeout, optional
+        Limits applied to every job; a hung job fails with `ConversionTimeout`
+        and its worker is restarted for the next one.
+    retry : RetryPolicy, optional
+        Policy for converting failed jobs again on the same worker.
+    breaker : CircuitBreaker, optional
+        Breaker failing jobs fast while Word cannot start.
+
+    Examples
+    --------
+    >>> with ConverExecutor(max_workers=2) as executor:
+    ...     future = executor.submit(executor.convert, "a.docx", "a.pdf")
+    ...     future.result()
+    PosixPath('/path/to/a.pdf')
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        keep_open: bool = False,
+        cache: Optional["ConversionCache"] = None,
+        timeout: Union[float, Timeout, None] = None,
+        retry: Optional["RetryPolicy"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self._keep_open = keep_open
+        self._cache = cache
+        self._timeout = timeout
+        self._retry = retry
+        self._breaker = breaker
+        self._workers = WorkerPool(max_workers)
+        self._pool = ThreadPoolExecutor(self._workers.size, thread_name_prefix="conver")
+        # Jobs submitted and not finished, reported as the executor queue depth
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._queue_token = metrics.REGISTRY.add_queue(
+            "executor", lambda: self._pending
+        )
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        """
+        Schedule `fn(*args, **kwargs)` and return a future for its result.
+
+        Submit `self.convert` to convert a document on the executor's Word
+        sessions; other callables simply run on its threads.
+        """
+        if fn == self.convert:
+            # Report the job as queued now rather than once a thread runs it
+            fn = self._run
+            kwargs["job_id"] = self._queue(*args, **kwargs)
+        future = self._pool.submit(fn, *args, **kwargs)
+        with self._pending_lock:
+            self._pending += 1
+        future.add_done_callback(self._job_done)
+        return future
+
+    def convert(
+        self, input_path: Union[str, Path], output_path: Union[str, Path]
+    ) -> Path:
+        """
+        Convert `input_path` to `output_path` on a free Word session and return
+        the output path, raising the mapped `ConverError` on failure.
+
+        Pass it to `submit()`, `map()` or `loop.run_in_executor()`; called
+        directly, it blocks until a session is free.
+        """
+        return self._run(input_path, output_path, self._queue(input_path, output_path))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stop accepting jobs and release the Word sessions.
+
+        With `wait=False` the sessions are released in the background once the
+        running jobs have finished.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        metrics.REGISTRY.remove_queue(self._queue_token)
+        if wait:
+            self._close_workers()
+        else:
+            threading.Thread(
+                target=self._close_workers_after_pool, name="conver-shutdown"
+            ).start()
+
+    def _queue(
+        self, input_path: Union[str, Path], output_path: Union[str, Path]
+    ) -> Optional[int]:
+        if not hooks.enabled:
+            return None
+        return _queue_job(*_normalize_paths(input_path, output_path))
+
+    def _job_done(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _run(
+        self,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        job_id: Optional[int] = None,
+    ) -> Path:
+        # The executor owns the Word lifecycle: keep it open between jobs
+        with self._workers.acquire() as worker:
+            return _conver(
+                input_path,
+                output_path,
+                keep_open=True,
+                worker=worker,
+                cache=self._cache,
+                timeout=self._timeout,
+                retry=self._retry,
+                breaker=self._breaker,
+                job_id=job_id,
+            )
+
+    def _close_workers_after_pool(self) -> None:
+        self._pool.shutdown(wait=True)
+        self._close_workers()
+
+    def _close_workers(self) -> None:
+        self._workers.close(quit_word=not self._keep_open)
@@ -0,0 +1,194 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Lifecycle hooks for conversions.
+
+Functions registered with `register()` are called with a `HookEvent` at each
+step of every job converted in this process, whichever API converted it:
+
+    queued        a job was handed to conver (conver(), conver_batch(), ...)
+    spawned       a script process was started ("seconds": time to start it)
+    word_started  Word is ready in a session that had to start it
+    word_reused   Word is ready in a session that already had it running
+    phase_done    a phase of the job ended ("phase", "seconds"), see
+                  `ConvertResult["timings"]`
+    finished      the job (or one attempt of it) succeeded
+    failed        the job (or one attempt of it) failed ("error_code", "message")
+    word_quit     a session quit Word ("seconds" when measured)
+
+Every job gets a `job_id`, kept across retries, and script-side events carry
+the name of the `worker` that ran them. Phases are reported by the scripts
+with the job's result, so `phase_done` events of a job arrive together, just
+before its `finished` or `failed` event. Event times are on the
+`time.perf_counter()` clock.
+
+Hooks run synchronously on the converting thread and should return quickly;
+an exception raised by a hook is logged with its traceback on the
+"conver.hooks" logger and does not affect the conversion. While no hook is
+registered, conver skips building events altogether.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+
+QUEUED = "queued"
+SPAWNED = "spawned"
+WORD_STARTED = "word_started"
+WORD_REUSED = "word_reused"
+PHASE_DONE = "phase_done"
+FINISHED = "finished"
+FAILED = "failed"
+WORD_QUIT = "word_quit"
+
+EVENTS = (
+    QUEUED,
+    SPAWNED,
+    WORD_STARTED,
+    WORD_REUSED,
+    PHASE_DONE,
+    FINISHED,
+    FAILED,
+    WORD_QUIT,
+)
+
+
+class HookEvent(TypedDict):
+    event: str
+    time: float
+    job_id: Optional[int]
+    worker: Optional[str]
+    input: Optional[str]
+    output: Optional[str]
+    phase: Optional[str]
+    seconds: Optional[float]
+    timings: Dict[str, float]
+    error_code: Optional[int]
+    message: Optional[str]
+    pid: Optional[int]
+
+
+Hook = Callable[[HookEvent], Any]
+
+# Whether any hook is registered; checked before building an event
+enabled = False
+
+_hooks: Tuple[Tuple[Hook, Optional[FrozenSet[str]]], ...] = ()
+_lock = threading.Lock()
+_job_ids = itertools.count(1)
+
+logger = logging.getLogger(__name__)
+
+
+def register(hook: Hook, events: Optional[Iterable[str]] = None) -> Hook:
+    """
+    Call `hook(event)` for lifecycle events, or only for those named in `events`.
+
+    Returns `hook`, so that `register` can be used as a decorator.
+    """
+    global _hooks, enabled
+
+    names = None
+    if events is not None:
+        names = frozenset(events)
+        unknown = names.difference(EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown hook events: {', '.join(sorted(unknown))}")
+
+    with _lock:
+        _hooks = _hooks + ((hook, names),)
+        enabled = True
+    return hook
+
+
+def unregister(hook: Hook) -> None:
+    """
+    Stop calling `hook`; unknown hooks are ignored.
+
+    Hooks are compared by equality, so that a bound method such as
+    `recorder.record` can be unregistered by naming it again.
+    """
+    global _hooks, enabled
+
+    with _lock:
+        _hooks = tuple(entry for entry in _hooks if entry[0] != hook)
+        enabled = bool(_hooks)
+
+
+def new_job_id() -> int:
+    """Return a process-wide unique job id."""
+    return next(_job_ids)
+
+
+def emit(
+    event: str,
+    job_id: Optional[int] = None,
+    worker: Optional[str] = None,
+    input_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    phase: Optional[str] = None,
+    seconds: Optional[float] = None,
+    timings: Optional[Dict[str, float]] = None,
+    error_code: Optional[int] = None,
+    message: Optional[str] = None,
+    pid: Optional[int] = None,
+) -> None:
+    """Build a `HookEvent` and pass it to the hooks registered for it."""
+    record: HookEvent = {
+        "event": event,
+        "time": time.perf_counter(),
+        "job_id": job_id,
+        "worker": worker,
+        "input": input_path,
+        "output": output_path,
+        "phase": phase,
+        "seconds": seconds,
+        "timings": timings or {},
+        "error_code": error_code,
+        "message": message,
+        "pid": pid,
+    }
+    for hook, names in _hooks:
+        if names is None or event in names:
+            try:
+                hook(record)
+            except Exception:
+                logger.exception("conver hook %r failed on %r", hook, event)
+
+
+def emit_result(
+    result: Dict[str, Any], job_id: Optional[int], worker: Optional[str]
+) -> None:
+    """Emit the events describing a finished `ConvertResult`."""
+    timings = result.get("timings") or {}
+    paths = {"input_path": result.get("input"), "output_path": result.get("output")}
+
+    for phase, seconds in timings.items():
+        if phase not in ("spawn", "total"):
+            emit(PHASE_DONE, job_id, worker, phase=phase, seconds=seconds, **paths)
+    if "quit" in timings:
+        emit(WORD_QUIT, job_id, worker, seconds=timings["quit"])
+
+    code = result.get("error_code") or 0
+    emit(
+        FINISHED if code == 0 else FAILED,
+        job_id,
+        worker,
+        timings=timings,
+        error_code=code,
+        message=result.get("message"),
+        **paths,
+    )
@@ -0,0 +1,156 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Crash-resumable journal of batch conversion jobs.
+
+A `Journal` keeps one row per output file in an SQLite database opened in WAL
+mode, tracking the job's state as it moves from `running` to `done` or
+`failed`, together with its attempt count and last error. A batch interrupted
+by a crash, a reboot or Ctrl-C can then be resumed: jobs recorded as `done`
+(whose output still exists) are skipped, while jobs left `running` or `failed`
+are converted again.
+
+Transitions are buffered and written in a single transaction every
+`flush_every` records or `flush_interval` seconds, so journaling a large batch
+costs a handful of commits rather than two per document. A crash loses at most
+the unflushed tail, and those jobs are simply converted again on resume.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+JOURNAL_NAME = ".conver-journal.sqlite"
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    output TEXT PRIMARY KEY,
+    input TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error_code INTEGER,
+    message TEXT,
+    updated REAL NOT NULL
+)
+"""
+
+_UPSERT = """
+INSERT INTO jobs (output, input, state, attempts, error_code, message, updated)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (output) DO UPDATE SET
+    input = excluded.input,
+    state = excluded.state,
+    attempts = jobs.attempts + excluded.attempts,
+    error_code = excluded.error_code,
+    message = excluded.message,
+    updated = excluded.updated
+"""
+
+
+class Journal:
+    """
+    Job state journal stored in the SQLite database at `path`.
+
+    Parameters
+    ----------
+    path : Path
+        Database file; created if missing.
+    flush_every : int, default=256
+        Buffered transitions that trigger a write.
+    flush_interval : float, default=1.0
+        Seconds after which buffered transitions are written on the next record.
+
+    Use as a context manager, or call `close()` to write the remaining records.
+    The journal is not thread-safe; record from the thread consuming outcomes.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 256, flush_interval: float = 1.0):
+        if flush_every <= 0:
+            raise ValueError("flush_every must be greater than 0")
+
+        self.path = path
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._buffer: List[Tuple] = []
+        self._last_flush = time.monotonic()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL survives process crashes; only a power
+        # loss can drop the last commits, which resume converts again
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def is_done(self, input_path: Path, output_path: Path) -> bool:
+        """Whether a previous run converted `input_path` to the existing `output_path`."""
+        input_path, output_path = input_path.absolute(), output_path.absolute()
+        row = self._db.execute(
+            "SELECT input, state FROM jobs WHERE output = ?", (str(output_path),)
+        ).fetchone()
+        return row == (str(input_path), DONE) and output_path.exists()
+
+    def record(
+        self,
+        input_path: Path,
+        output_path: Path,
+        state: str,
+        error_code: Optional[int] = None,
+        message: Optional[str] = None,
+        retries: int = 0,
+    ) -> None:
+        """
+        Record a job's transition to `state` (`RUNNING`, `DONE` or `FAILED`).
+
+        Entering `RUNNING` counts an attempt, and `retries` adds attempts made
+        in between (see `RetryPolicy`). The record is buffered and may be
+        written later; see `flush()`.
+        """
+        if state not in (RUNNING, DONE, FAILED):
+            raise ValueError(f"Unknown job state: {state!r}")
+
+        self._buffer.append(
+            (
+                str(Path(output_path).absolute()),
+                str(Path(input_path).absolute()),
+                state,
+                (1 if state == RUNNING else 0) + retries,
+                error_code,
+                message,
+                time.time(),
+            )
+        )
+        if (
+            len(self._buffer) >= self._flush_every
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered transitions in one transaction."""
+        if self._buffer:
+            with self._db:
+                self._db.executemany(_UPSERT, self._buffer)
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush remaining transitions and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._db.close()
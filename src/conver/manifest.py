@@ -0,0 +1,141 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Build manifest for incremental (make-like) conversions.
+
+A `Manifest` remembers, per output file, the input it was converted from
+(path, size, mtime and content hash) and the conversion options. A job is up
+to date when its output still exists and the input is unchanged: size and
+mtime are compared first, and the content hash is only computed when the
+mtime moved but the size did not (e.g. a file touched or re-saved without
+edits). Entries whose input was deleted can be pruned together with their
+outputs.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, TypedDict
+
+MANIFEST_NAME = ".conver-manifest.json"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ManifestEntry(TypedDict):
+    input: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    output: str
+    options: Dict[str, Any]
+
+
+class Manifest:
+    """
+    Persistent record of converted inputs, stored as JSON at `path`.
+
+    Call `save()` after recording to write the changes back atomically.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._dirty = False
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            # An unreadable manifest only costs a full reconversion
+            return
+
+        if isinstance(data, dict):
+            self._entries = data.get("entries", {})
+
+    def is_up_to_date(
+        self, input_path: Path, output_path: Path, options: Dict[str, Any]
+    ) -> bool:
+        """Whether `output_path` was produced from the current `input_path`."""
+        input_path, output_path = input_path.absolute(), output_path.absolute()
+        entry = self._entries.get(str(output_path))
+
+        if (
+            entry is None
+            or entry["input"] != str(input_path)
+            or entry["options"] != options
+            or not output_path.exists()
+        ):
+            return False
+
+        try:
+            st = input_path.stat()
+        except FileNotFoundError:
+            return False
+
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns == entry["mtime_ns"]:
+            return True
+
+        if _file_sha256(input_path) != entry["sha256"]:
+            return False
+
+        # Same content under a new mtime: remember it to skip hashing next time
+        entry["mtime_ns"] = st.st_mtime_ns
+        self._dirty = True
+        return True
+
+    def record(
+        self, input_path: Path, output_path: Path, options: Dict[str, Any]
+    ) -> None:
+        """Remember that `output_path` was converted from `input_path`."""
+        input_path, output_path = input_path.absolute(), output_path.absolute()
+        st = input_path.stat()
+        self._entries[str(output_path)] = {
+            "input": str(input_path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": _file_sha256(input_path),
+            "output": str(output_path),
+            "options": options,
+        }
+        self._dirty = True
+
+    def prune(self) -> List[Path]:
+        """Delete outputs whose input no longer exists; returns the removed paths."""
+        removed = []
+        for key, entry in list(self._entries.items()):
+            if Path(entry["input"]).exists():
+                continue
+            output_path = Path(entry["output"])
+            output_path.unlink(missing_ok=True)
+            del self._entries[key]
+            removed.append(output_path)
+            self._dirty = True
+        return removed
+
+    def save(self) -> None:
+        """Write the manifest if it changed, replacing the file atomically."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": 1, "entries": self._entries}, indent=1),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,363 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Conversion metrics in OpenMetrics / Prometheus text format.
+
+Once `enable()` has been called, conver keeps in-process metrics for every job
+sent to Word, whichever API sent it:
+
+    conver_jobs_total{source, target, outcome, error_code}   counter
+    conver_phase_seconds{phase}                              histogram
+    conver_word_restarts_total                               counter
+    conver_cache_requests_total{result="hit" | "miss"}       counter
+    conver_queue_depth{queue="server" | "executor"}          gauge
+
+Phases are those of `ConvertResult["timings"]` ("word", "open", "save", ...,
+"total"). A Word restart is counted whenever a worker reports that it launched
+a new Word instance (its "word" event is "owned" and carries a pid not seen
+before), including relaunches inside a live worker after a `keep_open=False`
+job or a retry; one-shot `aconver()` scripts report no such events. Queue depths are read from the
+running `ConverServer` and `ConverExecutor` instances when the metrics are
+rendered.
+
+Recording is lock-free: a job only appends its result to a deque, and events
+are folded into the counters when the metrics are rendered (or once enough of
+them have accumulated). Expose the metrics with `start_http_server()` for
+Prometheus to scrape, or with `start_textfile_writer()` for the node_exporter
+textfile collector.
+"""
+
+import itertools
+import logging
+import math
+import os
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+# Pending events that make the recording thread fold them, if nobody else is
+_FOLD_AT = 1024
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics:
+    """
+    Registry of conversion metrics.
+
+    Parameters
+    ----------
+    buckets : tuple of float, default=DEFAULT_BUCKETS
+        Upper bounds, in seconds, of the phase latency histogram buckets.
+
+    The module-level `REGISTRY` is the instance conver records into; use
+    `enable()` rather than creating another one.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = False
+        self.buckets = tuple(sorted(buckets))
+        self._events: Deque[Tuple[str, Any]] = deque()
+        self._fold_lock = threading.Lock()
+        self._jobs: Dict[Tuple[str, str, str, str], int] = {}
+        # phase -> per-bucket counts, followed by the total count and sum
+        self._phases: Dict[str, List[float]] = {}
+        self._restarts = 0
+        self._cache = {"hit": 0, "miss": 0}
+        self._gauges: Dict[int, Tuple[str, Callable[[], float]]] = {}
+        self._gauge_ids = itertools.count()
+
+    def observe_result(self, result: Dict[str, Any]) -> None:
+        """Record a finished job from its `ConvertResult`."""
+        self._record(("job", result))
+
+    def observe_word_start(self) -> None:
+        """Record a Word instance launched by a worker."""
+        self._record(("word", None))
+
+    def observe_cache(self, hit: bool) -> None:
+        """Record a cache lookup."""
+        self._record(("cache", hit))
+
+    def add_queue(self, queue: str, depth: Callable[[], float]) -> int:
+        """
+        Report `depth()` as the `conver_queue_depth` of `queue` when rendering.
+
+        Depths of queues registered under the same name are added up; an
+        exception raised by `depth()` is logged and the queue left out. Returns
+        a token for `remove_queue()`.
+        """
+        token = next(self._gauge_ids)
+        self._gauges[token] = (queue, depth)
+        return token
+
+    def remove_queue(self, token: int) -> None:
+        """Stop reporting a queue registered with `add_queue()`."""
+        self._gauges.pop(token, None)
+
+    def render(self, openmetrics: bool = True) -> str:
+        """
+        Return the metrics as text.
+
+        With `openmetrics`, in the OpenMetrics 1.0 format; otherwise in the
+        Prometheus 0.0.4 text format read by the node_exporter textfile collector.
+        """
+        with self._fold_lock:
+            self._fold()
+            jobs = dict(self._jobs)
+            phases = {phase: list(values) for phase, values in self._phases.items()}
+            restarts = self._restarts
+            cache = dict(self._cache)
+
+        lines: List[str] = []
+        counter = _counter_header(openmetrics)
+
+        lines += counter("conver_jobs", "Conversion jobs by format pair and outcome.")
+        for (source, target, outcome, code), count in sorted(jobs.items()):
+            labels = _labels(
+                source=source, target=target, outcome=outcome, error_code=code
+            )
+            lines.append(f"conver_jobs_total{labels} {count}")
+
+        lines += [
+            "# TYPE conver_phase_seconds histogram",
+            "# HELP conver_phase_seconds Time spent in each phase of a job.",
+        ]
+        for phase, values in sorted(phases.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                labels = _labels(phase=phase, le=_number(bound))
+                lines.append(f"conver_phase_seconds_bucket{labels} {int(cumulative)}")
+            total, seconds = values[-2], values[-1]
+            labels = _labels(phase=phase, le="+Inf")
+            lines.append(f"conver_phase_seconds_bucket{labels} {int(total)}")
+            labels = _labels(phase=phase)
+            lines.append(f"conver_phase_seconds_count{labels} {int(total)}")
+            lines.append(f"conver_phase_seconds_sum{labels} {_number(seconds)}")
+
+        lines += counter("conver_word_restarts", "Word instances launched by workers.")
+        lines.append(f"conver_word_restarts_total {restarts}")
+
+        lines += counter("conver_cache_requests", "Conversion cache lookups.")
+        for result, count in sorted(cache.items()):
+            lines.append(f"conver_cache_requests_total{_labels(result=result)} {count}")
+
+        lines += [
+            "# TYPE conver_queue_depth gauge",
+            "# HELP conver_queue_depth Jobs waiting or running.",
+        ]
+        for queue, depth in sorted(self._queue_depths().items()):
+            lines.append(f"conver_queue_depth{_labels(queue=queue)} {_number(depth)}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Union[str, Path]) -> None:
+        """Atomically write the metrics to `path` in the Prometheus text format."""
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(openmetrics=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _record(self, event: Tuple[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self._events.append(event)
+        if len(self._events) >= _FOLD_AT and self._fold_lock.acquire(blocking=False):
+            try:
+                self._fold()
+            finally:
+                self._fold_lock.release()
+
+    def _fold(self) -> None:
+        """Fold pending events into the counters; the fold lock must be held."""
+        events = self._events
+        while events:
+            try:
+                kind, value = events.popleft()
+            except IndexError:
+                break
+            if kind == "cache":
+                self._cache["hit" if value else "miss"] += 1
+            elif kind == "word":
+                self._restarts += 1
+            else:
+                self._fold_result(value)
+
+    def _fold_result(self, result: Dict[str, Any]) -> None:
+        code = result.get("error_code") or 0
+        key = (
+            _extension(result.get("input")),
+            _extension(result.get("output")),
+            "success" if code == 0 else "error",
+            str(code),
+        )
+        self._jobs[key] = self._jobs.get(key, 0) + 1
+
+        timings = result.get("timings") or {}
+        for phase, seconds in timings.items():
+            values = self._phases.get(phase)
+            if values is None:
+                values = self._phases[phase] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    values[i] += 1
+                    break
+            values[-2] += 1
+            values[-1] += seconds
+
+    def _queue_depths(self) -> Dict[str, float]:
+        depths: Dict[str, float] = {}
+        for queue, depth in list(self._gauges.values()):
+            try:
+                depths[queue] = depths.get(queue, 0) + depth()
+            except Exception:
+                # A broken gauge must not take the other metrics down with it
+                logger.exception("conver queue depth of %r failed", queue)
+        return depths
+
+
+REGISTRY = Metrics()
+
+
+def enable() -> Metrics:
+    """Start recording conversion metrics into `REGISTRY`, and return it."""
+    REGISTRY.enabled = True
+    return REGISTRY
+
+
+def disable() -> None:
+    """Stop recording; metrics recorded so far are kept."""
+    REGISTRY.enabled = False
+
+
+def record_result(result: Dict[str, Any]) -> None:
+    """Record a finished job in `REGISTRY` when metrics are enabled."""
+    if REGISTRY.enabled:
+        REGISTRY.observe_result(result)
+
+
+def record_word_start() -> None:
+    """Record a Word instance launched by a worker when metrics are enabled."""
+    if REGISTRY.enabled:
+        REGISTRY.observe_word_start()
+
+
+def record_cache(hit: bool) -> None:
+    """Record a cache lookup in `REGISTRY` when metrics are enabled."""
+    if REGISTRY.enabled:
+        REGISTRY.observe_cache(hit)
+
+
+def start_http_server(
+    port: int, host: str = "127.0.0.1", registry: Optional[Metrics] = None
+) -> ThreadingHTTPServer:
+    """
+    Serve the metrics at http://host:port/metrics from a background thread.
+
+    Answers in the OpenMetrics format when the scraper accepts it, and in the
+    Prometheus text format otherwise. Call `shutdown()` on the returned server
+    to stop it.
+    """
+    registry = registry or REGISTRY
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            openmetrics = "application/openmetrics-text" in self.headers.get(
+                "Accept", ""
+            )
+            send_metrics(self, registry, openmetrics)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="conver-metrics", daemon=True
+    ).start()
+    return server
+
+
+def start_textfile_writer(
+    path: Union[str, Path],
+    interval: float = 15.0,
+    stop: Optional[threading.Event] = None,
+    registry: Optional[Metrics] = None,
+) -> threading.Thread:
+    """
+    Rewrite the metrics file at `path` every `interval` seconds.
+
+    Runs in a daemon thread until `stop` is set, then writes the file a last
+    time; the returned thread can be joined to wait for that final write.
+    """
+    registry = registry or REGISTRY
+    stop = stop or threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval):
+            registry.write_textfile(path)
+        registry.write_textfile(path)
+
+    registry.write_textfile(path)
+    thread = threading.Thread(target=run, name="conver-metrics-textfile", daemon=True)
+    thread.start()
+    return thread
+
+
+def send_metrics(
+    handler: BaseHTTPRequestHandler, registry: Metrics, openmetrics: bool
+) -> None:
+    """Answer an HTTP request with the rendered metrics."""
+    body = registry.render(openmetrics=openmetrics).encode("utf-8")
+    handler.send_response(200)
+    handler.send_header(
+        "Content-Type",
+        OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+    )
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def _counter_header(openmetrics: bool) -> Callable[[str, str], List[str]]:
+    # OpenMetrics names the counter family without the _total suffix of its
+    # sample; the Prometheus text format names it after the sample
+    def header(name: str, help_text: str) -> List[str]:
+        family = name if openmetrics else f"{name}_total"
+        return [f"# TYPE {family} counter", f"# HELP {family} {help_text}"]
+
+    return header
+
+
+def _labels(**labels: str) -> str:
+    escaped = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _extension(path: Optional[str]) -> str:
+    return os.path.splitext(path or "")[1].lstrip(".").lower()
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and not math.isfinite(value):
+        return "+Inf" if value > 0 else ("-Inf" if value < 0 else "NaN")
+    return repr(float(value)) if isinstance(value, float) else str(value)
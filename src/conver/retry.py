@@ -0,0 +1,92 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Retry policy for failed conversions.
+
+Some failures are transient: Word occasionally fails to start (`WordStartError`)
+or to save (`SaveError`) and succeeds on a second attempt. A `RetryPolicy`
+passed as `retry=` to `conver()`, `conver_batch()`, `conver_iter()` or
+`ConverExecutor` converts such jobs again, waiting an exponentially growing,
+jittered delay between attempts and optionally restarting Word first.
+
+The decision is made per exception class through `retry_on`; subclass the
+policy and override `should_retry()`, `delay()` or `on_retry()` for finer
+control. A job's final `ConverError` carries the number of attempts made in
+its `attempts` attribute.
+"""
+
+import random
+from pathlib import Path
+from typing import Iterable, Type
+
+from .conver import ConverError, ConversionTimeout, SaveError, WordStartError
+
+
+class RetryPolicy:
+    """
+    When and how to convert a failed job again.
+
+    Parameters
+    ----------
+    max_attempts : int, default=3
+        Attempts per job, including the first one.
+    initial_delay : float, default=1.0
+        Seconds before the second attempt.
+    multiplier : float, default=2.0
+        Factor applied to the delay after every attempt.
+    max_delay : float, default=30.0
+        Upper bound for a single delay.
+    jitter : float, default=0.5
+        Fraction of each delay that is randomized, so that parallel workers
+        do not retry in lockstep; 0 disables jitter, 1 is "full jitter".
+    retry_on : iterable of ConverError subclasses
+        Errors worth retrying; by default `WordStartError`, `SaveError` and
+        `ConversionTimeout`.
+    restart_word : bool, default=True
+        Whether to quit Word (and restart its script worker) before retrying.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_delay: float = 1.0,
+        multiplier: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        retry_on: Iterable[Type[ConverError]] = (
+            WordStartError,
+            SaveError,
+            ConversionTimeout,
+        ),
+        restart_word: bool = True,
+    ):
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than 0")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.restart_word = restart_word
+
+    def should_retry(self, error: ConverError, attempt: int) -> bool:
+        """Whether to retry after `error` ended attempt number `attempt`."""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after attempt number `attempt` failed."""
+        delay = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        return delay * (1 - self.jitter * random.random())
+
+    def on_retry(
+        self, input_path: Path, error: ConverError, attempt: int, delay: float
+    ) -> None:
+        """Called before waiting `delay` seconds to retry `input_path`; no-op."""
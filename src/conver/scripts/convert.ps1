@@ -7,6 +7,32 @@ USAGE:
     powershell -ExecutionPolicy Bypass -File convert.ps1 -jsonArgs `
         "{\"input\": \"<inputPath>\", \"output\": \"<outputPath>\", \"keepOpen\": true | false}"
 
+    powershell -ExecutionPolicy Bypass -File convert.ps1 -jsonArgs `
+        "[{\"input\": \"<a>\", \"output\": \"<b>\"}, {\"input\": \"<c>\", \"output\": \"<d>\"}]"
+
+    powershell -NoProfile -ExecutionPolicy Bypass -File convert.ps1 -worker
+
+BATCH MODE:
+    The JSON argument (or a worker line) may also be an array of jobs. All jobs run in
+    one Word session and the reply is an array with one status object per job, in order;
+    a failed job does not stop the rest. Word is quit after the batch unless the last
+    job sets "keepOpen": true. In worker mode, each job's status object is also
+    reported as soon as the job ends, as {"event": "result", "index": <i>, "result":
+    {...}}, so that a client can keep the results of a batch the script did not finish.
+
+WORKER MODE:
+    With -worker the script stays resident and reads one JSON job per line from
+    stdin, writing one compressed JSON result per line to stdout (same schema as
+    below). The Word COM object is created once and reused across jobs; a job with
+    "keepOpen": false still quits Word after it succeeds. The control line
+    {"command": "quit"} quits the worker's Word instance and replies with a success
+    status. The worker exits on EOF. Before each result, the worker reports
+    {"event": "word", "pid": <pid>, "owned": true | false} once Word is ready; "owned"
+    is true when the worker created that instance, so that the client can kill that
+    WINWORD.EXE if the job hangs ("pid" is null for a reattached instance, or when the
+    new instance's process cannot be told apart from another worker's). Clients skip
+    lines carrying an "event" key.
+
 RECOMMENDED PATHS:
     Use paths like "C:\Users\UserName\Downloads\" for both <inputPath> and <outputPath>.
 
@@ -24,6 +50,12 @@ SUPPORTED FORMATS:
     - Plain Text (.txt)         # Plain text format without any formatting
     - HTML (.html)              # Web page format for viewing in browsers
 
+WORD INSTANCES:
+    Every Word instance created by the script is tagged with the -owner caption
+    (default "conver"). When an instance left running by "keepOpen": true is found in
+    the running object table with that caption, the script attaches to it instead of
+    starting another WINWORD.EXE.
+
 PARAMETERS:
     - input: "<path to input file>"     # Path to the input file (required)
     - output: "<path to output file>"   # Path to the output file (required)
@@ -36,9 +68,16 @@ STATUS SCHEMA (JSON Output):
         "input": "<path to input file>",      # Path to the input file
         "output": "<path to output file>",    # Path to the output file (null if error)
         "message": "OK" | "<error message>",  # "OK" on success or specific error message
-        "error_code": 0 | <error code>        # 0 for success; specific code for different errors
+        "error_code": 0 | <error code>,       # 0 for success; specific code for different errors
+        "timings": {"<phase>": <seconds>}     # Time spent in each phase the job reached
     }
 
+TIMINGS:
+    Phases are "script" (from script load to the first job of the process), "word"
+    (creating or attaching to Word), "open", "save", "close" and "quit" (quitting Word
+    after the job, or after the last job of a batch). Word is quit before the result
+    is written, so that the time it takes is part of the reported job.
+
 ERROR CODES:
     0   - Success
     1   - Incorrect JSON format or missing required fields
@@ -50,9 +89,14 @@ ERROR CODES:
 #>
 
 param (
-    [string]$jsonArgs
+    [string]$jsonArgs,
+    [switch]$worker,
+    [string]$owner = "conver"
 )
 
+# Running since script load; reported as the "script" phase of the first job
+$script:scriptLoaded = [System.Diagnostics.Stopwatch]::StartNew()
+
 # Supported file formats and corresponding codes for Microsoft Word
 $formatCodes = @{
     "docx" = 16
@@ -71,121 +115,337 @@ function Get-FormatCodeByExtension {
     return $formatCodes[$extension] -as [int]
 }
 
-# Parse JSON input
-try {
-    $params = $jsonArgs | ConvertFrom-Json
-} catch {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $null
-        output = $null
-        message = "Invalid JSON format."
-        error_code = 1
-    })
-    exit 1
+# Build a status object matching the STATUS SCHEMA
+function New-Result {
+    param ($inputPath, $outputPath, $message, $errorCode)
+    $status = if ($errorCode -eq 0) { "success" } else { "error" }
+    return @{
+        status = $status
+        input = $inputPath
+        output = $outputPath
+        message = $message
+        error_code = $errorCode
+        timings = @{}
+    }
 }
 
-$inputPath = $params.input
-$outputPath = $params.output
-$keepOpen = $params.keepOpen -eq $true
+# Seconds measured by a stopwatch, to the millisecond
+function Get-ElapsedSeconds {
+    param ($watch)
+    return [Math]::Round($watch.Elapsed.TotalSeconds, 3)
+}
 
-# Validate required parameters
-if (-not $inputPath -or -not $outputPath) {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $inputPath
-        output = $outputPath
-        message = "Both 'input' and 'output' fields are required in JSON."
-        error_code = 1
-    })
-    exit 1
+# Return the running Word instance registered in the running object table if this
+# script created it (tagged with the owner caption), otherwise $null. A user's own
+# interactive Word is never reused.
+function Get-OwnedWordApplication {
+    try {
+        $word = [System.Runtime.InteropServices.Marshal]::GetActiveObject("Word.Application")
+    } catch {
+        return $null
+    }
+    try {
+        if ($word.Caption -eq $owner -and -not $word.Visible) {
+            return $word
+        }
+    } catch { }
+    return $null
 }
 
-# Check input file format support
-$inputExtension = [System.IO.Path]::GetExtension($inputPath).TrimStart('.').ToLower()
-$inputFormat = Get-FormatCodeByExtension -extension $inputExtension
+# Process ids of the running WINWORD.EXE instances
+function Get-WordProcessIds {
+    return @(Get-Process -Name WINWORD -ErrorAction SilentlyContinue | ForEach-Object { $_.Id })
+}
 
-if (-not $inputFormat) {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $inputPath
-        output = $null
-        message = "The input file format '$inputExtension' is unsupported."
-        error_code = 2
-    })
-    exit 2
+# Process id owning the top-level Word window titled $caption, or $null. Word's main
+# window (class "OpusApp") carries the application caption, which is unique per owner.
+function Get-WordProcessIdByCaption {
+    param ($caption)
+    try {
+        if (-not ("Conver.Win32" -as [type])) {
+            Add-Type -Namespace Conver -Name Win32 -MemberDefinition @'
+[DllImport("user32.dll", CharSet = CharSet.Unicode)]
+public static extern IntPtr FindWindow(string className, string windowName);
+[DllImport("user32.dll")]
+public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint processId);
+'@
+        }
+        $hwnd = [Conver.Win32]::FindWindow("OpusApp", $caption)
+        if ($hwnd -eq [IntPtr]::Zero) {
+            return $null
+        }
+        $processId = [uint32]0
+        $null = [Conver.Win32]::GetWindowThreadProcessId($hwnd, [ref]$processId)
+        if ($processId -eq 0) {
+            return $null
+        }
+        return [int]$processId
+    } catch {
+        return $null
+    }
 }
 
-# Check output file format support
-$outputExtension = [System.IO.Path]::GetExtension($outputPath).TrimStart('.').ToLower()
-$outputFormat = Get-FormatCodeByExtension -extension $outputExtension
+# Pid of the Word instance just created as $word: the process owning its window,
+# provided that process is new since $before. Without a window, the only new
+# WINWORD.EXE; $null rather than a guess when several workers started Word at once.
+function Get-CreatedWordProcessId {
+    param ($word, $before)
+    $created = @(Get-WordProcessIds | Where-Object { $before -notcontains $_ })
+    $windowPid = Get-WordProcessIdByCaption $word.Caption
+    if ($null -ne $windowPid) {
+        if ($created -contains $windowPid) {
+            return $windowPid
+        }
+        return $null
+    }
+    if ($created.Count -eq 1) {
+        return $created[0]
+    }
+    return $null
+}
 
-if ($outputFormat -eq $null) {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $inputPath
-        output = $outputPath
-        message = "The output file format '$outputExtension' is unsupported."
-        error_code = 3
-    })
-    exit 3
+# Report a progress event to the client in worker mode
+function Write-WorkerEvent {
+    param ($session, $event)
+    if ($session.events) {
+        [Console]::Out.WriteLine((ConvertTo-Json -Compress -Depth 4 $event))
+        [Console]::Out.Flush()
+    }
 }
 
-# Initialize Word COM object with error handling
-try {
-    $word = New-Object -ComObject Word.Application -ErrorAction Stop
-} catch {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $inputPath
-        output = $outputPath
-        message = "Microsoft Word is not installed or cannot be started."
-        error_code = 21
-    })
-    exit 21
+# Return the session's Word COM object: reuse the live one, reattach to a kept-open
+# instance owned by this script, or create (and tag) a new instance
+function Get-WordApplication {
+    param ($session)
+    if ($null -ne $session.word) {
+        try {
+            $null = $session.word.Version
+            return $session.word
+        } catch {
+            $session.word = $null
+        }
+    }
+
+    $word = Get-OwnedWordApplication
+    $session.pid = $null
+    $session.launched = $false
+    if ($null -eq $word) {
+        $before = Get-WordProcessIds
+        $word = New-Object -ComObject Word.Application -ErrorAction Stop
+        $word.Visible = $false
+        $word.Caption = $owner
+        $session.pid = Get-CreatedWordProcessId $word $before
+        $session.launched = $true
+    }
+    $session.word = $word
+    return $session.word
 }
 
-$word.Visible = $false
-$wordStartedByScript = $false
+# Quit Word and forget it, so the next job starts a fresh instance
+function Close-WordApplication {
+    param ($session)
+    if ($null -ne $session.word) {
+        try { $session.word.Quit() } catch { }
+        $session.word = $null
+        $session.pid = $null
+        $session.launched = $false
+    }
+}
+
+# Quit Word, recording the time it took as the "quit" phase of $result
+function Close-WordApplicationTimed {
+    param ($session, $result)
+    $watch = [System.Diagnostics.Stopwatch]::StartNew()
+    Close-WordApplication $session
+    $result.timings.quit = Get-ElapsedSeconds $watch
+}
+
+# Convert a single document described by $params; returns a status object
+function Convert-Document {
+    param ($params, $session)
+
+    $timings = @{}
+    if ($null -ne $script:scriptLoaded) {
+        $timings.script = Get-ElapsedSeconds $script:scriptLoaded
+        $script:scriptLoaded = $null
+    }
+    $result = Convert-DocumentPhases $params $session $timings
+    $result.timings = $timings
+    return $result
+}
+
+# Body of Convert-Document, recording each phase it reaches in $timings
+function Convert-DocumentPhases {
+    param ($params, $session, $timings)
+
+    $inputPath = $params.input
+    $outputPath = $params.output
+
+    # Validate required parameters
+    if (-not $inputPath -or -not $outputPath) {
+        return New-Result $inputPath $outputPath "Both 'input' and 'output' fields are required in JSON." 1
+    }
 
+    # Check input file format support ("doc" maps to code 0, so compare with $null)
+    $inputExtension = [System.IO.Path]::GetExtension($inputPath).TrimStart('.').ToLower()
+    $inputFormat = Get-FormatCodeByExtension -extension $inputExtension
+
+    if ($null -eq $inputFormat) {
+        return New-Result $inputPath $null "The input file format '$inputExtension' is unsupported." 2
+    }
+
+    # Check output file format support
+    $outputExtension = [System.IO.Path]::GetExtension($outputPath).TrimStart('.').ToLower()
+    $outputFormat = Get-FormatCodeByExtension -extension $outputExtension
+
+    if ($null -eq $outputFormat) {
+        return New-Result $inputPath $outputPath "The output file format '$outputExtension' is unsupported." 3
+    }
+
+    # Initialize Word COM object with error handling
+    $watch = [System.Diagnostics.Stopwatch]::StartNew()
+    try {
+        $word = Get-WordApplication $session
+    } catch {
+        $timings.word = Get-ElapsedSeconds $watch
+        return New-Result $inputPath $outputPath "Microsoft Word is not installed or cannot be started." 21
+    }
+    $timings.word = Get-ElapsedSeconds $watch
+    Write-WorkerEvent $session @{ event = "word"; pid = $session.pid; owned = [bool]$session.launched }
+
+    try {
+        # Check if input file exists
+        if (-not (Test-Path -Path $inputPath)) {
+            return New-Result $inputPath $null "File '$inputPath' not found." 11
+        }
+
+        # Open and convert the document
+        $watch.Restart()
+        $doc = $word.Documents.Open($inputPath)
+        $timings.open = Get-ElapsedSeconds $watch
+
+        $watch.Restart()
+        $doc.SaveAs([ref]$outputPath, [ref]$outputFormat)
+        $timings.save = Get-ElapsedSeconds $watch
+
+        $watch.Restart()
+        $doc.Close()
+        $timings.close = Get-ElapsedSeconds $watch
+    } catch {
+        return New-Result $inputPath $outputPath $_.Exception.Message 31
+    }
+
+    return New-Result $inputPath $outputPath "OK" 0
+}
+
+# Close Word after a successful job unless keepOpen is explicitly set to true
+function Complete-Job {
+    param ($params, $result, $session)
+    if ($result.error_code -eq 0 -and $params.keepOpen -ne $true) {
+        Close-WordApplicationTimed $session $result
+    }
+}
+
+# Convert an array of jobs in one Word session; returns an array of status objects
+function Convert-Batch {
+    param ($jobs, $session)
+
+    $results = New-Object System.Collections.ArrayList
+    foreach ($job in $jobs) {
+        if ($job -isnot [System.Management.Automation.PSCustomObject]) {
+            $result = New-Result $null $null "Each batch item must be a JSON object." 1
+        } else {
+            $result = Convert-Document $job $session
+        }
+        Write-WorkerEvent $session @{ event = "result"; index = $results.Count; result = $result }
+        $null = $results.Add($result)
+    }
+
+    $last = if ($jobs.Count -gt 0) { $jobs[-1] } else { $null }
+    if (-not ($last -and $last.keepOpen -eq $true)) {
+        if ($results.Count -gt 0) {
+            Close-WordApplicationTimed $session $results[$results.Count - 1]
+        } else {
+            Close-WordApplication $session
+        }
+    }
+
+    # The leading comma stops PowerShell from unrolling the array on return
+    return ,$results.ToArray()
+}
+
+# Serve line-delimited JSON jobs from stdin until EOF
+function Invoke-Worker {
+    try {
+        [Console]::OutputEncoding = New-Object System.Text.UTF8Encoding $false
+    } catch { }
+
+    $session = @{ word = $null; pid = $null; launched = $false; events = $true }
+
+    while ($null -ne ($line = [Console]::In.ReadLine())) {
+        if (-not $line.Trim()) {
+            continue
+        }
+
+        try {
+            $params = $line | ConvertFrom-Json
+        } catch {
+            [Console]::Out.WriteLine((ConvertTo-Json -Compress (New-Result $null $null "Invalid JSON format." 1)))
+            [Console]::Out.Flush()
+            continue
+        }
+
+        if ($params -is [array]) {
+            $results = Convert-Batch $params $session
+            [Console]::Out.WriteLine((ConvertTo-Json -Compress -Depth 4 -InputObject $results))
+            [Console]::Out.Flush()
+            continue
+        }
+
+        if ($params.command -eq "quit") {
+            $result = New-Result $null $null "OK" 0
+            Close-WordApplicationTimed $session $result
+            [Console]::Out.WriteLine((ConvertTo-Json -Compress -Depth 4 $result))
+            [Console]::Out.Flush()
+            continue
+        }
+
+        $result = Convert-Document $params $session
+        Complete-Job $params $result $session
+        [Console]::Out.WriteLine((ConvertTo-Json -Compress -Depth 4 $result))
+        [Console]::Out.Flush()
+    }
+}
+
+if ($worker) {
+    Invoke-Worker
+    exit 0
+}
+
+# Parse JSON input
 try {
-    # Check if input file exists
-    if (-not (Test-Path -Path $inputPath)) {
-        Write-Output (ConvertTo-Json @{
-            status = "error"
-            input = $inputPath
-            output = $null
-            message = "File '$inputPath' not found."
-            error_code = 11
-        })
-        exit 11
-    }
-
-    # Open and convert the document
-    $doc = $word.Documents.Open($inputPath)
-    $doc.SaveAs([ref]$outputPath, [ref]$outputFormat)
-    $doc.Close()
+    $params = $jsonArgs | ConvertFrom-Json
 } catch {
-    Write-Output (ConvertTo-Json @{
-        status = "error"
-        input = $inputPath
-        output = $outputPath
-        message = $_.Exception.Message
-        error_code = 31
-    })
-    exit 31
-}
-
-# Success message
-Write-Output (ConvertTo-Json @{
-    status = "success"
-    input = $inputPath
-    output = $outputPath
-    message = "OK"
-    error_code = 0
-})
-
-# Close Word if opened by the script and keepOpen is false
-if (-not $keepOpen) {
-    $word.Quit()
+    Write-Output (ConvertTo-Json (New-Result $null $null "Invalid JSON format." 1))
+    exit 1
+}
+
+$session = @{ word = $null }
+
+if ($params -is [array]) {
+    $results = Convert-Batch $params $session
+    Write-Output (ConvertTo-Json -Depth 4 -InputObject $results)
+    $failed = $results | Where-Object { $_.error_code -ne 0 } | Select-Object -First 1
+    if ($failed) {
+        exit $failed.error_code
+    }
+    exit 0
+}
+
+$result = Convert-Document $params $session
+Complete-Job $params $result $session
+
+Write-Output (ConvertTo-Json -Depth 4 $result)
+if ($result.error_code -ne 0) {
+    exit $result.error_code
 }
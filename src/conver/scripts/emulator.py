@@ -0,0 +1,411 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+OVERVIEW:
+    Stand-in for convert.jxa / convert.ps1 that needs neither Word nor macOS or
+    Windows. It speaks the same JSON protocol as the real scripts, in one-shot and
+    worker mode, including batch arrays, the {"command": "quit"} control line,
+    {"event": "word", ...} and {"event": "result", ...} lines and per-phase
+    "timings", and it sleeps for the time each phase is configured to take. conver
+    uses it instead of the platform script when the environment variable
+    CONVER_BACKEND is set to "emulator", so the batch, retry, timeout and
+    concurrency paths can be tested and load-tested on any OS.
+
+USAGE:
+    python emulator.py '{"input": "a.docx", "output": "a.pdf", "keepOpen": false}'
+    python emulator.py -jsonArgs '[{"input": "a.docx", "output": "a.pdf"}, ...]'
+    python emulator.py --worker [--owner TAG]
+
+    Both the JXA ("--worker") and the PowerShell ("-worker", "-owner", "-jsonArgs")
+    spellings are accepted. The script depends on the standard library only.
+
+CONFIGURATION:
+    CONVER_EMULATOR holds a JSON object, or the path of a file containing one.
+    Durations are seconds, given as a number or as a distribution:
+        {"uniform": [low, high]}      {"normal": [mean, stddev]}
+        {"lognormal": [median, sigma]}  {"exponential": mean}
+    Negative samples count as 0. Keys (defaults in brackets):
+        script [0.05]       script startup, reported on the first job of a process
+        cold_start [0.5]    launching Word when it is not running
+        attach [0.01]       attaching to a running Word
+        open [0.05], save [0.1], close [0.01], quit [0.1]
+        per_mb [0.0]        seconds added to "save" per MiB of input
+        time_scale [1.0]    factor applied to every sleep (0 reports the sampled
+                            timings without sleeping)
+        word_running [false]  whether Word is already running when the script starts
+        fail_rate [0.0]     probability that saving fails with fail_code [31]
+        start_fail_rate [0.0]  probability that launching Word fails (error 21)
+        hang_rate [0.0]     probability that a job never finishes (for timeouts)
+        crash_rate [0.0]    probability that the process exits in the middle of a job
+        fail_match, hang_match, crash_match [null]
+                            glob matched against the input file name that makes
+                            every matching job fail, hang or crash
+        output ["copy"]     "copy" writes the input bytes to the output path, "stub"
+                            a small placeholder document, "none" nothing
+        seed [null]         seed for reproducible runs (combined with the worker
+                            number from the owner tag, so that pool workers draw
+                            different samples)
+
+ERROR CODES:
+    As in convert.jxa: 1 (bad request), 2 / 3 (unsupported input / output format),
+    11 (input not found), 21 (Word did not start), 31 (save failed); the process
+    exits with the code of the (first) failed job in one-shot mode.
+"""
+
+import fnmatch
+import json
+import os
+import random
+import sys
+import time
+
+FORMATS = ("docx", "doc", "pdf", "rtf", "odt", "txt", "html")
+
+DEFAULTS = {
+    "script": 0.05,
+    "cold_start": 0.5,
+    "attach": 0.01,
+    "open": 0.05,
+    "save": 0.1,
+    "close": 0.01,
+    "quit": 0.1,
+    "per_mb": 0.0,
+    "time_scale": 1.0,
+    "word_running": False,
+    "fail_rate": 0.0,
+    "fail_code": 31,
+    "start_fail_rate": 0.0,
+    "hang_rate": 0.0,
+    "crash_rate": 0.0,
+    "fail_match": None,
+    "hang_match": None,
+    "crash_match": None,
+    "output": "copy",
+    "seed": None,
+}
+
+# Placeholder contents written with "output": "stub"
+STUBS = {
+    "pdf": b"%PDF-1.4\n% conver emulator\n%%EOF\n",
+    "rtf": b"{\\rtf1 conver emulator}\n",
+    "html": b"<html><body>conver emulator</body></html>\n",
+    "txt": b"conver emulator\n",
+}
+
+
+class Emulator:
+    """State of one emulated script process: its settings and the emulated Word."""
+
+    def __init__(self, settings, owner=None, emit_events=False):
+        self.settings = settings
+        self.emit_events = emit_events
+        seed = settings["seed"]
+        if seed is not None and owner is not None:
+            # Pool owner tags end with the worker's number: one stream per worker
+            seed = f"{seed}:{owner.rsplit('-', 1)[-1]}"
+        self.random = random.Random(seed)
+        self.word_running = bool(settings["word_running"])
+        self.word_launched = False
+        self.loaded = time.monotonic()
+        self.script_reported = False
+
+    # --- timing ---
+
+    def sample(self, key, extra=0.0):
+        """Draw a duration for `key`, sleep for it (scaled) and return it."""
+        seconds = max(0.0, _draw(self.settings[key], self.random)) + extra
+        if self.settings["time_scale"] > 0:
+            time.sleep(seconds * self.settings["time_scale"])
+        return round(seconds, 3)
+
+    def chance(self, rate_key, match_key, name):
+        pattern = self.settings[match_key]
+        if pattern and fnmatch.fnmatch(name.lower(), pattern.lower()):
+            return True
+        return self.random.random() < self.settings[rate_key]
+
+    # --- jobs ---
+
+    def convert_document(self, params):
+        timings = {}
+        if not self.script_reported:
+            # Sampled at startup; reported like the real script's load time
+            timings["script"] = round(time.monotonic() - self.loaded, 3)
+            self.script_reported = True
+        result = self.convert_phases(params, timings)
+        result["timings"] = timings
+        return result
+
+    def convert_phases(self, params, timings):
+        input_path = params.get("input")
+        output_path = params.get("output")
+
+        if not input_path or not output_path:
+            return error_result(
+                input_path or None,
+                output_path or None,
+                "Both 'input' and 'output' fields are required in JSON.",
+                1,
+            )
+
+        input_ext = input_path.rsplit(".", 1)[-1].lower()
+        if input_ext not in FORMATS:
+            return error_result(
+                input_path,
+                None,
+                f'The input file format "{input_ext}" is unsupported.',
+                2,
+            )
+
+        output_ext = output_path.rsplit(".", 1)[-1].lower()
+        if output_ext not in FORMATS:
+            return error_result(
+                input_path,
+                output_path,
+                f'The output file format "{output_ext}" is unsupported.',
+                3,
+            )
+
+        if not os.path.isfile(input_path):
+            return error_result(input_path, None, f'File "{input_path}" not found.', 11)
+
+        name = os.path.basename(input_path)
+        if self.word_running:
+            timings["word"] = self.sample("attach")
+        else:
+            timings["word"] = self.sample("cold_start")
+            if self.random.random() < self.settings["start_fail_rate"]:
+                return error_result(
+                    input_path,
+                    output_path,
+                    "Microsoft Word did not start within the expected time.",
+                    21,
+                )
+            self.word_running = True
+            self.word_launched = True
+        self.write_event({"event": "word", "pid": None, "owned": self.word_launched})
+
+        if self.chance("crash_rate", "crash_match", name):
+            os._exit(70)
+        if self.chance("hang_rate", "hang_match", name):
+            while True:
+                time.sleep(3600)
+
+        timings["open"] = self.sample("open")
+        size_mb = os.path.getsize(input_path) / (1024 * 1024)
+        timings["save"] = self.sample("save", self.settings["per_mb"] * size_mb)
+        if self.chance("fail_rate", "fail_match", name):
+            code = self.settings["fail_code"]
+            return error_result(input_path, output_path, "Emulated save failure.", code)
+        try:
+            self.write_output(input_path, output_path, output_ext)
+        except OSError as error:
+            return error_result(input_path, output_path, str(error), 31)
+        timings["close"] = self.sample("close")
+
+        return {
+            "status": "success",
+            "input": input_path,
+            "output": output_path,
+            "message": "OK",
+            "error_code": 0,
+            "timings": {},
+        }
+
+    def write_output(self, input_path, output_path, output_ext):
+        mode = self.settings["output"]
+        if mode == "copy":
+            with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+                while True:
+                    chunk = src.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+        elif mode == "stub":
+            with open(output_path, "wb") as dst:
+                dst.write(STUBS.get(output_ext, b"conver emulator\n"))
+
+    def quit_word(self, result):
+        result["timings"]["quit"] = self.sample("quit") if self.word_running else 0.0
+        self.word_running = False
+        self.word_launched = False
+
+    def finish_job(self, params, result):
+        if result["error_code"] == 0 and params.get("keepOpen") is not True:
+            self.quit_word(result)
+
+    def convert_batch(self, jobs):
+        results = []
+        for index, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                message = "Each batch item must be a JSON object."
+                result = error_result(None, None, message, 1)
+            else:
+                result = self.convert_document(job)
+            self.write_event({"event": "result", "index": index, "result": result})
+            results.append(result)
+
+        last = jobs[-1] if jobs else None
+        if not (isinstance(last, dict) and last.get("keepOpen") is True):
+            if results:
+                self.quit_word(results[-1])
+            else:
+                self.word_running = self.word_launched = False
+        return results
+
+    # --- I/O ---
+
+    def write_event(self, event):
+        if self.emit_events:
+            write_line(json.dumps(event))
+
+    def handle_worker_line(self, line):
+        try:
+            params = json.loads(line)
+        except ValueError:
+            write_line(json.dumps(error_result(None, None, "Invalid JSON format.", 1)))
+            return
+
+        if isinstance(params, list):
+            write_line(json.dumps(self.convert_batch(params)))
+            return
+
+        if isinstance(params, dict) and params.get("command") == "quit":
+            result = {
+                "status": "success",
+                "input": None,
+                "output": None,
+                "message": "OK",
+                "error_code": 0,
+                "timings": {},
+            }
+            self.quit_word(result)
+            write_line(json.dumps(result))
+            return
+
+        if not isinstance(params, dict):
+            write_line(json.dumps(error_result(None, None, "Invalid JSON format.", 1)))
+            return
+
+        result = self.convert_document(params)
+        self.finish_job(params, result)
+        write_line(json.dumps(result))
+
+    def run_worker(self):
+        self.emit_events = True
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                self.handle_worker_line(line)
+
+    def run_once(self, argument):
+        try:
+            params = json.loads(argument)
+        except ValueError:
+            write_line(json.dumps(error_result(None, None, "Invalid JSON format.", 1)))
+            return 1
+
+        if isinstance(params, list):
+            results = self.convert_batch(params)
+            write_line(json.dumps(results))
+            failed = [r["error_code"] for r in results if r["error_code"] != 0]
+            return failed[0] if failed else 0
+
+        if not isinstance(params, dict):
+            write_line(json.dumps(error_result(None, None, "Invalid JSON format.", 1)))
+            return 1
+
+        result = self.convert_document(params)
+        self.finish_job(params, result)
+        write_line(json.dumps(result))
+        return result["error_code"]
+
+
+def error_result(input_path, output_path, message, error_code):
+    return {
+        "status": "error",
+        "input": input_path,
+        "output": output_path,
+        "message": message,
+        "error_code": error_code,
+        "timings": {},
+    }
+
+
+def write_line(text):
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+
+def load_settings():
+    """Defaults overridden by the JSON object (or file) in CONVER_EMULATOR."""
+    settings = dict(DEFAULTS)
+    raw = os.environ.get("CONVER_EMULATOR", "").strip()
+    if raw:
+        if not raw.startswith("{"):
+            with open(raw, encoding="utf-8") as fh:
+                raw = fh.read()
+        settings.update(json.loads(raw))
+    return settings
+
+
+def _draw(spec, rng):
+    if isinstance(spec, (int, float)):
+        return float(spec)
+    kind, params = next(iter(spec.items()))
+    if kind == "uniform":
+        return rng.uniform(*params)
+    if kind == "normal":
+        return rng.gauss(*params)
+    if kind == "lognormal":
+        median, sigma = params
+        return median * rng.lognormvariate(0.0, sigma)
+    if kind == "exponential":
+        return rng.expovariate(1.0 / params) if params > 0 else 0.0
+    raise ValueError(f"Unknown distribution: {kind!r}")
+
+
+def main(argv):
+    try:
+        settings = load_settings()
+    except (OSError, ValueError) as error:
+        message = f"Emulator settings: {error}"
+        write_line(json.dumps(error_result(None, None, message, 1)))
+        return 1
+
+    args = list(argv)
+    worker = False
+    owner = None
+    argument = None
+    while args:
+        arg = args.pop(0)
+        if arg in ("--worker", "-worker"):
+            worker = True
+        elif arg in ("--owner", "-owner") and args:
+            owner = args.pop(0)
+        elif arg == "-jsonArgs" and args:
+            argument = args.pop(0)
+        elif argument is None:
+            argument = arg
+        else:
+            argument = None
+            break
+
+    emulator = Emulator(settings, owner)
+    # Script startup; reported as the "script" phase of the first job
+    emulator.sample("script")
+
+    if worker:
+        emulator.run_worker()
+        return 0
+    if argument is None:
+        message = "A single JSON argument is required."
+        write_line(json.dumps(error_result(None, None, message, 1)))
+        return 1
+    return emulator.run_once(argument)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,322 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+HTTP conversion server.
+
+`ConverServer` accepts document uploads over HTTP, runs them on warm Word
+sessions and streams the converted document back with a chunked response.
+
+ENDPOINTS:
+    POST /convert?to=<format>&filename=<name>
+        Request body: the raw source document. The source format is taken from
+        the extension of `filename`. Responds 200 with the converted document, or
+        400 if either format is not one of `conver.streams.FORMATS`.
+    GET /health
+        Responds 200 with {"status": "ok", "pending": <jobs queued or running>}.
+    GET /metrics
+        Responds 200 with the conversion metrics (see `conver.metrics`) once they
+        have been enabled, 404 otherwise.
+
+BACKPRESSURE:
+    At most `workers + queue_size` jobs are accepted at once; further uploads are
+    rejected with 429 and a Retry-After header instead of piling up in memory.
+
+ERRORS:
+    Conversion errors are reported as JSON {"error": <message>, "error_code": <code>}
+    with an HTTP status derived from the `ConverError` subclass raised by `conver()`:
+    UnsupportedFormat 415, InputFileNotFound 400, SaveError 422, WordStartError 503,
+    IPCError 502, PlatformNotSupported 501, ConversionTimeout 504, any other
+    ConverError 500.
+"""
+
+import json
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from . import metrics
+from .breaker import CircuitBreaker
+from .conver import (
+    ConverError,
+    ConversionTimeout,
+    InputFileNotFound,
+    IPCError,
+    PlatformNotSupported,
+    SaveError,
+    Timeout,
+    UnsupportedFormat,
+    WordStartError,
+)
+from .executor import ConverExecutor
+from .streams import FORMATS
+
+if TYPE_CHECKING:
+    from .cache import ConversionCache
+
+_HTTP_STATUS = {
+    UnsupportedFormat: 415,
+    InputFileNotFound: 400,
+    SaveError: 422,
+    WordStartError: 503,
+    IPCError: 502,
+    PlatformNotSupported: 501,
+    ConversionTimeout: 504,
+}
+
+_CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "doc": "application/msword",
+    "rtf": "application/rtf",
+    "odt": "application/vnd.oasis.opendocument.text",
+    "txt": "text/plain; charset=utf-8",
+    "html": "text/html",
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def http_status(error: ConverError) -> int:
+    """HTTP status code for a conversion error, following its class hierarchy."""
+    for cls in type(error).__mro__:
+        if cls in _HTTP_STATUS:
+            return _HTTP_STATUS[cls]
+    return 500
+
+
+class ConverServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server converting uploaded documents.
+
+    Parameters
+    ----------
+    address : (str, int)
+        Host and port to listen on.
+    workers : int, default=1
+        Number of parallel Word sessions.
+    queue_size : int, default=16
+        Jobs accepted beyond those running before answering 429.
+    max_upload : int, default=100 MiB
+        Largest accepted request body, in bytes.
+    cache : ConversionCache, optional
+        Cache consulted before each conversion.
+    timeout : float or Timeout, optional
+        Limits applied to each conversion; a timed-out job answers 504.
+    breaker : CircuitBreaker, optional
+        Breaker answering 503 immediately while Word cannot start.
+    converter : callable, optional
+        `(input_path, output_path) -> Path` used instead of Word, raising
+        `ConverError` on failure; lets the server run against a stand-in backend.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        workers: int = 1,
+        queue_size: int = 16,
+        max_upload: int = 100 * 1024 * 1024,
+        cache: Optional["ConversionCache"] = None,
+        timeout: Union[float, Timeout, None] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        converter: Optional[Callable[[Path, Path], Path]] = None,
+    ):
+        self.max_upload = max_upload
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        if converter is None:
+            self._executor = ConverExecutor(
+                workers,
+                keep_open=False,
+                cache=cache,
+                timeout=timeout,
+                breaker=breaker,
+            )
+            converter = self._executor.convert
+        else:
+            self._executor = ThreadPoolExecutor(workers, thread_name_prefix="conver")
+        self._converter = converter
+
+        self._queue_token = metrics.REGISTRY.add_queue("server", lambda: self.pending)
+        super().__init__(address, _Handler)
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently reserved, queued or running."""
+        return self._pending
+
+    def reserve(self) -> bool:
+        """Reserve a queue slot for an upload; False when the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._pending_lock:
+            self._pending += 1
+        return True
+
+    def release(self) -> None:
+        """Give back a slot reserved with `reserve()`."""
+        with self._pending_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def submit(self, input_path: Path, output_path: Path) -> "Future[Path]":
+        """Queue a conversion on a reserved slot, released when the job is done."""
+        future = self._executor.submit(self._converter, input_path, output_path)
+        future.add_done_callback(lambda _: self.release())
+        return future
+
+    def server_close(self) -> None:
+        super().server_close()
+        metrics.REGISTRY.remove_queue(self._queue_token)
+        self._executor.shutdown()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: ConverServer
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/metrics" and metrics.REGISTRY.enabled:
+            openmetrics = "application/openmetrics-text" in self.headers.get(
+                "Accept", ""
+            )
+            return metrics.send_metrics(self, metrics.REGISTRY, openmetrics)
+        if path != "/health":
+            return self._send_json(404, {"error": "Not found."})
+        self._send_json(200, {"status": "ok", "pending": self.server.pending})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/convert":
+            return self._reject(404, {"error": "Not found."})
+
+        query = parse_qs(url.query)
+        target = query.get("to", [""])[0].lower().lstrip(".")
+        source = Path(query.get("filename", [""])[0]).suffix.lower()
+        if not target or not source:
+            return self._reject(
+                400, {"error": "Query parameters 'to' and 'filename' are required."}
+            )
+        # Both end up in staging file names: only accept known extensions
+        if target not in FORMATS or source.lstrip(".") not in FORMATS:
+            return self._reject(
+                400, {"error": f"Supported formats: {', '.join(FORMATS)}."}
+            )
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            return self._reject(411, {"error": "Content-Length is required."})
+        if length > self.server.max_upload:
+            return self._reject(413, {"error": "Upload too large."})
+
+        # Reserve before reading the body, so a full queue costs no upload
+        if not self.server.reserve():
+            return self._reject(
+                429, {"error": "Conversion queue is full."}, {"Retry-After": "1"}
+            )
+
+        with tempfile.TemporaryDirectory(prefix="conver-") as staging:
+            input_path = Path(staging) / f"document{source}"
+            output_path = Path(staging) / f"document.{target}"
+            try:
+                with open(input_path, "wb") as fh:
+                    _copy_exact(self.rfile, fh, length)
+                future = self.server.submit(input_path, output_path)
+            except BaseException:
+                self.server.release()
+                raise
+
+            try:
+                result = future.result()
+            except ConverError as err:
+                self._send_json(
+                    http_status(err), {"error": str(err), "error_code": err.error_code}
+                )
+                return
+
+            self._send_file(result, target)
+
+    def _send_file(self, path: Path, target: str) -> None:
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", _CONTENT_TYPES.get(target, "application/octet-stream")
+        )
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+                self.wfile.write(b"%X\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(
+        self, status: int, body: dict, headers: Optional[dict] = None
+    ) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _reject(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        """
+        Answer without reading the upload; the connection is closed so that the
+        unread body is not parsed as the next request.
+        """
+        self.close_connection = True
+        self._send_json(status, body, headers)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _copy_exact(src, dst, length: int) -> None:
+    """Copy exactly `length` bytes from `src` to `dst`."""
+    remaining = length
+    while remaining > 0:
+        chunk = src.read(min(_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise ConnectionError("Upload ended before Content-Length bytes.")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    workers: int = 1,
+    queue_size: int = 16,
+    max_upload: int = 100 * 1024 * 1024,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> None:
+    """Run a `ConverServer` until interrupted."""
+    with ConverServer(
+        (host, port),
+        workers=workers,
+        queue_size=queue_size,
+        max_upload=max_upload,
+        cache=cache,
+        timeout=timeout,
+        breaker=breaker,
+    ) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
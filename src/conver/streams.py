@@ -0,0 +1,237 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Bytes-in/bytes-out conversion.
+
+Word only converts named files, so `conver_bytes()` and `conver_stream()`
+stage the document in a private directory, convert it with `conver()` and
+hand back the result. Staging directories live on a RAM-backed file system
+when one is available (`/dev/shm` on Linux, or the directory named by the
+`CONVER_SPOOL_DIR` environment variable, e.g. a RAM disk), so the round trip
+does not touch the disk twice, and they are reused across calls rather than
+created and removed every time. Concurrent calls each get their own staging
+directory.
+
+On macOS, Word must be allowed to read and write the spool directory; set
+`CONVER_SPOOL_DIR` to a folder it has access to if conversions fail there.
+"""
+
+import atexit
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, List, Optional, Union
+
+from .conver import UnsupportedFormat, conver
+
+FORMATS = ("docx", "doc", "pdf", "rtf", "odt", "txt", "html")
+
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def spool_dir() -> Optional[Path]:
+    """
+    Directory that staging directories are created in.
+
+    `CONVER_SPOOL_DIR` if set, otherwise `/dev/shm` when it is a writable
+    directory, otherwise None (the system temporary directory).
+    """
+    if os.environ.get("CONVER_SPOOL_DIR"):
+        return Path(os.environ["CONVER_SPOOL_DIR"])
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
+class _StagingPool:
+    """Staging directories handed out one per call and emptied for reuse."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle: List[Path] = []
+        self._all: List[Path] = []
+
+    @contextmanager
+    def acquire(self) -> Iterator[Path]:
+        with self._lock:
+            directory = self._idle.pop() if self._idle else None
+        if directory is None or not directory.is_dir():
+            root = spool_dir()
+            if root is not None:
+                root.mkdir(parents=True, exist_ok=True)
+            directory = Path(tempfile.mkdtemp(prefix="conver-", dir=root))
+            with self._lock:
+                self._all.append(directory)
+        try:
+            yield directory
+        finally:
+            try:
+                _empty(directory)
+            except OSError:
+                pass  # e.g. a file still held open by Word; use a fresh directory
+            else:
+                with self._lock:
+                    self._idle.append(directory)
+
+    def close(self) -> None:
+        with self._lock:
+            directories, self._all, self._idle = self._all, [], []
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+_staging = _StagingPool()
+atexit.register(_staging.close)
+
+
+def conver_bytes(
+    data: bytes,
+    src_format: str,
+    dst_format: str,
+    as_mmap: bool = False,
+    **options: Any,
+) -> Union[bytes, mmap.mmap]:
+    """
+    Convert a document held in memory.
+
+    Parameters
+    ----------
+    data : bytes
+        The source document.
+    src_format : str
+        Extension of the source format, e.g. "docx".
+    dst_format : str
+        Extension of the target format, e.g. "pdf".
+    as_mmap : bool, default=False
+        Return a read-only memory map of the converted document instead of
+        copying it into a `bytes` object; close it when done. An empty
+        document is returned as `b""`.
+    **options
+        Passed to `conver()`: `keep_open`, `cache`, `timeout`, `retry`, `breaker`.
+
+    Returns
+    -------
+    bytes or mmap.mmap
+        The converted document.
+
+    Raises
+    ------
+    UnsupportedFormat
+        `src_format` or `dst_format` is not a supported extension.
+    ConverError
+        Any error raised by `conver()`.
+    """
+
+    src, dst = _check_format(src_format, 2), _check_format(dst_format, 3)
+    with _staging.acquire() as directory:
+        input_path = directory / f"input.{src}"
+        input_path.write_bytes(data)
+        output_path = conver(input_path, directory / f"output.{dst}", **options)
+        if as_mmap:
+            return _map_output(output_path)
+        return output_path.read_bytes()
+
+
+def conver_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    src_format: str,
+    dst_format: str,
+    **options: Any,
+) -> int:
+    """
+    Convert a document read from one binary file object into another.
+
+    `src` is read to its end and the converted document is written to `dst`,
+    both in chunks, so sockets, pipes and upload streams can be passed
+    directly.
+
+    Parameters
+    ----------
+    src : binary file object
+        Readable source document.
+    dst : binary file object
+        Writable target for the converted document.
+    src_format, dst_format : str
+        Source and target format extensions, as in `conver_bytes()`.
+    **options
+        Passed to `conver()`.
+
+    Returns
+    -------
+    int
+        Number of bytes written to `dst`.
+    """
+
+    src_ext, dst_ext = _check_format(src_format, 2), _check_format(dst_format, 3)
+    with _staging.acquire() as directory:
+        input_path = directory / f"input.{src_ext}"
+        with open(input_path, "wb") as fh:
+            shutil.copyfileobj(src, fh, _COPY_BUFSIZE)
+        output_path = conver(input_path, directory / f"output.{dst_ext}", **options)
+
+        written = 0
+        with open(output_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_COPY_BUFSIZE), b""):
+                dst.write(chunk)
+                written += len(chunk)
+        return written
+
+
+def _check_format(fmt: str, error_code: int) -> str:
+    ext = fmt.lower().lstrip(".")
+    if ext not in FORMATS:
+        raise UnsupportedFormat(f"Unsupported format: {fmt!r}", error_code)
+    return ext
+
+
+def _map_output(output_path: Path) -> Union[bytes, mmap.mmap]:
+    """Memory-map a converted file after moving it out of its staging directory."""
+    fd, private = tempfile.mkstemp(
+        prefix="conver-", suffix=output_path.suffix, dir=spool_dir()
+    )
+    os.close(fd)
+    os.replace(output_path, private)
+
+    with open(private, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            mapped = None  # zero-length files cannot be mapped
+        else:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mapped is None:
+        os.unlink(private)
+        return b""
+
+    if sys.platform == "win32":
+        # A mapped file cannot be deleted on Windows: remove it once unmapped
+        weakref.finalize(mapped, _unlink_quietly, private)
+    else:
+        os.unlink(private)
+    return mapped
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _empty(directory: Path) -> None:
+    """Remove everything inside `directory`."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
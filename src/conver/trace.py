@@ -0,0 +1,221 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Chrome / Perfetto trace export.
+
+`TraceRecorder` listens to the events of `conver.hooks` and writes them as
+Chrome trace-event JSON, which chrome://tracing and https://ui.perfetto.dev open
+directly. Every worker (Word session) gets its own track, with a span per job
+and nested spans for its phases: "spawn", "script", "word", "open", "save",
+"close" and "quit". The time from a job being queued to its outcome, which
+includes waiting for a free worker, is shown as an async span, and jobs settled
+without reaching Word (missing input, cache hit, open circuit breaker) as
+instant events on the "conver" track.
+
+The scripts report phase durations with each result, so phases are laid out
+one after the other from the start of the request that carried the job.
+
+    with tracing("run.json"):
+        conver_batch(jobs, max_workers=4)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from . import hooks
+from .hooks import HookEvent
+
+# Phases in the order a script goes through them
+PHASES = ("spawn", "script", "word", "open", "save", "close", "quit")
+
+
+class TraceRecorder:
+    """
+    Collect conversion events for a Chrome trace.
+
+    Call `start()` to begin recording, `stop()` to end it and `save()` to write
+    the trace; `tracing()` does all three around a `with` block.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._tracks: Dict[str, int] = {"conver": 0}
+        # Where the last job laid out on each worker ended
+        self._cursors: Dict[str, float] = {}
+        # job id -> [queued time, last outcome time, name]
+        self._jobs: Dict[int, List[Any]] = {}
+
+    def start(self) -> "TraceRecorder":
+        """Start recording; returns the recorder."""
+        hooks.register(self.record)
+        return self
+
+    def stop(self) -> None:
+        """Stop recording; events recorded so far are kept."""
+        hooks.unregister(self.record)
+
+    def record(self, event: HookEvent) -> None:
+        """Add a `conver.hooks` event to the trace."""
+        with self._lock:
+            kind = event["event"]
+            if kind == hooks.QUEUED and event["job_id"] is not None:
+                self._jobs[event["job_id"]] = [event["time"], None, _job_name(event)]
+            elif kind in (hooks.WORD_STARTED, hooks.WORD_REUSED):
+                self._instant(
+                    "Word started" if kind == hooks.WORD_STARTED else "Word reused",
+                    event["time"],
+                    self._track(event["worker"]),
+                    {"job_id": event["job_id"], "pid": event["pid"]},
+                )
+            elif kind == hooks.WORD_QUIT and event["job_id"] is None:
+                # Quits reported with a job's result are laid out as its phase
+                seconds = event["seconds"] or 0.0
+                self._span(
+                    "quit",
+                    "phase",
+                    event["time"] - seconds,
+                    seconds,
+                    self._track(event["worker"]),
+                )
+            elif kind in (hooks.FINISHED, hooks.FAILED):
+                self._outcome(event)
+
+    def trace(self) -> Dict[str, Any]:
+        """Return the trace as a Chrome trace-event JSON object."""
+        with self._lock:
+            events = [_metadata("process_name", self._pid, 0, {"name": "conver"})]
+            for name, tid in self._tracks.items():
+                events.append(_metadata("thread_name", self._pid, tid, {"name": name}))
+                events.append(
+                    _metadata("thread_sort_index", self._pid, tid, {"sort_index": tid})
+                )
+            events += self._events
+
+            for job_id, (queued, ended, name) in self._jobs.items():
+                if ended is None:
+                    continue
+                common = {"cat": "job", "id": job_id, "name": name, "pid": self._pid}
+                events.append({**common, "ph": "b", "ts": self._ts(queued)})
+                events.append({**common, "ph": "e", "ts": self._ts(ended)})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the trace to `path`."""
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.trace(), fh)
+
+    def _outcome(self, event: HookEvent) -> None:
+        job_id, worker, end = event["job_id"], event["worker"], event["time"]
+        name = _job_name(event)
+        args = {
+            "job_id": job_id,
+            "input": event["input"],
+            "output": event["output"],
+            "error_code": event["error_code"],
+            "message": event["message"],
+        }
+        if job_id in self._jobs:
+            self._jobs[job_id][1] = end
+
+        if worker is None:
+            self._instant(name, end, 0, args)
+            return
+
+        tid = self._track(worker)
+        timings = event["timings"]
+        if "total" in timings:
+            start = end - timings["total"]
+        else:
+            # Later jobs of a batch request follow the previous job
+            start = self._cursors.get(worker, end)
+
+        phases = []
+        cursor = start
+        for phase in PHASES:
+            if phase in timings:
+                phases.append((phase, cursor, timings[phase]))
+                cursor += timings[phase]
+        if not phases:
+            cursor = end  # e.g. a timed-out job: only its total time is known
+        self._cursors[worker] = cursor
+
+        self._span(name, "job", start, cursor - start, tid, args)
+        for phase, phase_start, seconds in phases:
+            self._span(phase, "phase", phase_start, seconds, tid)
+
+    def _track(self, worker: Optional[str]) -> int:
+        if worker is None:
+            return 0
+        return self._tracks.setdefault(worker, len(self._tracks))
+
+    def _ts(self, when: float) -> float:
+        """Microseconds since the recorder was created."""
+        return round((when - self._origin) * 1e6, 3)
+
+    def _span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        seconds: float,
+        tid: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._ts(start),
+            "dur": round(max(seconds, 0.0) * 1e6, 3),
+            "pid": self._pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def _instant(self, name: str, when: float, tid: int, args: Dict[str, Any]) -> None:
+        self._events.append(
+            {
+                "name": name,
+                "cat": "event",
+                "ph": "i",
+                "s": "t",
+                "ts": self._ts(when),
+                "pid": self._pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+
+
+@contextmanager
+def tracing(path: Union[str, Path]) -> Iterator[TraceRecorder]:
+    """Record the conversions made inside the `with` block and save them to `path`."""
+    recorder = TraceRecorder().start()
+    try:
+        yield recorder
+    finally:
+        recorder.stop()
+        recorder.save(path)
+
+
+def _job_name(event: HookEvent) -> str:
+    if event["input"]:
+        return os.path.basename(event["input"])
+    return f"job {event['job_id']}"
+
+
+def _metadata(name: str, pid: int, tid: int, args: Dict[str, Any]) -> Dict[str, Any]:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": args}
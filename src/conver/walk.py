@@ -0,0 +1,128 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Parallel directory tree walking for recursive conversions.
+
+`walk_documents()` finds the documents under a directory with `os.scandir`,
+scanning directories on a small thread pool: on network shares each scan is
+dominated by round-trip latency, so several directories are listed at once.
+Files are yielded as soon as their directory has been scanned, in no
+particular order across directories.
+
+Include and exclude patterns are shell globs matched case-insensitively
+against the file name, or against the path relative to the root when the
+pattern contains a "/". Excluded directories are not descended into. Hidden
+entries and Word `~$` lock files are always skipped.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Iterator, List, Set, Tuple, Union
+
+from .watch import WATCHED_EXTENSIONS
+
+DEFAULT_INCLUDE = tuple("*" + ext for ext in WATCHED_EXTENSIONS)
+
+
+def walk_documents(
+    root: Union[str, Path],
+    include: Iterable[str] = DEFAULT_INCLUDE,
+    exclude: Iterable[str] = (),
+    skip: Iterable[Union[str, Path]] = (),
+    max_threads: int = 8,
+) -> Iterator[Path]:
+    """
+    Yield the files under `root` matching `include` and not `exclude`.
+
+    Parameters
+    ----------
+    root : str or pathlib.Path
+        Directory to walk.
+    include : iterable of str, default=DEFAULT_INCLUDE
+        Globs a file must match; by default the supported document types.
+    exclude : iterable of str, optional
+        Globs excluding files and whole directories.
+    skip : iterable of str or pathlib.Path, optional
+        Directories not to descend into, e.g. an output tree inside `root`.
+    max_threads : int, default=8
+        Directories scanned concurrently.
+
+    Yields
+    ------
+    pathlib.Path
+        Matching files, as `root` joined with their relative path.
+    """
+
+    if max_threads <= 0:
+        raise ValueError("max_threads must be greater than 0")
+
+    root = Path(root)
+    rules = (
+        tuple(p.lower() for p in include),
+        tuple(p.lower() for p in exclude),
+        {os.path.normcase(os.path.abspath(p)) for p in skip},
+    )
+
+    with ThreadPoolExecutor(max_threads, thread_name_prefix="conver-walk") as pool:
+        pending: Set[Future] = {pool.submit(_scan, root, "", rules)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for path, rel in subdirs:
+                        pending.add(pool.submit(_scan, path, rel, rules))
+                    yield from files
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _scan(
+    directory: Path,
+    rel_dir: str,
+    rules: Tuple[Tuple[str, ...], Tuple[str, ...], Set[str]],
+) -> Tuple[List[Path], List[Tuple[Path, str]]]:
+    """List one directory: matching files and the subdirectories to descend into."""
+    include, exclude, skip = rules
+    files: List[Path] = []
+    subdirs: List[Tuple[Path, str]] = []
+
+    try:
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+    except OSError:
+        return files, subdirs  # unreadable directory: nothing to convert there
+
+    for entry in entries:
+        if entry.name.startswith((".", "~$")):
+            continue
+        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            is_file = not is_dir and entry.is_file()
+        except OSError:
+            continue
+
+        if is_dir:
+            if not _matches(entry.name, rel, exclude) and (
+                os.path.normcase(os.path.abspath(entry.path)) not in skip
+            ):
+                subdirs.append((directory / entry.name, rel))
+        elif is_file:
+            if _matches(entry.name, rel, include) and not _matches(
+                entry.name, rel, exclude
+            ):
+                files.append(directory / entry.name)
+
+    return files, subdirs
+
+
+def _matches(name: str, rel: str, patterns: Tuple[str, ...]) -> bool:
+    name, rel = name.lower(), rel.lower()
+    return any(
+        fnmatchcase(rel if "/" in pattern else name, pattern) for pattern in patterns
+    )
@@ -0,0 +1,303 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Watch a directory tree and convert documents as they change.
+
+`watch()` monitors a tree with a native file-system watcher when the optional
+`watchdog` package is installed (inotify, FSEvents, ReadDirectoryChangesW) and
+falls back to a portable `os.scandir` poller otherwise. Bursts of events for
+the same file are debounced until the file has been quiet and its size and
+mtime are stable, and Word's `~$` lock files and hidden temp files are
+ignored. Changed documents are converted through `conver()` on a warm Word
+session that stays open for the whole watch.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .breaker import CircuitBreaker
+from .conver import ConverError, Timeout
+from .executor import ConverExecutor
+
+if TYPE_CHECKING:
+    from .cache import ConversionCache
+
+WATCHED_EXTENSIONS = (".docx", ".doc", ".rtf", ".odt", ".txt", ".html")
+
+_Signature = Optional[Tuple[int, int]]
+
+
+def watch(
+    directory: Union[str, Path],
+    target: str = "pdf",
+    output: Optional[Union[str, Path]] = None,
+    keep_open: bool = False,
+    debounce: float = 1.0,
+    interval: float = 0.5,
+    max_workers: int = 1,
+    cache: Optional["ConversionCache"] = None,
+    timeout: Union[float, Timeout, None] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[Tuple[Path, Union[Path, ConverError]]]:
+    """
+    Convert documents under `directory` whenever they are created or modified.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Root of the tree to watch.
+    target : str, default="pdf"
+        Output format extension.
+    output : str or pathlib.Path, optional
+        Directory receiving outputs in a layout mirroring `directory`;
+        by default each output is written next to its source.
+    keep_open : bool, default=False
+        Whether to leave Word running once watching stops.
+    debounce : float, default=1.0
+        Seconds a file must stay unchanged before it is converted.
+    interval : float, default=0.5
+        Polling interval of the fallback watcher, in seconds.
+    max_workers : int, default=1
+        Number of parallel Word sessions (see `ConverExecutor`); documents
+        that change together are converted in parallel and yielded as they
+        finish.
+    cache : ConversionCache, optional
+        Cache consulted before each conversion.
+    timeout : float or Timeout, optional
+        Limits applied to each conversion (see `conver()`).
+    breaker : CircuitBreaker, optional
+        Breaker failing conversions fast while Word cannot start.
+    stop : threading.Event, optional
+        Set it to stop watching; otherwise the generator runs until closed.
+
+    Yields
+    ------
+    (Path, Path or ConverError)
+        The changed source document and its output path or conversion error.
+    """
+
+    root = Path(directory).expanduser().absolute()
+    out_root = None if output is None else Path(output).expanduser().absolute()
+    suffix = "." + target.lower()
+
+    def accept(path: Path) -> bool:
+        if path.name.startswith(("~$", ".")):
+            return False
+        ext = path.suffix.lower()
+        if ext not in WATCHED_EXTENSIONS or ext == suffix:
+            return False
+        return out_root is None or out_root not in path.parents
+
+    def output_for(path: Path) -> Path:
+        if out_root is None:
+            return path.with_suffix(suffix)
+        return (out_root / path.relative_to(root)).with_suffix(suffix)
+
+    stop = stop or threading.Event()
+    observer = _create_observer(root, accept)
+    executor = ConverExecutor(
+        max_workers,
+        keep_open=keep_open,
+        cache=cache,
+        timeout=timeout,
+        breaker=breaker,
+    )
+
+    # Conversions in flight, by source; a source that changes again while it
+    # is converted is resubmitted once that conversion is done
+    running: Dict[Path, "Future[Path]"] = {}
+    changed_again: Set[Path] = set()
+
+    def submit(path: Path) -> None:
+        out_path = output_for(path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        running[path] = executor.submit(executor.convert, path, out_path)
+
+    def finished() -> Iterator[Tuple[Path, Union[Path, ConverError]]]:
+        for path, future in list(running.items()):
+            if not future.done():
+                continue
+            del running[path]
+            try:
+                yield path, future.result()
+            except ConverError as err:
+                yield path, err
+            if path in changed_again:
+                changed_again.discard(path)
+                submit(path)
+
+    try:
+        for path in _debounced(observer, debounce, interval, stop):
+            if path is not None:
+                if path in running:
+                    changed_again.add(path)
+                else:
+                    submit(path)
+            yield from finished()
+
+        # Stopped: report the conversions still in flight
+        while running:
+            wait(list(running.values()), return_when=FIRST_COMPLETED)
+            changed_again.clear()
+            yield from finished()
+    finally:
+        observer.close()
+        executor.shutdown()
+
+
+def _debounced(
+    observer: "_Observer", debounce: float, interval: float, stop: threading.Event
+) -> Iterator[Optional[Path]]:
+    """
+    Yield paths once they have been quiet for `debounce` seconds and are stable,
+    and None after each poll, so that the caller can collect finished work.
+    """
+    pending: Dict[Path, Tuple[float, _Signature]] = {}
+
+    while not stop.is_set():
+        now = time.monotonic()
+        for path in observer.poll(interval if not pending else min(interval, debounce)):
+            pending[path] = (now, _signature(path))
+
+        now = time.monotonic()
+        for path, (seen, signature) in list(pending.items()):
+            if now - seen < debounce:
+                continue
+            current = _signature(path)
+            if current is None:
+                del pending[path]
+            elif current != signature:
+                # Still being written: wait for another quiet period
+                pending[path] = (now, current)
+            else:
+                del pending[path]
+                yield path
+        yield None
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class _Observer:
+    """Source of created/modified file paths."""
+
+    def poll(self, timeout: float) -> List[Path]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class _PollingObserver(_Observer):
+    """Portable observer comparing `os.scandir` snapshots of the tree."""
+
+    def __init__(self, root: Path, accept: Callable[[Path], bool]):
+        self._root = root
+        self._accept = accept
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        stack = [str(self._root)]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        path = Path(entry.path)
+                        if self._accept(path):
+                            st = entry.stat()
+                            snapshot[path] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+        return snapshot
+
+    def poll(self, timeout: float) -> List[Path]:
+        time.sleep(timeout)
+        previous, self._snapshot = self._snapshot, self._scan()
+        return [
+            path
+            for path, signature in self._snapshot.items()
+            if previous.get(path) != signature
+        ]
+
+
+class _NativeObserver(_Observer):
+    """Observer backed by the platform's native watcher via `watchdog`."""
+
+    def __init__(self, root: Path, accept: Callable[[Path], bool]):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        events: "queue.Queue[Path]" = queue.Queue()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in (
+                    "created",
+                    "modified",
+                    "moved",
+                    "closed",
+                ):
+                    return
+                # Word saves through a temp file renamed over the document
+                raw = getattr(event, "dest_path", "") or event.src_path
+                path = Path(os.fsdecode(raw))
+                if accept(path):
+                    events.put(path)
+
+        self._events = events
+        self._observer = Observer()
+        self._observer.schedule(Handler(), str(root), recursive=True)
+        self._observer.start()
+
+    def poll(self, timeout: float) -> List[Path]:
+        paths = []
+        try:
+            paths.append(self._events.get(timeout=timeout))
+            while True:
+                paths.append(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        return paths
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+def _create_observer(root: Path, accept: Callable[[Path], bool]) -> _Observer:
+    """Use a native watcher when `watchdog` is installed, else poll."""
+    try:
+        return _NativeObserver(root, accept)
+    except ImportError:
+        return _PollingObserver(root, accept)
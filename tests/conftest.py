@@ -0,0 +1,59 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Fixtures running conver against the Word emulator (scripts/emulator.py).
+"""
+
+import json
+
+import pytest
+
+from conver import _convert
+
+# Phase latencies are kept but scaled down, so that jobs overlap as they
+# would against Word without slowing the suite down
+FAST = {"time_scale": 0.01, "word_running": True}
+
+
+@pytest.fixture
+def emulator(monkeypatch, tmp_path):
+    """
+    Select the emulator backend; call the fixture with settings to apply.
+
+    Settings are written to a file named by CONVER_EMULATOR, which a worker
+    reads when it starts, so tests may change them between worker restarts.
+    The shared worker is stopped around each test so that settings never
+    leak from one test to the next.
+    """
+    settings_path = tmp_path / "emulator.json"
+    monkeypatch.setenv("CONVER_BACKEND", "emulator")
+    monkeypatch.setenv("CONVER_EMULATOR", str(settings_path))
+    monkeypatch.setenv("CONVER_NO_DAEMON", "1")
+
+    def configure(**settings):
+        settings_path.write_text(json.dumps({**FAST, **settings}), encoding="utf-8")
+        return settings_path
+
+    configure()
+    _convert._emulator_worker.close()
+    yield configure
+    _convert._emulator_worker.close()
+
+
+@pytest.fixture
+def documents(tmp_path):
+    """Create small input documents by name in a fresh directory."""
+    directory = tmp_path / "docs"
+    directory.mkdir()
+
+    def create(*names):
+        paths = []
+        for name in names:
+            path = directory / name
+            path.write_bytes(b"PK\x03\x04 emulated " + name.encode())
+            paths.append(path)
+        return paths
+
+    return create
@@ -0,0 +1,133 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Circuit breaker states, alone and in front of the Word emulator.
+"""
+
+import importlib
+
+import pytest
+
+from conver import (
+    CircuitBreaker,
+    SaveError,
+    WordStartError,
+    _convert,
+    conver,
+    conver_batch,
+)
+from conver.breaker import CLOSED, HALF_OPEN, OPEN
+
+# The module, which the package shadows with the function of the same name
+conver_module = importlib.import_module("conver.conver")
+
+
+def start_error():
+    return WordStartError("[21] Word did not start.", 21)
+
+
+def test_opens_after_threshold_and_closes_after_a_probe():
+    breaker = CircuitBreaker(threshold=2, probe_interval=0.0)
+
+    breaker.record(start_error())
+    assert breaker.state == CLOSED
+    breaker.record(start_error())
+    assert breaker.state == OPEN
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # one probe at a time
+
+    breaker.record(None)
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+def test_open_breaker_waits_for_the_probe_interval():
+    breaker = CircuitBreaker(threshold=1, probe_interval=60.0)
+    breaker.record(start_error())
+
+    assert not breaker.allow()
+    error = breaker.error()
+    assert error.error_code == 21
+    assert "Circuit open after 1 consecutive" in str(error)
+
+
+def test_other_errors_reset_the_count():
+    breaker = CircuitBreaker(threshold=2)
+
+    breaker.record(start_error())
+    breaker.record(SaveError("[31] Save failed.", 31))
+    breaker.record(start_error())
+
+    assert breaker.state == CLOSED
+    assert breaker.failures == 1
+
+
+def test_failed_probe_and_probe_without_outcome_reopen():
+    breaker = CircuitBreaker(threshold=3, probe_interval=0.0)
+    for _ in range(3):
+        breaker.record(start_error())
+
+    assert breaker.allow()
+    breaker.record(start_error())
+    assert breaker.state == OPEN
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_rejects_an_invalid_threshold():
+    with pytest.raises(ValueError):
+        CircuitBreaker(threshold=0)
+
+
+def test_fails_fast_once_word_keeps_failing_to_start(emulator, documents, tmp_path):
+    emulator(start_fail_rate=1.0, word_running=False)
+    inputs = documents(*(f"{n}.docx" for n in range(5)))
+    breaker = CircuitBreaker(threshold=2, probe_interval=60.0)
+
+    outcomes = conver_batch(
+        [(inp, tmp_path / f"{inp.stem}.pdf") for inp in inputs], breaker=breaker
+    )
+
+    assert all(isinstance(outcome, WordStartError) for outcome in outcomes)
+    circuit_open = ["Circuit open" in str(outcome) for outcome in outcomes]
+    assert circuit_open == [False, False, True, True, True]
+    assert breaker.state == OPEN
+
+
+def test_probe_closes_the_breaker_once_word_starts(emulator, documents, tmp_path):
+    emulator(start_fail_rate=1.0, word_running=False)
+    first, second = documents("first.docx", "second.docx")
+    breaker = CircuitBreaker(threshold=1, probe_interval=0.0)
+
+    with pytest.raises(WordStartError):
+        conver(first, tmp_path / "first.pdf", breaker=breaker)
+    assert breaker.state == OPEN
+
+    # Word is fixed: restart the worker on the new settings
+    emulator()
+    _convert._emulator_worker.close()
+    assert conver(second, tmp_path / "second.pdf", breaker=breaker).is_file()
+    assert breaker.state == CLOSED
+
+
+def test_probe_that_raises_reopens_the_breaker(
+    emulator, documents, tmp_path, monkeypatch
+):
+    (inp,) = documents("a.docx")
+    breaker = CircuitBreaker(threshold=1, probe_interval=0.0)
+    breaker.record(start_error())
+
+    def unavailable(*args, **kwargs):
+        raise OSError("powershell not found")
+
+    monkeypatch.setattr(conver_module, "convert", unavailable)
+    with pytest.raises(OSError):
+        conver(inp, tmp_path / "a.pdf", breaker=breaker)
+
+    assert breaker.state == OPEN
@@ -0,0 +1,83 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+The conversion cache: keys, LRU eviction and hits that skip Word.
+"""
+
+import os
+import time
+
+from conver import ConversionCache, _convert, conver
+
+
+def store(cache, tmp_path, name, size):
+    output = tmp_path / f"{name}.pdf"
+    output.write_bytes(name.encode() * size)
+    key = cache.key(output.with_suffix(".docx"), output)
+    cache.store(key, output)
+    return key
+
+
+def test_key_covers_input_bytes_format_and_options(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    inp = tmp_path / "a.docx"
+    inp.write_bytes(b"first")
+    key = cache.key(inp, tmp_path / "a.pdf")
+
+    assert cache.key(inp, tmp_path / "elsewhere" / "a.pdf") == key
+    assert cache.key(inp, tmp_path / "a.rtf") != key
+    assert cache.key(inp, tmp_path / "a.pdf", quality="print") != key
+
+    inp.write_bytes(b"second")
+    assert cache.key(inp, tmp_path / "a.pdf") != key
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    for name in "abc":
+        (tmp_path / f"{name}.docx").write_bytes(name.encode())
+    cache = ConversionCache(tmp_path / "cache", max_bytes=250)
+    a = store(cache, tmp_path, "a", 100)
+    b = store(cache, tmp_path, "b", 100)
+
+    # Age both entries, then use `a` again
+    now = time.time()
+    os.utime(cache._entry_path(a), (now - 20, now - 20))
+    os.utime(cache._entry_path(b), (now - 10, now - 10))
+    assert cache.fetch(a, tmp_path / "hit.pdf")
+
+    c = store(cache, tmp_path, "c", 100)
+
+    assert not cache.fetch(b, tmp_path / "miss.pdf")
+    assert cache.fetch(a, tmp_path / "a2.pdf")
+    assert cache.fetch(c, tmp_path / "c2.pdf")
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["size_bytes"] == 200
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (3, 1, 3)
+
+
+def test_hit_does_not_reach_word(emulator, documents, tmp_path):
+    (inp,) = documents("a.docx")
+    cache = ConversionCache(tmp_path / "cache")
+    first = conver(inp, tmp_path / "first.pdf", cache=cache)
+
+    emulator(fail_match="*")
+    _convert._emulator_worker.close()
+    second = conver(inp, tmp_path / "second.pdf", cache=cache)
+
+    assert second.read_bytes() == first.read_bytes()
+    assert cache.stats()["hits"] == 1
+
+
+def test_clear_removes_every_entry(tmp_path):
+    (tmp_path / "a.docx").write_bytes(b"a")
+    cache = ConversionCache(tmp_path / "cache")
+    key = store(cache, tmp_path, "a", 10)
+
+    cache.clear()
+
+    assert cache.stats()["entries"] == 0
+    assert not cache.fetch(key, tmp_path / "miss.pdf")
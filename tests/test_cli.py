@@ -0,0 +1,110 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Batch inputs on the command line: directory walks and --from-file lists.
+"""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from conver.cli import cli
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A document tree with Word lock files, hidden and unsupported files."""
+    root = tmp_path / "tree"
+    for name in (
+        "a.docx",
+        "sub/b.rtf",
+        "sub/~$b.docx",
+        ".git/c.docx",
+        "drafts/d.docx",
+        "e.pdf",
+        "f.png",
+    ):
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"PK\x03\x04 emulated " + name.encode())
+    return root
+
+
+def converted(result):
+    assert result.exit_code == 0, result.output
+    return sorted(Path(line) for line in result.stdout.split())
+
+
+def test_recursive_mirrors_the_tree(emulator, tree, tmp_path):
+    out = tmp_path / "out"
+
+    result = CliRunner().invoke(cli, ["-R", str(tree), "-o", str(out)])
+
+    assert converted(result) == [
+        out / "a.pdf",
+        out / "drafts" / "d.pdf",
+        out / "sub" / "b.pdf",
+    ]
+
+
+def test_recursive_include_and_exclude(emulator, tree, tmp_path):
+    runner = CliRunner()
+    out = tmp_path / "out"
+
+    excluded = runner.invoke(
+        cli, ["-R", str(tree), "-o", str(out), "--exclude", "drafts"]
+    )
+    included = runner.invoke(cli, ["-R", str(tree), "--include", "*.rtf"])
+
+    assert converted(excluded) == [out / "a.pdf", out / "sub" / "b.pdf"]
+    assert converted(included) == [tree / "sub" / "b.pdf"]
+
+
+def test_directory_requires_recursive(emulator, tree):
+    result = CliRunner().invoke(cli, [str(tree)])
+
+    assert result.exit_code == 2
+    assert "use --recursive" in result.output
+
+
+def test_reads_a_nul_separated_list_from_stdin(emulator, documents, tmp_path):
+    a, b, c = documents("a.docx", "b.docx", "c.docx")
+    out, other = tmp_path / "out", tmp_path / "other"
+    records = [str(a), f"{b}\trtf", f"{c}\t{other / 'c.html'}"]
+
+    result = CliRunner().invoke(
+        cli,
+        ["--from-file", "-", "-0", "-o", str(out)],
+        input="\0".join(records) + "\0",
+    )
+
+    assert converted(result) == [other / "c.html", out / "a.pdf", out / "b.rtf"]
+
+
+def test_skips_inputs_writing_the_same_output(emulator, tmp_path):
+    first, second = tmp_path / "first" / "a.docx", tmp_path / "second" / "a.docx"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(b"PK\x03\x04 emulated")
+    listing = tmp_path / "list.txt"
+    listing.write_text(f"{first}\n{second}\n", encoding="utf-8")
+
+    result = CliRunner().invoke(
+        cli, ["--from-file", str(listing), "-o", str(tmp_path / "out")]
+    )
+
+    assert result.exit_code == 1
+    assert result.stdout.split() == [str(tmp_path / "out" / "a.pdf")]
+    assert f"{second} skipped" in result.output
+
+
+def test_null_requires_from_file(emulator, documents):
+    a, b = documents("a.docx", "b.docx")
+
+    result = CliRunner().invoke(cli, [str(a), str(b), "-0"])
+
+    assert result.exit_code == 2
+    assert "--null requires --from-file" in result.output
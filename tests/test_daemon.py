@@ -0,0 +1,135 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+The conversion daemon: delegation, in-process fallback and socket access.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from conver import SaveError, daemon
+from conver.cli import cli
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    """A private XDG_RUNTIME_DIR, short enough for a socket path."""
+    directory = tempfile.mkdtemp(prefix="conver-")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", directory)
+    yield Path(directory)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running(emulator, runtime):
+    """Start a daemon in a background thread; yields the thread."""
+    thread = threading.Thread(
+        target=daemon.run_daemon, kwargs={"max_workers": 2}, daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not daemon.is_running():
+        assert thread.is_alive() and time.monotonic() < deadline
+        time.sleep(0.01)
+    yield thread
+    daemon.stop_daemon()
+    thread.join(10)
+
+
+@pytest.fixture
+def delegated(monkeypatch):
+    """Record the jobs the CLI sends to `daemon.delegate()`."""
+    calls = []
+    delegate = daemon.delegate
+
+    def spy(jobs):
+        jobs = list(jobs)
+        calls.append(jobs)
+        return delegate(jobs)
+
+    monkeypatch.setattr(daemon, "delegate", spy)
+    monkeypatch.delenv("CONVER_NO_DAEMON")
+    return calls
+
+
+def test_converts_delegated_jobs(emulator, running, documents, tmp_path):
+    emulator(fail_match="bad.docx")
+    good, bad = documents("good.docx", "bad.docx")
+
+    outcomes = daemon.delegate(
+        [(good, tmp_path / "good.pdf"), (bad, tmp_path / "bad.pdf")]
+    )
+
+    assert outcomes[0] == tmp_path / "good.pdf"
+    assert outcomes[0].is_file()
+    assert isinstance(outcomes[1], SaveError)
+    assert outcomes[1].error_code == 31
+
+
+def test_cli_delegates_unless_given_per_run_options(
+    running, delegated, documents, tmp_path
+):
+    a, b = documents("a.docx", "b.docx")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, [str(a), str(b), "-o", str(tmp_path / "out")])
+    assert result.exit_code == 0, result.output
+    assert len(delegated) == 1
+    assert (tmp_path / "out" / "b.pdf").is_file()
+
+    result = runner.invoke(cli, [str(a), "-o", str(tmp_path / "own"), "--jobs", "2"])
+    assert result.exit_code == 0, result.output
+    assert len(delegated) == 1
+    assert (tmp_path / "own" / "a.pdf").is_file()
+
+
+def test_falls_back_in_process_without_a_daemon(
+    emulator, runtime, delegated, documents, tmp_path
+):
+    (inp,) = documents("a.docx")
+
+    assert not daemon.is_running()
+    assert daemon.delegate([(inp, tmp_path / "a.pdf")]) is None
+
+    result = CliRunner().invoke(cli, [str(inp), "-o", str(tmp_path / "out")])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out" / "a.pdf").is_file()
+
+
+def test_refuses_a_wrong_key(running):
+    with pytest.raises(AuthenticationError):
+        Client(daemon.daemon_address(), authkey=b"\0" * 32)
+
+    assert daemon.is_running()
+
+
+def test_ignores_a_runtime_directory_open_to_others(running, documents, tmp_path):
+    (inp,) = documents("a.docx")
+    directory = daemon.runtime_dir()
+    os.chmod(directory, 0o755)
+    try:
+        assert not daemon.is_running()
+        assert daemon.delegate([(inp, tmp_path / "a.pdf")]) is None
+    finally:
+        os.chmod(directory, 0o700)
+
+
+def test_runs_one_daemon_per_user_until_stopped(running):
+    with pytest.raises(RuntimeError, match="already running"):
+        daemon.run_daemon()
+
+    assert daemon.stop_daemon()
+    running.join(10)
+    assert not running.is_alive()
+    assert not (daemon.runtime_dir() / "daemon.key").exists()
+    assert not daemon.stop_daemon()
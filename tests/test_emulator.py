@@ -0,0 +1,87 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Batch, timeout, retry and incremental paths, run against the Word emulator.
+"""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from conver import (
+    ConversionTimeout,
+    IPCError,
+    RetryPolicy,
+    Timeout,
+    conver,
+    conver_batch,
+)
+from conver.cli import cli
+
+
+def test_batch_crash_fails_only_the_running_job(emulator, documents, tmp_path):
+    emulator(crash_match="b.docx")
+    inputs = documents("a.docx", "b.docx", "c.docx")
+    out = tmp_path / "out"
+    out.mkdir()
+
+    outcomes = conver_batch([(inp, out / f"{inp.stem}.pdf") for inp in inputs])
+
+    assert outcomes[0] == out / "a.pdf"
+    assert isinstance(outcomes[1], IPCError)
+    assert outcomes[1].error_code == 98
+    assert outcomes[2] == out / "c.pdf"
+    assert sorted(p.name for p in out.iterdir()) == ["a.pdf", "c.pdf"]
+
+
+def test_timeout_kills_a_hung_job(emulator, documents, tmp_path):
+    emulator(hang_match="hang.docx")
+    hung, fine = documents("hang.docx", "fine.docx")
+
+    with pytest.raises(ConversionTimeout) as excinfo:
+        conver(hung, tmp_path / "hang.pdf", timeout=Timeout(total=1.0))
+    assert excinfo.value.error_code == 41
+
+    # The next job gets a fresh worker
+    assert conver(fine, tmp_path / "fine.pdf", timeout=5.0).is_file()
+
+
+def test_retry_recovers_after_a_failed_save(emulator, documents, tmp_path):
+    emulator(fail_match="*.docx")
+    (inp,) = documents("flaky.docx")
+    attempts = []
+
+    class Recovering(RetryPolicy):
+        def on_retry(self, input_path, error, attempt, delay):
+            attempts.append((error.error_code, attempt))
+            # Read by the worker restarted for the next attempt
+            emulator()
+
+    policy = Recovering(max_attempts=3, initial_delay=0.0, jitter=0.0)
+    output = conver(inp, tmp_path / "flaky.pdf", retry=policy)
+
+    assert output.is_file()
+    assert attempts == [(31, 1)]
+
+
+def test_incremental_skips_up_to_date_outputs(emulator, documents, tmp_path):
+    a, b = documents("a.docx", "b.docx")
+    out = tmp_path / "out"
+    runner = CliRunner()
+    args = [str(a), str(b), "-o", str(out), "--incremental"]
+
+    first = runner.invoke(cli, args)
+    assert first.exit_code == 0, first.output
+    assert {Path(line).name for line in first.output.split()} == {"a.pdf", "b.pdf"}
+
+    second = runner.invoke(cli, args)
+    assert second.exit_code == 0, second.output
+    assert second.output == ""
+
+    a.write_bytes(a.read_bytes() + b" edited")
+    third = runner.invoke(cli, args)
+    assert third.exit_code == 0, third.output
+    assert {Path(line).name for line in third.output.split()} == {"a.pdf"}
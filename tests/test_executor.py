@@ -0,0 +1,125 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Parallel conversion through `ConverExecutor` and `WorkerPool`, on the emulator.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from conver import ConverExecutor, SaveError, _convert, conver_batch, hooks
+from conver._convert import WorkerPool
+
+
+@pytest.fixture
+def finished_on():
+    """Collect the worker of each finished job through `conver.hooks`."""
+    workers = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            workers.append(event["worker"])
+
+    hooks.register(record, [hooks.FINISHED])
+    yield workers
+    hooks.unregister(record)
+
+
+def test_jobs_run_in_parallel_on_separate_sessions(
+    emulator, documents, tmp_path, finished_on
+):
+    # Scaled to 0.3s per save: six jobs take at least 1.8s one at a time
+    emulator(save=30)
+    inputs = documents(*(f"{name}.docx" for name in "abcdef"))
+
+    started = time.monotonic()
+    with ConverExecutor(max_workers=3) as executor:
+        outputs = list(
+            executor.map(
+                executor.convert,
+                inputs,
+                [tmp_path / f"{inp.stem}.pdf" for inp in inputs],
+            )
+        )
+    elapsed = time.monotonic() - started
+
+    assert [out.name for out in outputs] == [f"{name}.pdf" for name in "abcdef"]
+    assert len(set(finished_on)) == 3
+    assert elapsed < 6 * 0.3
+
+
+def test_failed_job_raises_from_its_future(emulator, documents, tmp_path):
+    emulator(fail_match="bad.docx")
+    good, bad = documents("good.docx", "bad.docx")
+
+    with ConverExecutor(max_workers=2) as executor:
+        ok = executor.submit(executor.convert, good, tmp_path / "good.pdf")
+        failed = executor.submit(executor.convert, bad, tmp_path / "bad.pdf")
+
+        assert ok.result() == tmp_path / "good.pdf"
+        with pytest.raises(SaveError) as excinfo:
+            failed.result()
+    assert excinfo.value.error_code == 31
+
+
+def test_runs_other_callables_and_serves_asyncio(emulator, documents, tmp_path):
+    (inp,) = documents("a.docx")
+
+    async def convert_in(executor):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, executor.convert, inp, tmp_path / "a.pdf"
+        )
+
+    with ConverExecutor() as executor:
+        assert executor.submit(sum, [1, 2, 3]).result() == 6
+        assert asyncio.run(convert_in(executor)) == tmp_path / "a.pdf"
+
+
+def test_batch_keeps_job_order_across_workers(emulator, documents, tmp_path):
+    emulator(save={"uniform": [5, 30]}, seed=1)
+    inputs = documents(*(f"{n}.docx" for n in range(8)))
+
+    outcomes = conver_batch(
+        [(inp, tmp_path / f"{inp.stem}.pdf") for inp in inputs], max_workers=4
+    )
+
+    assert outcomes == [tmp_path / f"{n}.pdf" for n in range(8)]
+
+
+def test_pool_blocks_while_every_worker_is_busy(emulator):
+    pool = WorkerPool(2)
+    first = pool.acquire()
+    second = pool.acquire()
+    held = {first.__enter__(), second.__enter__()}
+
+    acquired = threading.Event()
+
+    def borrow():
+        with pool.acquire():
+            acquired.set()
+
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    try:
+        assert len(held) == 2
+        assert not acquired.wait(0.2)
+
+        first.__exit__(None, None, None)
+        assert acquired.wait(5)
+    finally:
+        thread.join()
+        second.__exit__(None, None, None)
+        pool.close()
+
+
+def test_pool_is_capped_at_one_worker_on_macos(monkeypatch):
+    monkeypatch.setattr(_convert, "_backend", lambda: "darwin")
+
+    assert WorkerPool(4).size == 1
@@ -0,0 +1,149 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Lifecycle hooks and the metrics and traces built on them, on the emulator.
+"""
+
+import json
+import logging
+
+import pytest
+
+from conver import conver, conver_batch, hooks, metrics
+from conver.trace import tracing
+
+
+@pytest.fixture
+def events():
+    """Collect every hook event."""
+    collected = []
+    hook = hooks.register(collected.append)
+    yield collected
+    hooks.unregister(hook)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A fresh, enabled metrics registry."""
+    monkeypatch.setattr(metrics, "REGISTRY", metrics.Metrics())
+    return metrics.enable()
+
+
+def test_reports_the_lifecycle_of_a_job(emulator, documents, tmp_path, events):
+    (inp,) = documents("a.docx")
+
+    conver(inp, tmp_path / "a.pdf")
+
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == hooks.QUEUED
+    assert kinds[-1] == hooks.FINISHED
+    assert hooks.SPAWNED in kinds
+    phases = {event["phase"] for event in events if event["event"] == hooks.PHASE_DONE}
+    assert {"open", "save", "close"} <= phases
+    assert {event["job_id"] for event in events if event["job_id"]} == {
+        events[0]["job_id"]
+    }
+
+
+def test_reports_failures_with_their_error(emulator, documents, tmp_path, events):
+    emulator(fail_match="*")
+    (inp,) = documents("a.docx")
+
+    conver_batch([(inp, tmp_path / "a.pdf")])
+
+    assert events[-1]["event"] == hooks.FAILED
+    assert events[-1]["error_code"] == 31
+
+
+def test_filters_events_by_name(emulator, documents, tmp_path):
+    finished = hooks.register([].append, [hooks.FINISHED])
+    try:
+        (inp,) = documents("a.docx")
+        conver(inp, tmp_path / "a.pdf")
+    finally:
+        hooks.unregister(finished)
+    assert [event["event"] for event in finished.__self__] == [hooks.FINISHED]
+
+    with pytest.raises(ValueError, match="Unknown hook events: done"):
+        hooks.register(print, ["done"])
+
+
+def test_failing_hook_is_logged(emulator, documents, tmp_path, caplog):
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    hooks.register(broken)
+    try:
+        (inp,) = documents("a.docx")
+        with caplog.at_level(logging.ERROR, logger="conver.hooks"):
+            output = conver(inp, tmp_path / "a.pdf")
+    finally:
+        hooks.unregister(broken)
+
+    assert output.is_file()
+    assert "broken hook" in caplog.text
+    assert not hooks.enabled
+
+
+def test_metrics_count_jobs_and_word_launches(emulator, documents, tmp_path, registry):
+    emulator(word_running=False, fail_match="bad.docx")
+    good, bad = documents("good.docx", "bad.docx")
+
+    conver(good, tmp_path / "good.pdf")
+    conver_batch([(bad, tmp_path / "bad.pdf")])
+
+    text = registry.render()
+    assert (
+        'conver_jobs_total{source="docx",target="pdf",outcome="success",'
+        'error_code="0"} 1'
+    ) in text
+    assert (
+        'conver_jobs_total{source="docx",target="pdf",outcome="error",'
+        'error_code="31"} 1'
+    ) in text
+    assert 'conver_phase_seconds_count{phase="save"} 2' in text
+    assert "conver_word_restarts_total 2" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_broken_queue_gauge_is_logged(registry, caplog):
+    def broken():
+        raise RuntimeError("broken gauge")
+
+    registry.add_queue("server", broken)
+    registry.add_queue("executor", lambda: 3)
+
+    with caplog.at_level(logging.ERROR, logger="conver.metrics"):
+        text = registry.render(openmetrics=False)
+
+    assert 'conver_queue_depth{queue="executor"} 3' in text
+    assert "server" not in text
+    assert "broken gauge" in caplog.text
+
+
+def test_trace_lays_out_jobs_per_worker(emulator, documents, tmp_path):
+    inputs = documents("a.docx", "b.docx", "c.docx")
+    path = tmp_path / "trace.json"
+
+    with tracing(path):
+        conver_batch(
+            [(inp, tmp_path / f"{inp.stem}.pdf") for inp in inputs], max_workers=2
+        )
+
+    trace = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    jobs = [event for event in trace if event.get("cat") == "job"]
+    assert sorted(event["name"] for event in jobs if event["ph"] == "X") == [
+        "a.docx",
+        "b.docx",
+        "c.docx",
+    ]
+    assert sum(event["ph"] == "b" for event in jobs) == 3
+    tracks = {
+        event["args"]["name"]
+        for event in trace
+        if event.get("name") == "thread_name" and event["tid"]
+    }
+    assert len(tracks) == 2
+    assert not hooks.enabled
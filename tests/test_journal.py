@@ -0,0 +1,95 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+The batch journal, and resuming an interrupted batch from the command line.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from conver.cli import cli
+from conver.journal import DONE, FAILED, JOURNAL_NAME, RUNNING, Journal
+
+
+def rows(path):
+    with sqlite3.connect(path) as db:
+        return db.execute(
+            "SELECT output, state, attempts, error_code FROM jobs ORDER BY output"
+        ).fetchall()
+
+
+def test_tracks_states_and_attempts(tmp_path):
+    inp, out = tmp_path / "a.docx", tmp_path / "a.pdf"
+    path = tmp_path / JOURNAL_NAME
+
+    with Journal(path) as journal:
+        journal.record(inp, out, RUNNING)
+        journal.record(inp, out, FAILED, 31, "[31] Save failed.")
+        journal.record(inp, out, RUNNING)
+        journal.record(inp, out, DONE, retries=2)
+        journal.flush()
+
+        assert not journal.is_done(inp, out)  # the output is missing
+        out.write_bytes(b"%PDF")
+        assert journal.is_done(inp, out)
+        assert not journal.is_done(tmp_path / "b.docx", out)
+
+    assert rows(path) == [(str(out), DONE, 4, None)]
+
+
+def test_buffers_records_until_flushed(tmp_path):
+    path = tmp_path / JOURNAL_NAME
+    journal = Journal(path, flush_every=3, flush_interval=60.0)
+
+    journal.record(tmp_path / "a.docx", tmp_path / "a.pdf", RUNNING)
+    journal.record(tmp_path / "b.docx", tmp_path / "b.pdf", RUNNING)
+    assert rows(path) == []
+
+    journal.record(tmp_path / "a.docx", tmp_path / "a.pdf", DONE)
+    assert [state for _, state, _, _ in rows(path)] == [DONE, RUNNING]
+    journal.close()
+
+
+def test_rejects_an_unknown_state(tmp_path):
+    with Journal(tmp_path / JOURNAL_NAME) as journal:
+        with pytest.raises(ValueError):
+            journal.record(tmp_path / "a.docx", tmp_path / "a.pdf", "paused")
+
+
+def test_resume_converts_only_unfinished_jobs(emulator, documents, tmp_path):
+    emulator(fail_match="b.docx")
+    inputs = documents("a.docx", "b.docx", "c.docx")
+    out = tmp_path / "out"
+    runner = CliRunner()
+    args = [*map(str, inputs), "-o", str(out), "--resume"]
+
+    first = runner.invoke(cli, args)
+    assert first.exit_code == 31, first.output
+    assert {Path(line).name for line in first.stdout.split()} == {"a.pdf", "c.pdf"}
+    assert [state for _, state, _, _ in rows(out / JOURNAL_NAME)] == [
+        DONE,
+        FAILED,
+        DONE,
+    ]
+
+    emulator()
+    second = runner.invoke(cli, args)
+    assert second.exit_code == 0, second.output
+    assert {Path(line).name for line in second.stdout.split()} == {"b.pdf"}
+    assert rows(out / JOURNAL_NAME)[1] == (str(out / "b.pdf"), DONE, 2, None)
+
+
+def test_journal_requires_multiple_inputs(emulator, documents, tmp_path):
+    (inp,) = documents("a.docx")
+
+    result = CliRunner().invoke(
+        cli, [str(inp), "--journal", str(tmp_path / "jobs.sqlite")]
+    )
+
+    assert result.exit_code == 2
+    assert "apply to multiple inputs" in result.output
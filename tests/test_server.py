@@ -0,0 +1,124 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+End-to-end tests of the HTTP conversion server.
+"""
+
+import http.client
+import json
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from conver import ConversionTimeout, SaveError, WordStartError
+from conver.server import ConverServer
+
+
+@contextmanager
+def running(**kwargs):
+    """Serve a `ConverServer` on a free port in a background thread."""
+    server = ConverServer(("127.0.0.1", 0), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def connect(server):
+    return http.client.HTTPConnection(*server.server_address, timeout=10)
+
+
+def post(conn, body, query="to=pdf&filename=report.docx"):
+    conn.request("POST", f"/convert?{query}", body=body)
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def copy(input_path, output_path):
+    shutil.copyfile(input_path, output_path)
+    return output_path
+
+
+def test_converts_on_the_emulator_with_a_chunked_response(emulator):
+    body = b"PK\x03\x04 emulated report" * 1000
+
+    with running() as server:
+        response, data = post(connect(server), body)
+
+    assert response.status == 200
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    assert response.getheader("Content-Type") == "application/pdf"
+    assert data == body  # the emulator copies the input
+
+
+@pytest.mark.parametrize(
+    "error, status",
+    [
+        (SaveError("[31] Save failed.", 31), 422),
+        (WordStartError("[21] Word did not start.", 21), 503),
+        (ConversionTimeout("[41] Conversion timed out.", 41), 504),
+    ],
+)
+def test_maps_conversion_errors_to_statuses(error, status):
+    def fail(input_path, output_path):
+        raise error
+
+    with running(converter=fail) as server:
+        response, data = post(connect(server), b"document")
+
+    assert response.status == status
+    assert json.loads(data) == {"error": str(error), "error_code": error.error_code}
+
+
+def test_full_queue_answers_429_with_retry_after():
+    release = threading.Event()
+
+    def blocked(input_path, output_path):
+        release.wait(10)
+        return copy(input_path, output_path)
+
+    with running(converter=blocked, workers=1, queue_size=0) as server:
+        results = []
+        first = threading.Thread(
+            target=lambda: results.append(post(connect(server), b"first"))
+        )
+        first.start()
+        deadline = time.monotonic() + 10
+        while server.pending == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        response, _ = post(connect(server), b"second")
+        release.set()
+        first.join()
+
+    assert response.status == 429
+    assert response.getheader("Retry-After") == "1"
+    assert results[0][0].status == 200
+
+
+def test_rejects_uploads_over_max_upload():
+    with running(converter=copy, max_upload=10) as server:
+        response, _ = post(connect(server), b"x" * 100)
+
+    assert response.status == 413
+
+
+def test_rejected_upload_is_not_parsed_as_the_next_request():
+    with running(converter=copy) as server:
+        conn = connect(server)
+        rejected, _ = post(conn, b"x" * 1000, "to=exe&filename=report.docx")
+        response, data = post(conn, b"document")
+
+    assert rejected.status == 400
+    assert rejected.getheader("Connection") == "close"
+    assert response.status == 200
+    assert data == b"document"
@@ -0,0 +1,70 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+In-memory and piped conversion, through the API and the command line.
+"""
+
+import io
+
+import pytest
+from click.testing import CliRunner
+
+from conver import UnsupportedFormat, conver_bytes, conver_stream
+from conver.cli import cli
+
+DOCUMENT = b"PK\x03\x04 emulated document" * 100
+
+
+def test_converts_bytes(emulator):
+    assert conver_bytes(DOCUMENT, "docx", "pdf") == DOCUMENT
+
+
+def test_returns_a_memory_map(emulator):
+    mapped = conver_bytes(DOCUMENT, ".DOCX", "pdf", as_mmap=True)
+    try:
+        assert mapped[:] == DOCUMENT
+    finally:
+        mapped.close()
+
+
+def test_converts_between_file_objects(emulator):
+    dst = io.BytesIO()
+
+    written = conver_stream(io.BytesIO(DOCUMENT), dst, "docx", "pdf")
+
+    assert written == len(DOCUMENT)
+    assert dst.getvalue() == DOCUMENT
+
+
+@pytest.mark.parametrize("src, dst, code", [("exe", "pdf", 2), ("docx", "png", 3)])
+def test_rejects_unsupported_formats(src, dst, code):
+    with pytest.raises(UnsupportedFormat) as excinfo:
+        conver_bytes(DOCUMENT, src, dst)
+    assert excinfo.value.error_code == code
+
+
+def test_cli_pipes_stdin_to_stdout(emulator):
+    result = CliRunner().invoke(
+        cli, ["-", "--from-format", "docx", "-p"], input=DOCUMENT
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout_bytes == DOCUMENT
+
+
+def test_cli_writes_a_named_input_to_stdout(emulator, documents):
+    (inp,) = documents("a.docx")
+
+    result = CliRunner().invoke(cli, [str(inp), "-o", "-"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout_bytes == inp.read_bytes()
+
+
+def test_cli_stdin_requires_a_format(emulator):
+    result = CliRunner().invoke(cli, ["-"], input=DOCUMENT)
+
+    assert result.exit_code == 2
+    assert "requires --from-format" in result.output
@@ -0,0 +1,117 @@
+# Author: Timur Ulyahin, https://github.com/ucomru
+# License: MIT – provided "as-is" without any warranty or liability
+# Copyright: (c) 2024 Timur Ulyahin
+
+"""
+Watch mode: debouncing, filtering of Word's own files, and conversion.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from conver import watch
+
+
+class Changes(watch._Observer):
+    """Report `path` as changed on the first poll, calling `on_poll` on each."""
+
+    def __init__(self, path, on_poll=lambda count: None):
+        self.path = path
+        self.on_poll = on_poll
+        self.polls = 0
+
+    def poll(self, timeout):
+        time.sleep(timeout)
+        self.polls += 1
+        self.on_poll(self.polls)
+        return [self.path, self.path] if self.polls == 1 else []
+
+
+def first_paths(observer, debounce, polls):
+    """Run `_debounced()` for `polls` polls; return (path, time) of each yield."""
+    stop = threading.Event()
+    yielded = []
+    for path in watch._debounced(observer, debounce, 0.01, stop):
+        if path is not None:
+            yielded.append((path, time.monotonic()))
+        if observer.polls >= polls:
+            stop.set()
+    return yielded
+
+
+def test_changes_are_yielded_once_after_the_quiet_period(tmp_path):
+    path = tmp_path / "a.docx"
+    path.write_bytes(b"document")
+
+    started = time.monotonic()
+    yielded = first_paths(Changes(path), debounce=0.1, polls=30)
+
+    assert [p for p, _ in yielded] == [path]
+    assert yielded[0][1] - started >= 0.1
+
+
+def test_a_file_still_being_written_is_held_back(tmp_path):
+    path = tmp_path / "a.docx"
+    path.write_bytes(b"document")
+    written = []
+
+    def append(count):
+        if count <= 15:
+            with open(path, "ab") as fh:
+                fh.write(b"more")
+            written.append(time.monotonic())
+
+    yielded = first_paths(Changes(path, append), debounce=0.05, polls=40)
+
+    assert [p for p, _ in yielded] == [path]
+    assert yielded[0][1] > written[-1]
+
+
+def test_a_deleted_file_is_dropped(tmp_path):
+    path = tmp_path / "gone.docx"
+
+    assert first_paths(Changes(path), debounce=0.02, polls=10) == []
+
+
+def test_converts_changed_documents_but_not_word_files(emulator, tmp_path, monkeypatch):
+    root, out = tmp_path / "watched", tmp_path / "out"
+    (root / "sub").mkdir(parents=True)
+    observing = threading.Event()
+
+    def create_observer(directory, accept):
+        observer = watch._PollingObserver(directory, accept)
+        observing.set()
+        return observer
+
+    monkeypatch.setattr(watch, "_create_observer", create_observer)
+    stop = threading.Event()
+    results = []
+
+    def run():
+        changes = watch.watch(root, output=out, debounce=0.2, interval=0.02, stop=stop)
+        results.extend(changes)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    try:
+        assert observing.wait(10)
+        for name in ("a.docx", "~$a.docx", ".hidden.docx", "sub/b.rtf", "c.pdf"):
+            (root / name).write_bytes(b"PK\x03\x04 emulated")
+        # Saved again within the debounce period: converted once
+        (root / "a.docx").write_bytes(b"PK\x03\x04 emulated, edited")
+
+        deadline = time.monotonic() + 10
+        while len(results) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        time.sleep(0.3)
+    finally:
+        stop.set()
+        thread.join(10)
+
+    assert sorted((src.relative_to(root), dst) for src, dst in results) == [
+        (Path("a.docx"), out / "a.pdf"),
+        (Path("sub", "b.rtf"), out / "sub" / "b.pdf"),
+    ]
+    assert (out / "a.pdf").read_bytes() == b"PK\x03\x04 emulated, edited"
+    assert not (out / "~$a.pdf").exists()